@@ -0,0 +1,210 @@
+"""
+Synthetic ESPN-shaped pages for offline benchmarks and replayed crawls
+Generators build large rosters, pages with many tables and pages with many
+anchors, plus a small linked team site served by ReplaySession
+"""
+
+import random
+
+BASE = "https://www.espn.com"
+
+POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
+COLLEGES = ['Duke', 'Kentucky', 'Texas', 'Kansas', '--', 'Wichita State', 'Arizona']
+
+
+def roster_table(players, sport='nba', seed=0, jerseys=True, labelled_header=True):
+    """ESPN roster table: jersey in span.pl2.n10, player links, height/weight columns"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(players):
+        name = f"Player{i} Surname{rng.randint(100, 999)}"
+        jersey = f'<span class="pl2 n10">{rng.randint(0, 99)}</span>' if jerseys else ''
+        rows.append(
+            f'<tr class="Table__TR"><td class="Table__TD"><img alt="{name}"/></td>'
+            f'<td class="Table__TD"><a href="/{sport}/player/_/id/{4000000 + i}/player-{i}">{name}</a>'
+            f'{jersey}</td>'
+            f'<td class="Table__TD">{rng.choice(POSITIONS)}</td>'
+            f'<td class="Table__TD">{rng.randint(19, 38)}</td>'
+            f'<td class="Table__TD">{rng.randint(5, 7)}\' {rng.randint(0, 11)}"</td>'
+            f'<td class="Table__TD">{rng.randint(170, 290)} lbs</td>'
+            f'<td class="Table__TD">{rng.choice(COLLEGES)}</td></tr>'
+        )
+    header = ('<thead><tr><th></th><th>Name</th><th>POS</th><th>Age</th>'
+              '<th>HT</th><th>WT</th><th>College</th></tr></thead>')
+    if not labelled_header:
+        # Icon-only column headers: no keywords for the header feature to find
+        header = '<thead><tr><th></th><th>Athlete</th><th></th><th></th><th></th><th></th><th></th></tr></thead>'
+    return f'<table class="Table">{header}<tbody>{"".join(rows)}</tbody></table>'
+
+
+def noise_table(rows, seed=0):
+    """Standings/schedule-style table that should lose the roster scoring"""
+    rng = random.Random(seed)
+    body = ''.join(
+        f'<tr><td>{rng.randint(1, 30)}</td><td>Team {rng.randint(1, 30)}</td>'
+        f'<td>{rng.randint(0, 82)}</td><td>{rng.randint(0, 82)}</td></tr>'
+        for _ in range(rows)
+    )
+    return f'<table class="Table"><thead><tr><th>RK</th><th>TEAM</th><th>W</th><th>L</th></tr></thead><tbody>{body}</tbody></table>'
+
+
+def anchors(count, sport='nba', team_abbrev='hou', team_name='houston-rockets', seed=0):
+    """A mix of team, player, excluded and off-site links"""
+    rng = random.Random(seed)
+    shapes = [
+        lambda i: f"/{sport}/team/schedule/_/name/{team_abbrev}/{team_name}/seasontype/{i % 3}",
+        lambda i: f"/{sport}/team/stats/_/name/{team_abbrev}/{team_name}?split={i}",
+        lambda i: f"/{sport}/player/_/id/{3000000 + i}/some-player",
+        lambda i: f"/{sport}/story/_/id/{i}/headline#comments",
+        lambda i: f"/video/clip/_/id/{i}",
+        lambda i: f"/fantasy/basketball/player/{i}",
+        lambda i: f"https://www.example.com/ad/{i}.png",
+        lambda i: f"/login?ref={i}",
+    ]
+    return ''.join(f'<a href="{rng.choice(shapes)(i)}">link {i}</a>' for i in range(count))
+
+
+def page(body, title='ESPN'):
+    """Wrap body HTML in page chrome (nav, scripts) like a real ESPN page"""
+    chrome = ''.join(f'<li><a href="/{s}/">{s.upper()}</a></li>' for s in ('nba', 'nfl', 'mlb', 'nhl'))
+    return (f'<!DOCTYPE html><html><head><title>{title}</title>'
+            f'<script>window.__espnfitt__ = {{"data": "{"x" * 2000}"}};</script></head>'
+            f'<body><nav><ul>{chrome}</ul></nav><main>{body}</main></body></html>')
+
+
+def stats_table(players, sport='nba', seed=0):
+    """Per-player stats table: player links and numbers, but no jerseys or bio columns"""
+    rng = random.Random(seed)
+    body = ''.join(
+        f'<tr><td><a href="/{sport}/player/_/id/{4000000 + i}/player-{i}">Player{i}</a></td>'
+        f'<td>{rng.randint(1, 82)}</td><td>{rng.uniform(5, 38):.1f}</td><td>{rng.uniform(0, 30):.1f}</td></tr>'
+        for i in range(players)
+    )
+    return f'<table class="Table"><thead><tr><th>Name</th><th>GP</th><th>MIN</th><th>PTS</th></tr></thead><tbody>{body}</tbody></table>'
+
+
+def labelled_table_pages(count=200, seed=0):
+    """
+    [(html, roster table index or None)] for table-scoring calibration: rosters
+    of varying size, some missing jerseys or header labels, mixed in with stats
+    and standings tables; about a quarter of the pages have no roster at all
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for n in range(count):
+        tables = [noise_table(rng.randint(3, 30), seed=seed + n + i) for i in range(rng.randint(0, 4))]
+        tables += [stats_table(rng.randint(5, 20), seed=seed + n + i) for i in range(rng.randint(0, 2))]
+        rng.shuffle(tables)
+        label = None
+        if rng.random() < 0.75:
+            label = rng.randint(0, len(tables))
+            tables.insert(label, roster_table(rng.randint(3, 30), seed=seed + n, jerseys=rng.random() < 0.8,
+                                              labelled_header=rng.random() < 0.8))
+        corpus.append((page(''.join(tables), title='Labelled'), label))
+    return corpus
+
+
+FIRST_NAMES = ['James', 'Luka', 'Nikola', 'Jalen', 'Anthony', 'Tyrese', 'Fred', 'Amen', 'Bam', 'Devin',
+               'Jayson', 'Kevin', 'Stephen', 'Giannis', 'Shai', 'Victor', 'Donovan', 'Trae', 'Zion', 'Ja']
+LAST_NAMES = ['Green', 'Doncic', 'Jokic', 'Brunson', 'Edwards', 'Haliburton', 'VanVleet', 'Thompson',
+              'Adebayo', 'Booker', 'Tatum', 'Durant', 'Curry', 'Antetokounmpo', 'Gilgeous-Alexander',
+              'Wembanyama', 'Mitchell', 'Young', 'Williamson', 'Morant', 'Sengun', 'Whitmore', 'Eason']
+
+
+def league_rosters(teams=30, players=15, sport='nba', seed=0):
+    """{(sport, team): [player record]} with unique jerseys per team, like scraped rosters"""
+    rng = random.Random(seed)
+    rosters = {}
+    for t in range(teams):
+        numbers = rng.sample(['00'] + [str(n) for n in range(100)], players)
+        rosters[(sport, f"team-{t}")] = [
+            {'name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}{'' if i % 3 else ' Jr.'}",
+             'number': number, 'position': rng.choice(POSITIONS), 'player_id': f"{t}{i:03d}"}
+            for i, number in enumerate(numbers)
+        ]
+    return rosters
+
+
+def misspell(name, seed=0):
+    """A name with one typo: a dropped, doubled or swapped letter"""
+    rng = random.Random(seed)
+    i = rng.randrange(1, len(name) - 1)
+    typo = rng.choice(['drop', 'double', 'swap'])
+    if typo == 'drop':
+        return name[:i] + name[i + 1:]
+    if typo == 'double':
+        return name[:i] + name[i] + name[i:]
+    return name[:i - 1] + name[i] + name[i - 1] + name[i + 1:]
+
+
+def large_roster_page(players=60, noise_tables=3, seed=0):
+    tables = ''.join(noise_table(15, seed=seed + i) for i in range(noise_tables))
+    return page(tables + roster_table(players, seed=seed), title='Roster')
+
+
+def many_tables_page(tables=40, seed=0):
+    """Dozens of tables with the roster buried in the middle"""
+    parts = [noise_table(12, seed=seed + i) for i in range(tables)]
+    parts.insert(tables // 2, roster_table(18, seed=seed))
+    return page(''.join(parts), title='Many tables')
+
+
+def many_anchors_page(count=2000, seed=0):
+    return page(anchors(count, seed=seed), title='Hub')
+
+
+def team_site(sport='nba', team_abbrev='hou', team_name='houston-rockets', extra_pages=10, base=BASE):
+    """URL -> HTML for a small linked team site (replayed crawls)"""
+    team = f"{base}/{sport}/team/_/name/{team_abbrev}/{team_name}"
+    roster = f"{base}/{sport}/team/roster/_/name/{team_abbrev}/{team_name}"
+    schedule = f"{base}/{sport}/team/schedule/_/name/{team_abbrev}/{team_name}"
+    news = f"{base}/{sport}/team/news/_/name/{team_abbrev}/{team_name}"
+    stats = f"{base}/{sport}/team/stats/_/name/{team_abbrev}/{team_name}"
+
+    nav = ''.join(f'<a href="{url}">x</a>' for url in (team, roster, schedule, news, stats))
+    extra = [f"{schedule}/seasontype/{i}" for i in range(extra_pages)]
+    extra_links = ''.join(f'<a href="{url}">more</a>' for url in extra)
+
+    articles = ''.join(
+        f'<article><h2>Rockets headline number {i}</h2><a href="/{sport}/story/_/id/{i}/x">read</a></article>'
+        for i in range(8)
+    )
+    games = ''.join(f'<tr><td>Game {i} vs Opponent {i}</td><td>W 110-100</td></tr>' for i in range(20))
+
+    site = {
+        team: page(nav + extra_links + anchors(300, sport, team_abbrev, team_name)),
+        f"{team}/roster": page(nav + noise_table(10)),
+        f"{team}/schedule": page(nav + noise_table(10)),
+        f"{team}/stats": page(nav + noise_table(10)),
+        roster: page(nav + noise_table(15) + roster_table(18, sport)),
+        schedule: page(nav + extra_links + f'<table class="Table"><tr><th>DATE</th></tr>{games}</table>'),
+        news: page(nav + articles),
+        stats: page(nav + noise_table(15)),
+    }
+    for url in extra:
+        site[url] = page(nav + f'<table class="Table"><tr><th>DATE</th></tr>{games}</table>')
+    return site
+
+
+class ReplayResponse:
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+
+class ReplaySession:
+    """Serves a recorded/synthetic site from memory instead of the network"""
+
+    def __init__(self, pages):
+        self.pages = {url: html.encode() for url, html in pages.items()}
+        self.requests = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests += 1
+        if url in self.pages:
+            return ReplayResponse(self.pages[url])
+        return ReplayResponse(b'', 404)
@@ -0,0 +1,192 @@
+"""
+Load-test driver: run crawler configurations against the simulated ESPN
+Run from the repository root:
+
+    python -m benchmarks.load_test --profile hostile --teams 6 --output load.json
+
+Reports throughput, p50/p95/p99 request latency, retries, errors and memory
+over time for each configuration
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+
+from benchmarks.simulated_espn import PROFILES, SimulatedESPN
+from crawl_logging import configure_logging
+from crawl_metrics import CrawlMetrics
+from fetch_coordinator import FetchCoordinator
+from sports_crawler import SportsCrawler
+from sports_data import espn_sports
+
+# Crawler configurations to compare
+CONFIGS = {
+    'sequential': {'team_workers': 1, 'max_retries': 2, 'timeout': 2.0},
+    'teams_x4': {'team_workers': 4, 'max_retries': 2, 'timeout': 2.0},
+    'teams_x8': {'team_workers': 8, 'max_retries': 2, 'timeout': 2.0},
+    'teams_x4_no_retry': {'team_workers': 4, 'max_retries': 0, 'timeout': 2.0},
+}
+
+
+class RecordingSession(requests.Session):
+    """requests.Session that records latency and outcome of every GET"""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.latencies = []
+        self.outcomes = Counter()
+
+    def get(self, url, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = super().get(url, **kwargs)
+            # Touch the body so truncated reads fail inside the timing
+            response.content
+        except requests.RequestException as e:
+            with self._lock:
+                self.latencies.append(time.perf_counter() - start)
+                self.outcomes[type(e).__name__] += 1
+            raise
+        with self._lock:
+            self.latencies.append(time.perf_counter() - start)
+            self.outcomes[str(response.status_code)] += 1
+        return response
+
+
+class MemorySampler:
+    """Samples traced Python memory at a fixed interval"""
+
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        tracemalloc.start()
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        tracemalloc.stop()
+        return False
+
+    def _sample(self):
+        current, _ = tracemalloc.get_traced_memory()
+        self.samples.append((round(time.perf_counter() - self._start, 3), current))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+
+def run_config(name, config, server, max_pages, delay=0.0):
+    """Crawl every simulated team with one configuration and return its report"""
+    session = RecordingSession()
+    coordinator = FetchCoordinator()
+    crawlers = []
+
+    def crawl_team(team):
+        abbrev, team_name = team
+        crawler = SportsCrawler(server.sport, team_name, abbrev, session=session, coordinator=coordinator,
+                                metrics=CrawlMetrics(), base_url=server.base_url)
+        crawler.timeout = config['timeout']
+        crawler.max_retries = config['max_retries']
+        crawler.retry_backoff = config.get('retry_backoff', 0.05)
+        crawler.crawl(max_pages=max_pages, delay=delay)
+        crawlers.append(crawler)
+
+    with MemorySampler() as memory:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=config['team_workers']) as pool:
+            list(pool.map(crawl_team, server.teams))
+        elapsed = time.perf_counter() - start
+
+    pages = sum(len(c.visited_urls) for c in crawlers)
+    latencies = np.array(session.latencies) * 1000
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies.size else (0.0, 0.0, 0.0)
+
+    return {
+        'config': name,
+        'settings': config,
+        'teams': len(server.teams),
+        'elapsed_s': elapsed,
+        'pages': pages,
+        'requests': len(session.latencies),
+        'pages_per_sec': pages / elapsed if elapsed else 0.0,
+        'latency_ms': {'p50': float(p50), 'p95': float(p95), 'p99': float(p99)},
+        'retries': sum(c.retry_count for c in crawlers),
+        'outcomes': dict(session.outcomes),
+        'players_found': sum(len(c.scraped_data['roster']) for c in crawlers),
+        'memory': {
+            'peak_bytes': max(bytes_ for _, bytes_ in memory.samples),
+            'samples': memory.samples
+        }
+    }
+
+
+def run_load_test(profile='tail', teams=6, max_pages=8, configs=None, extra_pages=5):
+    """Run each configuration against a fresh simulated server"""
+    # Per-page warnings are expected under a hostile profile; the report has the totals
+    configure_logging(level='ERROR')
+    team_names = espn_sports['nba'][:teams]
+    team_list = [(name[:3], name) for name in team_names]
+
+    reports = []
+    for name in configs or list(CONFIGS):
+        with SimulatedESPN(PROFILES[profile], teams=team_list, extra_pages=extra_pages) as server:
+            report = run_config(name, CONFIGS[name], server, max_pages)
+            report['server'] = dict(server.stats)
+            reports.append(report)
+    return {'profile': profile, 'reports': reports}
+
+
+def print_reports(document):
+    print(f"\nLOAD TEST - profile: {document['profile']}")
+    print("=" * 96)
+    print(f"{'Config':<20} {'Pages':>6} {'Pages/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'Retries':>8} {'Errors':>7} {'Peak MB':>8}")
+    print("-" * 96)
+    for report in document['reports']:
+        errors = sum(count for outcome, count in report['outcomes'].items() if not outcome.startswith('2'))
+        latency = report['latency_ms']
+        print(f"{report['config']:<20} {report['pages']:>6} {report['pages_per_sec']:>8.1f} "
+              f"{latency['p50']:>8.1f} {latency['p95']:>8.1f} {latency['p99']:>8.1f} "
+              f"{report['retries']:>8} {errors:>7} {report['memory']['peak_bytes'] / 1e6:>8.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Crawler load test against a simulated ESPN")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='tail')
+    parser.add_argument('--teams', type=int, default=6)
+    parser.add_argument('--max-pages', type=int, default=8)
+    parser.add_argument('--configs', nargs='*', choices=sorted(CONFIGS))
+    parser.add_argument('--output', help="write the full report JSON here")
+    args = parser.parse_args(argv)
+
+    document = run_load_test(args.profile, args.teams, args.max_pages, args.configs)
+    print_reports(document)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+        print(f"\n💾 Report saved to: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
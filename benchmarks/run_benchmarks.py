@@ -0,0 +1,205 @@
+"""
+Offline benchmarks for the crawler's parse, score, filter and extract hot paths
+Run from the repository root:
+
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --baseline bench_baseline.json --threshold 0.2
+
+With --baseline, exits non-zero when any benchmark's median is more than
+threshold slower than the stored run
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from benchmarks import fixtures
+from crawl_logging import configure_logging, preserved_logging
+from crawl_metrics import CrawlMetrics
+from extractors import build_default_registry
+from link_scanner import scan_links
+from table_scoring import TableScorer
+from jersey_index import JerseyIndex
+from name_index import NameIndex
+from sports_crawler import SportsCrawler
+
+# Full-size corpus and a small one for smoke runs
+SIZES = {
+    'full': {'roster_players': 120, 'tables': 60, 'anchors': 3000, 'urls': 5000, 'site_pages': 12,
+             'labelled_pages': 100, 'lookup_teams': 30,
+             'name_teams': 150},
+    'quick': {'roster_players': 20, 'tables': 8, 'anchors': 200, 'urls': 300, 'site_pages': 3,
+              'labelled_pages': 10, 'lookup_teams': 4,
+              'name_teams': 10},
+}
+
+
+def _crawler(session=None):
+    return SportsCrawler('nba', 'houston-rockets', 'hou', session=session,
+                         extractors=build_default_registry(), metrics=CrawlMetrics())
+
+
+def time_call(func, repeat, setup=None):
+    """Run func repeat times; setup() output is passed in and not timed"""
+    samples = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg)
+        samples.append(time.perf_counter() - start)
+    return {
+        'repeat': repeat,
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'max': max(samples)
+    }
+
+
+def build_benchmarks(size='full'):
+    """Return {name: (func, setup)} for the corpus size"""
+    sizes = SIZES[size]
+    roster_html = fixtures.large_roster_page(sizes['roster_players'])
+    tables_html = fixtures.many_tables_page(sizes['tables'])
+    anchors_html = fixtures.many_anchors_page(sizes['anchors'])
+    anchors_bytes = anchors_html.encode('utf-8')
+    hub_url = f"{fixtures.BASE}/nba/team/_/name/hou/houston-rockets"
+
+    crawler = _crawler()
+    anchors_soup = BeautifulSoup(anchors_html, 'html.parser')
+    tables_soup = BeautifulSoup(tables_html, 'html.parser')
+    candidate_urls = crawler._page_links(anchors_soup, hub_url)
+    candidate_urls = (candidate_urls * (sizes['urls'] // max(len(candidate_urls), 1) + 1))[:sizes['urls']]
+    site = fixtures.team_site(extra_pages=sizes['site_pages'])
+    scorer = TableScorer()
+    teams = fixtures.league_rosters(sizes['lookup_teams'])
+    jerseys = JerseyIndex.build(teams)
+    lookups = [(sport, team, str(player['number'])) for (sport, team), roster in teams.items() for player in roster]
+    lookups = (lookups * (sizes['urls'] // len(lookups) + 1))[:sizes['urls']]
+    names = NameIndex()
+    for (sport, team), roster in fixtures.league_rosters(sizes['name_teams'], players=50).items():
+        names.add_roster(sport, team, roster)
+    typos = [fixtures.misspell(record['name'], seed=i) for i, record in enumerate(names.records[:100])]
+    labelled_tables = [BeautifulSoup(html, 'html.parser').find_all('table')
+                       for html, _ in fixtures.labelled_table_pages(sizes['labelled_pages'])]
+
+    def replay_crawl(_):
+        replay = _crawler(fixtures.ReplaySession(site))
+        replay.crawl(max_pages=len(site), delay=0)
+
+    return {
+        'parse_large_roster': (lambda _: BeautifulSoup(roster_html, 'html.parser'), None),
+        'parse_many_tables': (lambda _: BeautifulSoup(tables_html, 'html.parser'), None),
+        'find_roster_table': (lambda _: crawler._find_roster_table_improved(tables_soup), None),
+        'score_tables_batch': (lambda _: scorer.best_per_page(labelled_tables), None),
+        # Roster extraction mutates the soup (decompose), so each run gets a fresh parse
+        'scrape_roster_page': (lambda soup: crawler._scrape_roster_page(soup),
+                               lambda: BeautifulSoup(roster_html, 'html.parser')),
+        'extract_links': (lambda _: crawler._extract_links(anchors_soup, hub_url), None),
+        # Link-only pages: regex scan over raw bytes vs. full parse + find_all
+        'link_scan_fast': (lambda _: scan_links(anchors_bytes, hub_url), None),
+        'link_scan_soup': (lambda _: crawler._page_links(BeautifulSoup(anchors_bytes, 'html.parser'), hub_url),
+                           None),
+        # Detection-loop lookups: (team, jersey) -> player
+        'jersey_lookup': (lambda _: [jerseys.lookup(*key) for key in lookups], None),
+        'name_search': (lambda _: [names.search(name, k=5) for name in typos], None),
+        'should_crawl_url': (lambda _: [crawler._should_crawl_url(url) for url in candidate_urls], None),
+        'replay_crawl': (replay_crawl, None),
+    }
+
+
+def run_benchmarks(size='full', repeat=7, only=None):
+    """Run the suite and return the results document"""
+    results = {}
+    # Keep crawl logging out of the timings, and leave the caller's logging as it was
+    with preserved_logging():
+        configure_logging(quiet=True)
+        for name, (func, setup) in build_benchmarks(size).items():
+            if only and name not in only:
+                continue
+            func(setup() if setup else None)  # warm-up
+            results[name] = time_call(func, repeat, setup)
+
+    return {
+        'meta': {
+            'size': size,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.time()
+        },
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold=0.2):
+    """Compare medians against a baseline; returns rows with a 'regression' flag"""
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        ratio = result['median'] / base['median'] if base['median'] else float('inf')
+        rows.append({
+            'benchmark': name,
+            'baseline': base['median'],
+            'current': result['median'],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold
+        })
+    return rows
+
+
+def print_results(document):
+    print(f"\n{'Benchmark':<22} {'Median (ms)':>12} {'Min (ms)':>10} {'Max (ms)':>10}")
+    print("-" * 58)
+    for name, result in document['results'].items():
+        print(f"{name:<22} {result['median'] * 1000:>12.2f} {result['min'] * 1000:>10.2f} "
+              f"{result['max'] * 1000:>10.2f}")
+
+
+def print_comparison(rows, threshold):
+    print(f"\n{'Benchmark':<22} {'Baseline':>10} {'Current':>10} {'Ratio':>7}")
+    print("-" * 54)
+    for row in rows:
+        flag = '  ❌ REGRESSION' if row['regression'] else ''
+        print(f"{row['benchmark']:<22} {row['baseline'] * 1000:>10.2f} {row['current'] * 1000:>10.2f} "
+              f"{row['ratio']:>7.2f}{flag}")
+    print(f"(threshold: {threshold:.0%} slower than baseline)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline crawler hot-path benchmarks")
+    parser.add_argument('--size', choices=sorted(SIZES), default='full')
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--only', nargs='*', help="benchmark names to run")
+    parser.add_argument('--output', help="write results JSON here")
+    parser.add_argument('--baseline', help="compare against this results JSON")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="allowed slowdown before flagging a regression (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    document = run_benchmarks(size=args.size, repeat=args.repeat, only=args.only)
+    print_results(document)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+        print(f"\n💾 Results saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(document, baseline, args.threshold)
+        print_comparison(rows, args.threshold)
+        if any(row['regression'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Local simulated ESPN for load testing
+Serves fixture team sites over HTTP with controllable latency distributions,
+hung requests (client timeouts), 429 bursts, truncated bodies and redirect chains
+"""
+
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks import fixtures
+
+
+class SimulationProfile:
+    """Failure and latency knobs for the simulated server"""
+
+    def __init__(self, latency_ms=50.0, latency_sigma=0.5, slow_rate=0.0, slow_ms=1000.0,
+                 hang_rate=0.0, hang_seconds=5.0, burst_every=0, burst_length=0, retry_after=0,
+                 truncate_rate=0.0, redirect_rate=0.0, redirect_hops=3, seed=0):
+        self.latency_ms = latency_ms          # lognormal median
+        self.latency_sigma = latency_sigma    # lognormal shape (tail heaviness)
+        self.slow_rate = slow_rate            # extra slow_ms on this fraction of requests
+        self.slow_ms = slow_ms
+        self.hang_rate = hang_rate            # sleep hang_seconds (longer than the client timeout)
+        self.hang_seconds = hang_seconds
+        self.burst_every = burst_every        # every N requests...
+        self.burst_length = burst_length      # ...the next M get 429
+        self.retry_after = retry_after        # Retry-After seconds sent with 429s
+        self.truncate_rate = truncate_rate    # send half the body then close
+        self.redirect_rate = redirect_rate    # answer with a redirect chain first
+        self.redirect_hops = redirect_hops
+        self.seed = seed
+
+
+# Named profiles for the load-test driver
+PROFILES = {
+    'calm': SimulationProfile(latency_ms=20, latency_sigma=0.3),
+    'tail': SimulationProfile(latency_ms=40, latency_sigma=0.9, slow_rate=0.05, slow_ms=800),
+    'hostile': SimulationProfile(latency_ms=40, latency_sigma=0.8, slow_rate=0.05, slow_ms=800,
+                                 hang_rate=0.02, hang_seconds=3.0, burst_every=40, burst_length=5,
+                                 truncate_rate=0.03, redirect_rate=0.1, redirect_hops=3),
+}
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """Clients hanging up on truncated/hung responses is expected, not an error"""
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+class SimulatedESPN:
+    """Threaded HTTP server serving fixture team sites for one sport"""
+
+    def __init__(self, profile=None, sport='nba', teams=None, extra_pages=5):
+        self.profile = profile or SimulationProfile()
+        self.sport = sport
+        self.teams = teams or [('hou', 'houston-rockets')]
+        self.extra_pages = extra_pages
+        self.stats = {'requests': 0, '429': 0, 'hung': 0, 'truncated': 0, 'redirects': 0}
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.profile.seed)
+
+        self._server = _QuietHTTPServer(('127.0.0.1', 0), self._handler())
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+        # Path -> body bytes for every team site
+        self.pages = {}
+        for abbrev, name in self.teams:
+            site = fixtures.team_site(sport, abbrev, name, extra_pages=extra_pages, base=self.base_url)
+            for url, html in site.items():
+                self.pages[url[len(self.base_url):]] = html.encode()
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def _decide(self):
+        """Draw this request's behaviour under the lock (shared RNG and counters)"""
+        profile = self.profile
+        with self._lock:
+            index = self.stats['requests']
+            self.stats['requests'] += 1
+            rng = self._rng
+
+            latency = rng.lognormvariate(0, profile.latency_sigma) * profile.latency_ms / 1000
+            if rng.random() < profile.slow_rate:
+                latency += profile.slow_ms / 1000
+
+            decision = {'latency': latency, 'status': 200, 'hang': False,
+                        'truncate': False, 'redirect': False}
+            if profile.burst_every and index % profile.burst_every < profile.burst_length:
+                decision['status'] = 429
+                self.stats['429'] += 1
+            elif rng.random() < profile.hang_rate:
+                decision['hang'] = True
+                self.stats['hung'] += 1
+            elif rng.random() < profile.redirect_rate:
+                decision['redirect'] = True
+                self.stats['redirects'] += 1
+            elif rng.random() < profile.truncate_rate:
+                decision['truncate'] = True
+                self.stats['truncated'] += 1
+            return decision
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b'', headers=None, truncate=False):
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                if truncate:
+                    self.send_header('Connection', 'close')
+                    self.close_connection = True
+                self.end_headers()
+                self.wfile.write(body[:len(body) // 2] if truncate else body)
+
+            def do_GET(self):
+                path = self.path
+
+                # Redirect chain hops: /__redirect/<hops left>/<real path>
+                if path.startswith('/__redirect/'):
+                    _, _, hops, rest = path.split('/', 3)
+                    time.sleep(server.profile.latency_ms / 1000)
+                    target = f"/__redirect/{int(hops) - 1}/{rest}" if int(hops) > 1 else f"/{rest}"
+                    self._send(302, headers={'Location': target})
+                    return
+
+                decision = server._decide()
+                time.sleep(decision['latency'])
+
+                if decision['hang']:
+                    time.sleep(server.profile.hang_seconds)
+                if decision['status'] == 429:
+                    self._send(429, b'rate limited', {'Retry-After': str(server.profile.retry_after)})
+                    return
+                if decision['redirect'] and path in server.pages:
+                    self._send(302, headers={'Location': f"/__redirect/{server.profile.redirect_hops}{path}"})
+                    return
+
+                body = server.pages.get(path)
+                if body is None:
+                    self._send(404, b'not found')
+                    return
+                self._send(200, body, truncate=decision['truncate'])
+
+        return Handler
@@ -0,0 +1,128 @@
+"""
+Box score stage
+Follows the game ids found by schedule extraction to each game's box score
+and extracts the per-player game lines as stat matrices. Runs once per
+league sweep, after the team crawls: a game appears in both teams'
+schedules but is fetched once, with its own game budget and worker pool
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+from bs4 import BeautifulSoup
+
+from crawl_logging import get_logger
+from sports_stats import extract_stat_matrices, combine_stat_matrices
+
+log = get_logger('boxscore')
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def collect_game_ids(crawlers):
+    """{game id: [team, ...]} from the crawlers' schedules, in first-seen order"""
+    games = {}
+    for crawler in crawlers:
+        for game in crawler.scraped_data['schedule']:
+            game_id = game.get('game_id')
+            if game_id:
+                teams = games.setdefault(game_id, [])
+                if crawler.team_name not in teams:
+                    teams.append(crawler.team_name)
+    return games
+
+
+class BoxScores:
+    """
+    Player game lines stacked per table title across games
+    tables: title -> StatMatrix (one row per player per game)
+    game_ids: title -> int64 array, the game of each row
+    """
+
+    def __init__(self, games):
+        self.games = games  # game id -> [StatMatrix, ...] as extracted
+        self.tables = combine_stat_matrices(games)
+        # combine_stat_matrices labels rows with their key; keep the game ids as a typed column instead
+        self.game_ids = {}
+        for title, matrix in self.tables.items():
+            self.game_ids[title] = np.array(matrix.teams, dtype=np.int64)
+            matrix.teams = [''] * len(matrix)
+
+    def __len__(self):
+        return len(self.games)
+
+    def lines(self, title, game_id):
+        """Rows of one table for one game, as (player, {stat: value})"""
+        matrix = self.tables[title]
+        rows = np.flatnonzero(self.game_ids[title] == int(game_id))
+        return [(matrix.players[i], dict(zip(matrix.columns, matrix.values[i].tolist()))) for i in rows]
+
+    def to_dict(self):
+        """JSON friendly: per table the stacked matrix plus its game id column"""
+        return {title: dict(matrix.to_dict(), game_ids=self.game_ids[title].tolist())
+                for title, matrix in self.tables.items()}
+
+
+class BoxScoreStage:
+    """
+    Fetches box scores for a league's scheduled games
+    max_games: game budget per sweep, separate from the team page budgets
+    workers: concurrent box score fetches (sharing the rate limiter, if any)
+    """
+
+    def __init__(self, session=None, rate_limiter=None, max_games=50, workers=4, timeout=10,
+                 base_url="https://www.espn.com"):
+        self.session = session or requests.Session()
+        self.rate_limiter = rate_limiter
+        self.max_games = max_games
+        self.workers = workers
+        self.timeout = timeout
+        self.base_url = base_url
+
+    def box_score_url(self, sport, game_id):
+        return f"{self.base_url}/{sport}/boxscore/_/gameId/{game_id}"
+
+    def fetch_game(self, sport, game_id):
+        """Fetch and extract one box score; returns its stat matrices"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+        response = self.session.get(self.box_score_url(sport, game_id), headers=HEADERS, timeout=self.timeout)
+        response.raise_for_status()
+        return extract_stat_matrices(BeautifulSoup(response.content, 'html.parser'))
+
+    def run(self, sport, crawlers):
+        """Box scores for every game in the crawlers' schedules; returns (BoxScores, stats)"""
+        refs = collect_game_ids(crawlers)
+        pending = list(refs)[:self.max_games]
+        stats = {
+            'game_refs': sum(len(teams) for teams in refs.values()),
+            'unique_games': len(refs),
+            'fetched': 0,
+            'failed': 0
+        }
+        if not pending:
+            return BoxScores({}), stats
+        log.info("  → Box scores: %d games (%d schedule refs, %d workers)", len(pending), stats['game_refs'],
+                 self.workers, extra={'sport': sport})
+
+        def fetch(game_id):
+            try:
+                return self.fetch_game(sport, game_id)
+            except Exception as e:
+                log.warning("    → Error fetching box score %s: %s", game_id, e,
+                            extra={'sport': sport, 'game_id': game_id})
+                return None
+
+        games = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            for game_id, matrices in zip(pending, pool.map(fetch, pending)):
+                if matrices is None:
+                    stats['failed'] += 1
+                    continue
+                stats['fetched'] += 1
+                if matrices:
+                    games[game_id] = matrices
+        return BoxScores(games), stats
@@ -0,0 +1,219 @@
+"""
+Multi-season historical backfill
+Expands (sport, team, season) work units across the requested years and runs
+them through a bounded worker queue: only a few units are in flight at a
+time, outputs land in output_dir/{season}/{sport}/{team}.json (one serve-mode
+data directory per season), and a checkpoint file records finished and
+failed units. A unit whose output already exists is skipped, so a ten-season
+backfill of every league can be stopped and restarted at any point
+
+    python crawl_backfill.py --sports all --seasons 2015-2024 --output-dir backfill
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import requests
+
+from crawl_batch import parse_targets, validate_targets
+from crawl_logging import get_logger, configure_logging
+from fetch_coordinator import RateLimiter
+from sports_crawler import SportsCrawler, save_team_data
+from sports_data import espn_sports
+
+log = get_logger('backfill')
+
+CHECKPOINT_FILE = 'backfill_checkpoint.json'
+
+
+def parse_seasons(value):
+    """'2015-2018,2021' -> [2015, 2016, 2017, 2018, 2021]"""
+    seasons = set()
+    for part in str(value).split(','):
+        start, _, end = part.strip().partition('-')
+        first, last = int(start), int(end or start)
+        if first > last:
+            first, last = last, first
+        seasons.update(range(first, last + 1))
+    return sorted(seasons)
+
+
+def expand_units(targets, seasons):
+    """(sport, team, season) work units, newest season first, generated lazily"""
+    for season in sorted(seasons, reverse=True):
+        for sport, teams in targets.items():
+            for team in teams or espn_sports[sport]:
+                yield sport, team, season
+
+
+def unit_key(unit):
+    sport, team, season = unit
+    return f"{season}/{sport}/{team}"
+
+
+def unit_path(output_dir, unit):
+    """Where a unit's team file is written"""
+    sport, team, season = unit
+    return os.path.join(output_dir, str(season), sport, f"{team}.json")
+
+
+class Backfill:
+    """
+    Resumable queue of backfill units
+    workers: units crawled concurrently (all share one session and rate limiter)
+    max_pending: units submitted ahead of the workers; the unit list is never
+    materialized, so memory stays flat however many seasons are asked for
+    max_attempts: failed units are retried on later runs until this many attempts
+    checkpoint_every: finished units between checkpoint writes
+    """
+
+    def __init__(self, targets, seasons, output_dir='backfill', max_pages_per_team=6, delay=0, workers=2,
+                 max_pending=None, max_attempts=3, checkpoint_every=10, session=None, rate_limiter=None,
+                 min_interval=0.5):
+        validate_targets(targets)
+        self.targets = targets
+        self.seasons = list(seasons)
+        self.output_dir = output_dir
+        self.max_pages_per_team = max_pages_per_team
+        self.delay = delay
+        self.workers = workers
+        self.max_pending = max_pending or workers * 2
+        self.max_attempts = max_attempts
+        self.checkpoint_every = checkpoint_every
+        self.session = session or requests.Session()
+        self.rate_limiter = rate_limiter or RateLimiter(min_interval)
+        self.checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILE)
+        self.done = {}    # unit key -> {'pages', 'roster', 'schedule', 'seconds'}
+        self.failed = {}  # unit key -> {'error', 'attempts'}
+        self.stats = {'crawled': 0, 'skipped': 0, 'failed': 0}
+        if os.path.exists(self.checkpoint_path):
+            self.load_checkpoint()
+
+    def load_checkpoint(self):
+        with open(self.checkpoint_path) as f:
+            data = json.load(f)
+        self.done = data.get('done', {})
+        self.failed = data.get('failed', {})
+
+    def save_checkpoint(self):
+        """Write the checkpoint atomically"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'updated': time.time(), 'done': self.done, 'failed': self.failed}, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def pending(self):
+        """Units still to crawl: no output yet and attempts left"""
+        for unit in expand_units(self.targets, self.seasons):
+            key = unit_key(unit)
+            if key in self.done or os.path.exists(unit_path(self.output_dir, unit)):
+                self.stats['skipped'] += 1
+                continue
+            if self.failed.get(key, {}).get('attempts', 0) >= self.max_attempts:
+                self.stats['skipped'] += 1
+                continue
+            yield unit
+
+    def crawl_unit(self, unit):
+        """Crawl one team-season and write its file; returns its summary"""
+        sport, team, season = unit
+        start = time.perf_counter()
+        crawler = SportsCrawler(sport, team, team[:3], session=self.session, rate_limiter=self.rate_limiter,
+                                season=season)
+        pages = crawler.crawl(max_pages=self.max_pages_per_team, delay=self.delay)
+        data = crawler.scraped_data
+        if not data['roster'] and not data['schedule']:
+            # Nothing to partition: leave no output so a later run tries again
+            raise ValueError(f"no roster or schedule records in {pages} pages")
+        save_team_data(crawler, os.path.join(self.output_dir, str(season)))
+        return {'pages': pages, 'roster': len(data['roster']), 'schedule': len(data['schedule']),
+                'seconds': round(time.perf_counter() - start, 3)}
+
+    def _finish(self, unit, future):
+        key = unit_key(unit)
+        try:
+            self.done[key] = future.result()
+        except Exception as e:
+            attempts = self.failed.get(key, {}).get('attempts', 0) + 1
+            self.failed[key] = {'error': str(e), 'attempts': attempts}
+            self.stats['failed'] += 1
+            log.warning("❌ Backfill %s failed (attempt %d): %s", key, attempts, e,
+                        extra={'sport': unit[0], 'team': unit[1], 'season': unit[2]})
+            return
+        self.failed.pop(key, None)
+        self.stats['crawled'] += 1
+        log.info("✅ Backfill %s: %s", key, self.done[key],
+                 extra={'sport': unit[0], 'team': unit[1], 'season': unit[2]})
+
+    def run(self, max_units=None):
+        """
+        Crawl pending units (at most max_units this run); returns the stats
+        The checkpoint is written every checkpoint_every units and on the way
+        out, including on Ctrl-C
+        """
+        units = self.pending()
+        in_flight = {}
+        submitted = 0
+        since_checkpoint = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                while True:
+                    # Top up to max_pending without expanding the rest of the unit list
+                    while len(in_flight) < self.max_pending and (max_units is None or submitted < max_units):
+                        unit = next(units, None)
+                        if unit is None:
+                            break
+                        in_flight[executor.submit(self.crawl_unit, unit)] = unit
+                        submitted += 1
+                    if not in_flight:
+                        break
+
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        self._finish(in_flight.pop(future), future)
+                        since_checkpoint += 1
+                    if since_checkpoint >= self.checkpoint_every:
+                        self.save_checkpoint()
+                        since_checkpoint = 0
+            finally:
+                for future in in_flight:
+                    future.cancel()
+                self.save_checkpoint()
+        return dict(self.stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill rosters and schedules for past seasons")
+    parser.add_argument('--sports', help="Comma-separated sports, or 'all'")
+    parser.add_argument('--teams', help="Comma-separated sport:team pairs, e.g. nba:boston-celtics")
+    parser.add_argument('--seasons', required=True, help="Seasons, e.g. 2015-2024 or 2019,2021")
+    parser.add_argument('--output-dir', default='backfill', help="Outputs go to {output-dir}/{season}/{sport}/")
+    parser.add_argument('--max-pages', type=int, default=6, help="Max pages per team-season")
+    parser.add_argument('--workers', type=int, default=2, help="Team-seasons crawled at once")
+    parser.add_argument('--min-interval', type=float, default=0.5, help="Minimum seconds between any two requests")
+    parser.add_argument('--max-attempts', type=int, default=3, help="Give up on a unit after this many failures")
+    parser.add_argument('--max-units', type=int, help="Stop after this many units (rerun to continue)")
+    parser.add_argument('--log-format', choices=['text', 'json'], default='text')
+    parser.add_argument('--quiet', action='store_true', help="Warnings only")
+    args = parser.parse_args()
+
+    configure_logging(fmt=args.log_format, quiet=args.quiet)
+    if not args.sports and not args.teams:
+        parser.error("nothing to backfill: pass --sports and/or --teams")
+    try:
+        backfill = Backfill(parse_targets(args.sports, args.teams), parse_seasons(args.seasons),
+                            output_dir=args.output_dir, max_pages_per_team=args.max_pages, workers=args.workers,
+                            min_interval=args.min_interval, max_attempts=args.max_attempts)
+    except ValueError as e:
+        parser.error(str(e))
+    stats = backfill.run(max_units=args.max_units)
+    print(f"\n📼 Backfill: {stats['crawled']} crawled, {stats['skipped']} skipped, {stats['failed']} failed "
+          f"-> {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
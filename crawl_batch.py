@@ -0,0 +1,263 @@
+"""
+Non-interactive batch runs
+Crawls any set of sports and teams in one process, from CLI flags or a JSON
+job file. Every sport shares one HTTP session, fetch coordinator and rate
+limiter, so a nightly all-leagues job stays warm from start to finish, and
+each sport gets its own output files
+
+Job file:
+    {
+        "sports": {"nba": ["boston-celtics", "miami-heat"], "nfl": null},
+        "max_pages_per_team": 5,
+        "player_pages_per_team": 0,
+        "delay": 1,
+        "min_interval": 0.5,
+        "output_dir": "batch_output",
+        "goals": {"roster": 10, "schedule": 1, "news": 5},
+        "history_file": "crawl_history.json",
+        "probe_templates": true,
+        "template_cache": "url_templates.json",
+        "sitemaps": ["https://www.espn.com/sitemap.xml"],
+        "table_weights": "table_weights.json",
+        "cache_mb": 64,
+        "cache_ttl": 900,
+        "box_score_games": 50
+    }
+"""
+
+import argparse
+import json
+import os
+import time
+
+import requests
+
+from crawl_history import CrawlHistory
+from crawl_logging import get_logger, configure_logging
+from box_scores import BoxScoreStage
+from extraction_cache import ExtractionCache
+from fetch_coordinator import FetchCoordinator, RateLimiter
+from name_index import NameIndex, NAME_INDEX_FILE
+from sitemap_discovery import SitemapDiscovery
+from sports_crawler import crawl_all_teams, DEFAULT_GOALS
+from sports_data import espn_sports
+from table_scoring import TableScorer
+from url_templates import TemplateProber
+
+log = get_logger('batch')
+
+DEFAULT_JOB = {
+    'sports': {},
+    'max_pages_per_team': 5,
+    'player_pages_per_team': 0,
+    'delay': 1,
+    'min_interval': 0.5,
+    'output_dir': 'batch_output',
+    'metrics_file': None,
+    'goals': None,
+    'history_file': None,
+    'probe_templates': False,
+    'template_cache': None,
+    'sitemaps': None,
+    'table_weights': None,
+    'cache_mb': 64,
+    'cache_ttl': 900,
+    'box_score_games': 0
+}
+
+
+def load_job(path):
+    """Read a JSON job file, filling in defaults"""
+    with open(path) as f:
+        job = json.load(f)
+    return dict(DEFAULT_JOB, **job)
+
+
+def parse_targets(sports, teams=None):
+    """
+    {sport: [teams] or None} from CLI values
+    sports: comma-separated sports or 'all'; teams: comma-separated sport:team
+    pairs, which narrow their sport to just those teams
+    """
+    targets = {}
+    if sports:
+        names = sorted(espn_sports) if sports == 'all' else sports.split(',')
+        for sport in names:
+            targets[sport.strip().lower()] = None
+    for pair in teams.split(',') if teams else []:
+        sport, _, team = pair.strip().lower().partition(':')
+        if not team:
+            raise ValueError(f"Expected sport:team, got '{pair}'")
+        if targets.get(sport) is None:
+            targets[sport] = []
+        targets[sport].append(team)
+    return targets
+
+
+def parse_goals(value):
+    """{data type: minimum records} from 'default' or 'roster=10,news=5'"""
+    if value == 'default':
+        return dict(DEFAULT_GOALS)
+    goals = {}
+    for pair in value.split(','):
+        data_type, _, count = pair.partition('=')
+        goals[data_type.strip()] = int(count)
+    return goals
+
+
+def validate_targets(targets):
+    """Raise ValueError for unknown sports or teams before any request goes out"""
+    for sport, teams in targets.items():
+        if sport not in espn_sports:
+            raise ValueError(f"Sport '{sport}' not found in database")
+        unknown = [team for team in teams or [] if team not in espn_sports[sport]]
+        if unknown:
+            raise ValueError(f"Teams not found in {sport}: {', '.join(unknown)}")
+
+
+def league_export(sport, league_data):
+    """JSON-ready league data (stat matrices via to_dict)"""
+    export = {key: value for key, value in league_data.items() if key not in ('stats', 'box_scores')}
+    export['sport'] = sport
+    export['stats'] = {title: matrix.to_dict() for title, matrix in league_data['stats'].items()}
+    if 'box_scores' in league_data:
+        export['box_scores'] = league_data['box_scores'].to_dict()
+    return export
+
+
+def run_batch(targets, max_pages_per_team=5, player_pages_per_team=0, delay=1, min_interval=0.5,
+              output_dir='batch_output', metrics_file=None, session=None, coordinator=None,
+              rate_limiter=None, goals=None, history_file=None, probe_templates=False, template_cache=None,
+              sitemaps=None, table_weights=None, cache_mb=64, cache_ttl=900, box_score_games=0):
+    """
+    Crawl every sport in targets ({sport: [teams] or None for all}) in one process
+    Returns {sport: league data}; per-sport .txt/.json files and a batch
+    summary are written to output_dir
+    box_score_games: box scores fetched per sport from the schedules' game ids (0 skips them)
+    """
+    validate_targets(targets)
+
+    # Shared across sports: warm connections, page/article cache, one request budget
+    session = session or requests.Session()
+    coordinator = coordinator or FetchCoordinator()
+    rate_limiter = rate_limiter or RateLimiter(min_interval)
+    history = CrawlHistory(history_file) if history_file else None
+    prober = TemplateProber(cache_path=template_cache) if probe_templates else None
+    table_scorer = TableScorer.load(table_weights) if table_weights else None
+    cache = ExtractionCache(max_bytes=int(cache_mb * 1024 * 1024), ttl=cache_ttl) if cache_mb else None
+    box_scores = (BoxScoreStage(session=session, rate_limiter=rate_limiter, max_games=box_score_games)
+                  if box_score_games else None)
+
+    os.makedirs(output_dir, exist_ok=True)
+    # Player name search across every sport in the output dir, kept up to date run over run
+    name_index_path = os.path.join(output_dir, NAME_INDEX_FILE)
+    name_index = NameIndex.load(name_index_path) if os.path.exists(name_index_path) else NameIndex()
+    results = {}
+    summary = {'started': time.time(), 'sports': {}}
+
+    for sport, teams in targets.items():
+        start = time.perf_counter()
+        log.info("\n📦 Batch: %s (%s teams)", sport.upper(), len(teams) if teams else 'all',
+                 extra={'sport': sport})
+        # Sitemaps are streamed once per sport, keeping only that sport's URLs
+        sitemap = SitemapDiscovery(sitemaps, session=session, sport=sport) if sitemaps else None
+        try:
+            league_data = crawl_all_teams(sport, max_pages_per_team=max_pages_per_team,
+                                          player_pages_per_team=player_pages_per_team,
+                                          coordinator=coordinator, metrics_file=metrics_file,
+                                          teams=teams, confirm=False, session=session,
+                                          rate_limiter=rate_limiter, delay=delay, output_dir=output_dir,
+                                          goals=goals, history=history, prober=prober, sitemap=sitemap,
+                                          table_scorer=table_scorer, cache=cache,
+                                          name_index=name_index, box_scores=box_scores)
+        except Exception as e:
+            # One failing sport shouldn't sink the rest of the night's job
+            log.warning("❌ Batch: %s failed: %s", sport, e, extra={'sport': sport})
+            summary['sports'][sport] = {'error': str(e)}
+            continue
+
+        results[sport] = league_data
+        name_index.save(name_index_path)
+        with open(os.path.join(output_dir, f"{sport}_league_data.json"), 'w') as f:
+            json.dump(league_export(sport, league_data), f, indent=2)
+        summary['sports'][sport] = {
+            'teams_crawled': league_data['teams_crawled'],
+            'total_players': league_data['total_players'],
+            'total_games': league_data['total_games'],
+            'total_news': league_data['total_news'],
+            'fetch_stats': league_data['fetch_stats'],
+            'cache_stats': league_data.get('cache_stats'),
+            'box_score_stats': league_data.get('box_score_stats'),
+            'seconds': round(time.perf_counter() - start, 3)
+        }
+
+    summary['finished'] = time.time()
+    summary['rate_limit_wait'] = round(rate_limiter.waited, 3)
+    with open(os.path.join(output_dir, 'batch_summary.json'), 'w') as f:
+        json.dump(summary, f, indent=2)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl several sports and teams in one unattended run")
+    parser.add_argument('--job', help="JSON job file (flags below override it)")
+    parser.add_argument('--sports', help="Comma-separated sports, or 'all'")
+    parser.add_argument('--teams', help="Comma-separated sport:team pairs, e.g. nba:boston-celtics")
+    parser.add_argument('--max-pages', type=int, help="Max pages per team")
+    parser.add_argument('--player-pages', type=int, help="Player-detail pages per team")
+    parser.add_argument('--delay', type=float, help="Seconds between a team's pages")
+    parser.add_argument('--min-interval', type=float, help="Minimum seconds between any two requests")
+    parser.add_argument('--output-dir', help="Directory for per-sport outputs")
+    parser.add_argument('--goals', help="Stop teams early once met: 'default' or e.g. roster=10,news=5")
+    parser.add_argument('--history-file', help="Crawl history JSON used to size per-team budgets")
+    parser.add_argument('--probe-templates', action='store_true', help="Probe ESPN URL templates for seeds")
+    parser.add_argument('--template-cache', help="JSON file keeping per-sport template outcomes")
+    parser.add_argument('--sitemap', action='append', dest='sitemaps',
+                        help="Sitemap / sitemap-index URL or file to seed from (repeatable)")
+    parser.add_argument('--table-weights', help="Roster table scoring weights JSON (see table_scoring.py)")
+    parser.add_argument('--cache-mb', type=float, help="Extraction cache size in MB (0 disables)")
+    parser.add_argument('--cache-ttl', type=float, help="Seconds a cached page is served without refetching")
+    parser.add_argument('--box-scores', type=int, dest='box_score_games',
+                        help="Box scores to fetch per sport from schedule game ids")
+    parser.add_argument('--metrics-file', help="Prometheus text file refreshed after each team")
+    parser.add_argument('--log-format', choices=['text', 'json'], default='text')
+    parser.add_argument('--quiet', action='store_true', help="Warnings only")
+    args = parser.parse_args()
+
+    configure_logging(fmt=args.log_format, quiet=args.quiet)
+
+    job = load_job(args.job) if args.job else dict(DEFAULT_JOB)
+    if args.sports or args.teams:
+        job['sports'] = parse_targets(args.sports, args.teams)
+    overrides = {
+        'max_pages_per_team': args.max_pages,
+        'player_pages_per_team': args.player_pages,
+        'delay': args.delay,
+        'min_interval': args.min_interval,
+        'output_dir': args.output_dir,
+        'metrics_file': args.metrics_file,
+        'history_file': args.history_file,
+        'probe_templates': args.probe_templates or None,
+        'template_cache': args.template_cache,
+        'sitemaps': args.sitemaps,
+        'table_weights': args.table_weights,
+        'cache_mb': args.cache_mb,
+        'cache_ttl': args.cache_ttl,
+        'box_score_games': args.box_score_games,
+        'goals': parse_goals(args.goals) if args.goals else None
+    }
+    job.update({key: value for key, value in overrides.items() if value is not None})
+
+    if not job['sports']:
+        parser.error("nothing to crawl: pass --sports/--teams or a --job file")
+
+    targets = job.pop('sports')
+    try:
+        results = run_batch(targets, **job)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"\n📦 Batch complete: {len(results)}/{len(targets)} sports -> {job['output_dir']}")
+
+
+if __name__ == "__main__":
+    main()
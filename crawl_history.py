@@ -0,0 +1,147 @@
+"""
+Crawl history for adaptive page budgets
+Remembers, per team and per sport, how many pages it took before each data
+type turned up and which URL shapes actually yielded records. Later runs use
+it to size each team's budget (quick teams cost little, hard teams get
+enough pages) and to put the seeds that paid off first
+"""
+
+import json
+import os
+import re
+from urllib.parse import urlparse
+
+# Data types a budget must cover when no goals are given
+DEFAULT_DATA_TYPES = ('roster', 'schedule', 'news')
+
+# Runs kept per team / samples kept per sport and data type
+TEAM_RUNS = 5
+SPORT_SAMPLES = 100
+
+
+def url_shape(url, sport, team_name, team_abbrev):
+    """URL path with the sport, team and numeric ids replaced by placeholders"""
+    segments = []
+    for segment in urlparse(url).path.split('/'):
+        if segment == sport:
+            segment = '{sport}'
+        elif segment == team_abbrev:
+            segment = '{abbrev}'
+        elif segment == team_name:
+            segment = '{team}'
+        elif re.fullmatch(r'\d+', segment):
+            segment = '{id}'
+        segments.append(segment)
+    return '/'.join(segments)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class CrawlHistory:
+    """
+    Per-team runs and per-sport URL-shape payoffs, persisted as JSON
+    margin: extra pages on top of what history says a team needs
+    """
+
+    def __init__(self, path='crawl_history.json', margin=1):
+        self.path = path
+        self.margin = margin
+        self.teams = {}   # "sport/team" -> [run, ...] (newest last)
+        self.sports = {}  # sport -> {'found_at': {data type: [pages]}, 'shapes': {shape: {'tried', 'paid'}}}
+        if path and os.path.exists(path):
+            self.load()
+
+    def load(self):
+        with open(self.path) as f:
+            data = json.load(f)
+        self.teams = data.get('teams', {})
+        self.sports = data.get('sports', {})
+
+    def save(self):
+        """Write the history atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'teams': self.teams, 'sports': self.sports}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def record(self, crawler):
+        """Add a finished crawl: pages until each data type appeared, and shape payoffs"""
+        found_at = {}
+        sport = self.sports.setdefault(crawler.sport, {'found_at': {}, 'shapes': {}})
+
+        for page_number, page in enumerate(crawler.page_log, 1):
+            shape = url_shape(page['url'], crawler.sport, crawler.team_name, crawler.team_abbrev)
+            stats = sport['shapes'].setdefault(shape, {'tried': 0, 'paid': 0})
+            stats['tried'] += 1
+            if any(page['records'].values()):
+                stats['paid'] += 1
+            for data_type, count in page['records'].items():
+                if count and data_type not in found_at:
+                    found_at[data_type] = page_number
+
+        for data_type, page_number in found_at.items():
+            samples = sport['found_at'].setdefault(data_type, [])
+            samples.append(page_number)
+            del samples[:-SPORT_SAMPLES]
+
+        runs = self.teams.setdefault(f"{crawler.sport}/{crawler.team_name}", [])
+        runs.append({
+            'pages': len(crawler.page_log),
+            'found_at': found_at,
+            'stop_reason': crawler.stop_reason
+        })
+        del runs[:-TEAM_RUNS]
+
+    def _team_need(self, runs, data_types, default):
+        """Pages the team needed across recent runs (None if unknown)"""
+        needs = []
+        for run in runs:
+            found = [run['found_at'][data_type] for data_type in data_types if data_type in run['found_at']]
+            missing = len(found) < len(data_types)
+            if missing and run['stop_reason'] == 'budget':
+                # Ran out of pages before finding everything: needs more than it had
+                needs.append(run['pages'] * 2)
+            elif missing:
+                # The frontier ran dry first: no evidence the missing types need fewer pages
+                needs.append(max(found + [default]))
+            elif found:
+                needs.append(max(found))
+        return max(needs) if needs else None
+
+    def _sport_need(self, sport, data_types):
+        """Typical pages needed across the sport's teams (75th percentile)"""
+        found_at = self.sports.get(sport, {}).get('found_at', {})
+        needs = [_percentile(found_at[data_type], 0.75) for data_type in data_types if found_at.get(data_type)]
+        return max(needs) if needs else None
+
+    def budget(self, sport, team, default, data_types=None, max_pages=None):
+        """
+        Page budget for a team: what its own history needed (else the sport's),
+        plus the margin, capped at max_pages (3x default if not given)
+        data_types: the types the budget must cover (goal keys; DEFAULT_DATA_TYPES if None)
+        """
+        data_types = list(data_types or DEFAULT_DATA_TYPES)
+        max_pages = max_pages or default * 3
+        need = self._team_need(self.teams.get(f"{sport}/{team}", []), data_types, default)
+        if need is None:
+            need = self._sport_need(sport, data_types)
+        if need is None:
+            return default
+        return max(1, min(need + self.margin, max_pages))
+
+    def shape_score(self, sport, shape):
+        """Smoothed fraction of fetches of this shape that yielded records"""
+        stats = self.sports.get(sport, {}).get('shapes', {}).get(shape, {'tried': 0, 'paid': 0})
+        return (stats['paid'] + 1) / (stats['tried'] + 2)
+
+    def order_seeds(self, crawler):
+        """Reorder a crawler's seeds so the shapes that paid off for this sport go first"""
+        crawler.seed_urls = sorted(crawler.seed_urls, key=lambda url: -self.shape_score(
+            crawler.sport, url_shape(url, crawler.sport, crawler.team_name, crawler.team_abbrev)))
+        return crawler.seed_urls
@@ -0,0 +1,163 @@
+"""
+Structured logging for the crawler
+Replaces hot-loop print debugging with leveled, filterable log records.
+Messages use %-style arguments so formatting only happens when the level
+is enabled; output can be plain text or one JSON object per line, and can
+be handed to a background queue listener so console I/O leaves the crawl loop
+"""
+
+import atexit
+import json
+import logging
+import queue
+import sys
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+LOGGER_NAME = 'sports_crawler'
+
+# Attributes every LogRecord has; anything else came in through extra=
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Listener for the current queue handler (stopped on reconfigure / exit)
+_listener = None
+
+
+def get_logger(name=None):
+    """Return the crawler logger or one of its children"""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+class ContextAdapter(logging.LoggerAdapter):
+    """Adds fixed context (sport, team, ...) to every record, merged with per-call extra"""
+
+    def process(self, msg, kwargs):
+        kwargs['extra'] = {**self.extra, **kwargs.get('extra', {})}
+        return msg, kwargs
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: timestamp, level, logger, message and extra fields"""
+
+    def format(self, record):
+        payload = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage().strip()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Console format: bare message for INFO and below, level prefix above"""
+
+    def format(self, record):
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{record.levelname}: {message}"
+        return message
+
+
+class _DefaultHandler(logging.StreamHandler):
+    """Console output until configure_logging() is called (follows sys.stdout if it is swapped)"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def _install_default_handler():
+    """
+    Plain INFO output for library use (SportsCrawler(...).crawl() with no setup),
+    matching the print output the crawler had before it moved to logging
+    """
+    logger = get_logger()
+    if not logger.handlers:
+        handler = _DefaultHandler()
+        handler.setFormatter(TextFormatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+def configure_logging(level='INFO', fmt='text', quiet=False, stream=None, use_queue=False):
+    """
+    Configure crawler logging
+    level: DEBUG / INFO / WARNING / ...  (quiet=True forces WARNING, for batch runs)
+    fmt: 'text' or 'json'
+    use_queue: write through a QueueHandler; a background listener does the I/O
+    """
+    global _listener
+
+    logger = get_logger()
+    logger.setLevel(logging.WARNING if quiet else level)
+    logger.propagate = False
+
+    # Drop handlers from a previous configure call
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if fmt == 'json' else TextFormatter('%(message)s'))
+
+    if use_queue:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        logger.addHandler(handler)
+
+    return logger
+
+
+def shutdown_logging():
+    """Flush and stop the queue listener, if any"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+@contextmanager
+def preserved_logging():
+    """Put the crawler logger back as it was afterwards (for code that calls configure_logging)"""
+    global _listener
+    logger = get_logger()
+    saved = (list(logger.handlers), logger.level, logger.propagate, _listener)
+    try:
+        yield logger
+    finally:
+        handlers, level, propagate, listener = saved
+        if _listener is not listener:
+            shutdown_logging()
+        _listener = listener
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        for handler in handlers:
+            logger.addHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = propagate
+
+
+atexit.register(shutdown_logging)
+_install_default_handler()
+
+
+def info_enabled(logger):
+    """True when INFO output (summaries, progress) should be shown"""
+    return logger.isEnabledFor(logging.INFO)
+
@@ -0,0 +1,244 @@
+"""
+Per-stage crawl metrics with a Prometheus-style text exporter
+Latency histograms per stage (ttfb, download, parse, score, extract,
+sleep), byte / page / status-code counters and frontier gauges, labelled by
+sport, team and page type. Exposed over HTTP (/metrics) or dumped to a file
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Seconds; covers fast parses through slow fetches
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames, values, extra=None):
+    pairs = list(zip(labelnames, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = 'untyped'
+
+    def __init__(self, name, help_text, labelnames):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def samples(self):
+        """Yield (suffix, label values, extra label, value) rows"""
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield '', key, None, value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, key, extra, value in self.samples():
+            labels = _format_labels(self.labelnames, key, extra)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labelnames, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['counts'][i] += 1
+                    break
+            state['sum'] += value
+            state['count'] += 1
+
+    def count(self, **labels):
+        state = self._values.get(self._key(labels))
+        return state['count'] if state else 0
+
+    def samples(self):
+        with self._lock:
+            items = [(key, dict(state, counts=list(state['counts']))) for key, state in self._values.items()]
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state['counts']):
+                cumulative += count
+                yield '_bucket', key, ('le', _format_value(float(bound))), cumulative
+            yield '_bucket', key, ('le', '+Inf'), state['count']
+            yield '_sum', key, None, state['sum']
+            yield '_count', key, None, state['count']
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _get_or_create(self, cls, name, help_text, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            return metric
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self):
+        """Text exposition of every metric"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+    def dump(self, path):
+        """Write the exposition to a file atomically (for a textfile collector)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def serve(self, port=9108, host='127.0.0.1'):
+        """Serve /metrics from a background thread; returns the server"""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class CrawlMetrics:
+    """The crawler's metric set on top of a MetricsRegistry"""
+
+    # ttfb: request sent to response headers (connection setup + server time to first byte)
+    STAGES = ('ttfb', 'download', 'parse', 'score', 'extract', 'sleep')
+
+    def __init__(self, registry=None):
+        self.registry = registry or MetricsRegistry()
+        page_labels = ('sport', 'team', 'page_type')
+        self.stage_seconds = self.registry.histogram(
+            'crawl_stage_seconds', 'Time spent per crawl stage', page_labels + ('stage',))
+        self.pages = self.registry.counter(
+            'crawl_pages_total', 'Pages fetched and parsed', page_labels)
+        self.response_bytes = self.registry.counter(
+            'crawl_response_bytes_total', 'Response body bytes downloaded', page_labels)
+        self.responses = self.registry.counter(
+            'crawl_http_responses_total', 'HTTP responses by status code', ('sport', 'team', 'status'))
+        self.retries = self.registry.counter(
+            'crawl_retries_total', 'Requests retried after 429 / 5xx / timeouts', ('sport', 'team'))
+        self.errors = self.registry.counter(
+            'crawl_errors_total', 'Pages that failed to fetch or parse', page_labels)
+        self.refreshes = self.registry.counter(
+            'crawl_refreshes_total', 'Refresh-mode page refetches by result', page_labels + ('result',))
+        self.frontier_depth = self.registry.gauge(
+            'crawl_frontier_depth', 'URLs waiting in the BFS queue', ('sport', 'team'))
+        self.pages_per_second = self.registry.gauge(
+            'crawl_pages_per_second', 'Pages per second over the current crawl', ('sport', 'team'))
+
+    def observe_stage(self, stage, seconds, **labels):
+        self.stage_seconds.observe(seconds, stage=stage, **labels)
+
+    @contextmanager
+    def time_stage(self, stage, **labels):
+        """Context manager that observes the block's wall time for a stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds.observe(time.perf_counter() - start, stage=stage, **labels)
+
+    def render(self):
+        return self.registry.render()
+
+    def dump(self, path):
+        self.registry.dump(path)
+
+    def serve(self, port=9108, host='127.0.0.1'):
+        return self.registry.serve(port=port, host=host)
+
+
+# Process-wide metrics shared by every crawler unless one is passed in
+default_metrics = CrawlMetrics()
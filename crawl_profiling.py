@@ -0,0 +1,235 @@
+"""
+Opt-in profiling hooks for crawls
+Profile each page or each team with cProfile (deterministic) or a stack
+sampler, keep tracemalloc allocation tops for the largest pages, and write
+collapsed stacks for flamegraph tools. Everything is tagged by URL and page
+type. Crawls without a profiler never touch this module
+"""
+
+import cProfile
+import heapq
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+
+def _tag_name(tag):
+    """Filesystem-safe name for a profile tag"""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', tag).strip('_')[:150]
+
+
+def _frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples one thread's stack at a fixed interval into collapsed-stack counts"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self._tag = None
+        self._thread_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, tag):
+        self._tag = tag
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            # Root first, with the page/team tag as the outermost frame
+            self.stacks[';'.join([self._tag] + stack[::-1])] += 1
+
+
+class CrawlProfiler:
+    """
+    Profiling options for SportsCrawler.crawl / crawl_all_teams
+    mode: 'cprofile' (deterministic), 'sample' (stack sampling) or None
+    scope: 'page' or 'team'
+    memory_top: keep tracemalloc allocation tops for the N largest pages (0 = off)
+    collapsed: write collapsed stacks (profile.collapsed) for flamegraph tools
+    """
+
+    def __init__(self, mode='cprofile', scope='page', output_dir='profiles',
+                 memory_top=0, collapsed=True, sample_interval=0.005):
+        if mode not in ('cprofile', 'sample', None):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        if scope not in ('page', 'team'):
+            raise ValueError(f"Unknown profiling scope: {scope}")
+
+        self.mode = mode
+        self.scope = scope
+        self.output_dir = output_dir
+        self.memory_top = memory_top
+        self.collapsed = collapsed
+        self.sample_interval = sample_interval
+
+        self.profiles = {}         # tag -> pstats.Stats
+        self.sampler = StackSampler(sample_interval) if mode == 'sample' else None
+        self.largest_pages = []    # min-heap of (peak bytes, seq, page report)
+        self._seq = 0
+        self._started_tracemalloc = False
+
+    def page(self, url, page_type):
+        """Context manager around one page (no-op unless scope == 'page')"""
+        if self.scope != 'page':
+            return self._memory(url, page_type)
+        return self._profile(f"{page_type}:{url}", url, page_type)
+
+    def team(self, sport, team):
+        """Context manager around one team's crawl (no-op unless scope == 'team')"""
+        if self.scope != 'team':
+            return _noop()
+        return self._profile(f"{sport}:{team}")
+
+    @contextmanager
+    def _profile(self, tag, url=None, page_type=None):
+        with self._memory(url, page_type):
+            if self.mode == 'cprofile':
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    yield
+                finally:
+                    profiler.disable()
+                    self._add_profile(tag, profiler)
+            elif self.mode == 'sample':
+                self.sampler.start(tag)
+                try:
+                    yield
+                finally:
+                    self.sampler.stop()
+            else:
+                yield
+
+    def _add_profile(self, tag, profiler):
+        if tag in self.profiles:
+            self.profiles[tag].add(profiler)
+        else:
+            self.profiles[tag] = pstats.Stats(profiler)
+
+    @contextmanager
+    def _memory(self, url, page_type):
+        """Track peak allocations for a page; snapshot it if it's among the largest"""
+        if not self.memory_top or url is None:
+            yield
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            page_peak = peak - start_bytes
+            heap = self.largest_pages
+            if len(heap) < self.memory_top or page_peak > heap[0][0]:
+                # Only pay for a snapshot when the page makes the top N
+                snapshot = tracemalloc.take_snapshot().filter_traces(
+                    [tracemalloc.Filter(False, tracemalloc.__file__)])
+                report = {
+                    'url': url,
+                    'page_type': page_type,
+                    'peak_bytes': page_peak,
+                    'top_allocations': [
+                        {'location': str(stat.traceback), 'size_bytes': stat.size, 'count': stat.count}
+                        for stat in snapshot.statistics('lineno')[:10]
+                    ]
+                }
+                self._seq += 1
+                entry = (page_peak, self._seq, report)
+                if len(heap) < self.memory_top:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heapreplace(heap, entry)
+
+    def collapsed_stacks(self):
+        """Collapsed stacks ('frame;frame;frame count') for flamegraph tools"""
+        if self.sampler is not None:
+            return dict(self.sampler.stacks)
+
+        # cProfile keeps caller -> callee edges, so stacks are two frames deep
+        # under the tag; weights are microseconds of own time per edge
+        stacks = Counter()
+        for tag, stats in self.profiles.items():
+            for func, (_, _, _, _, callers) in stats.stats.items():
+                callee = f"{func[2]} ({os.path.basename(func[0])}:{func[1]})"
+                for caller, (_, _, tottime, _) in callers.items():
+                    weight = int(tottime * 1_000_000)
+                    if weight:
+                        parent = f"{caller[2]} ({os.path.basename(caller[0])}:{caller[1]})"
+                        stacks[f"{tag};{parent};{callee}"] += weight
+        return dict(stacks)
+
+    def write_reports(self):
+        """Write .prof files, collapsed stacks and the memory report; returns paths written"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        written = []
+
+        for tag, stats in self.profiles.items():
+            path = os.path.join(self.output_dir, f"{_tag_name(tag)}.prof")
+            stats.dump_stats(path)
+            written.append(path)
+
+        if self.collapsed and self.mode is not None:
+            path = os.path.join(self.output_dir, 'profile.collapsed')
+            with open(path, 'w') as f:
+                for stack, count in sorted(self.collapsed_stacks().items()):
+                    f.write(f"{stack} {count}\n")
+            written.append(path)
+
+        if self.largest_pages:
+            path = os.path.join(self.output_dir, 'memory_top_pages.json')
+            pages = [report for _, _, report in sorted(self.largest_pages, reverse=True)]
+            with open(path, 'w') as f:
+                json.dump({'generated': time.time(), 'pages': pages}, f, indent=2)
+            written.append(path)
+
+        return written
+
+    def close(self):
+        """Stop tracemalloc if this profiler started it"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def print_top(self, n=15):
+        """Print the hottest functions across every profiled page/team"""
+        if not self.profiles:
+            return
+        combined = pstats.Stats()
+        combined.add(*self.profiles.values())
+        combined.sort_stats('cumulative').print_stats(n)
+
+
+@contextmanager
+def _noop():
+    yield
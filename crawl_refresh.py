@@ -0,0 +1,359 @@
+"""
+Long-running refresh mode
+Keeps a schedule of (team, page type) entries, each with its own TTL, and
+refetches only what is due. Refreshes of a page type are staggered across
+its TTL so load stays even, entries whose data didn't change back off, and
+team crawlers (sessions, coordinator, route cache) stay warm between cycles
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import time
+
+import requests
+
+from crawl_logging import get_logger, configure_logging
+from fetch_coordinator import FetchCoordinator, RateLimiter, canonical_url
+from sitemap_discovery import SitemapDiscovery
+from sports_crawler import SportsCrawler, save_team_data
+from sports_data import espn_sports
+
+log = get_logger('refresh')
+
+# Seconds between refetches per page type: news moves in minutes, rosters in weeks
+DEFAULT_TTLS = {
+    'news': 15 * 60,
+    'schedule': 6 * 60 * 60,
+    'stats': 6 * 60 * 60,
+    'roster': 7 * 24 * 60 * 60,
+}
+
+# Low-discrepancy phase step: the k-th entry of a page type lands at
+# frac(k * GOLDEN), so entries stay evenly spread as teams are added
+GOLDEN = 0.6180339887498949
+
+
+def records_digest(records):
+    """Stable hash of extracted records, used to tell changed data from unchanged"""
+    payload = json.dumps(records, sort_keys=True,
+                         default=lambda value: value.to_dict() if hasattr(value, 'to_dict') else str(value))
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class RefreshEntry:
+    """One (team, page type) on the refresh schedule"""
+
+    def __init__(self, crawler, page_type, urls, ttl, phase):
+        self.crawler = crawler
+        self.page_type = page_type
+        self.urls = urls          # candidate URLs; the one that last yielded data goes first
+        self.base_ttl = ttl
+        self.ttl = ttl            # stretched while the data stays unchanged
+        self.phase = phase        # fraction of the TTL used to stagger the first refresh
+        self.due = 0.0
+        self.digest = None
+        self.last_refresh = None
+        self.refreshes = 0
+        self.changes = 0
+        self.failures = 0
+
+    @property
+    def key(self):
+        return (self.crawler.sport, self.crawler.team_name, self.page_type)
+
+
+class RefreshDaemon:
+    """
+    Refresh scheduler over team crawlers
+    ttls: {page type: seconds}; page types without a TTL aren't refreshed
+    min_interval: minimum seconds between any two requests (politeness), unless a
+    shared rate_limiter is passed in
+    backoff: TTL multiplier after an unchanged refresh, capped at max_backoff x the base TTL
+    on_update: callback(sport, team, page_type, records) when an entry's data changes
+    output_dir: write {output_dir}/{sport}/{team}.json whenever a team's data changes
+    """
+
+    def __init__(self, ttls=None, min_interval=1.0, backoff=1.5, max_backoff=4.0, failure_retry=300,
+                 session=None, coordinator=None, rate_limiter=None, metrics=None, base_url=None,
+                 on_update=None, output_dir=None, clock=time.time, sleep=time.sleep):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failure_retry = failure_retry
+        self.on_update = on_update
+        self.output_dir = output_dir
+        self.clock = clock
+        self.sleep = sleep
+
+        # Shared by every team crawler and kept across cycles
+        self.session = session or requests.Session()
+        self.coordinator = coordinator or FetchCoordinator()
+        self.rate_limiter = rate_limiter or RateLimiter(min_interval, clock=clock, sleep=sleep)
+        self.metrics = metrics
+        self.base_url = base_url
+
+        self.lastmod = {}         # canonical URL -> (lastmod, when it was read), e.g. from sitemaps
+        self.sitemaps = []        # {'discovery', 'reload_every', 'next_reload'}
+        self.crawlers = {}        # (sport, team) -> SportsCrawler
+        self.entries = []         # heap of (due, seq, RefreshEntry)
+        self._seq = 0
+        self._type_counts = {}    # page type -> entries added (for phases)
+        self.stats = {'refreshes': 0, 'changed': 0, 'unchanged': 0, 'skipped': 0, 'failed': 0}
+
+    def add_sitemap(self, discovery, reload_every=None):
+        """
+        Use a sitemap_discovery.SitemapDiscovery's lastmod dates to skip unchanged pages
+        reload_every: seconds between rereads of the sitemap (default: the shortest TTL)
+        """
+        if reload_every is None:
+            reload_every = min(self.ttls.values(), default=DEFAULT_TTLS['news'])
+        discovery.entries()
+        sitemap = {'discovery': discovery, 'reload_every': reload_every}
+        self.sitemaps.append(sitemap)
+        self._read_sitemap(sitemap, self.clock())
+
+    def _read_sitemap(self, sitemap, now):
+        for url, lastmod in sitemap['discovery'].lastmod.items():
+            self.lastmod[url] = (lastmod, now)
+        sitemap['next_reload'] = now + sitemap['reload_every']
+
+    def _reload_sitemaps(self, now):
+        """Reread every sitemap whose reload is due"""
+        for sitemap in self.sitemaps:
+            if sitemap['next_reload'] <= now:
+                sitemap['discovery'].reload()
+                self._read_sitemap(sitemap, now)
+
+    def _unchanged_since_refresh(self, entry):
+        """
+        True when the entry's page has a lastmod no newer than our last fetch.
+        Only a lastmod read after that fetch counts: an older read can't know
+        about changes made since
+        """
+        if entry.last_refresh is None:
+            return False
+        lastmod, read_at = self.lastmod.get(canonical_url(entry.urls[0]), (None, None))
+        return lastmod is not None and read_at > entry.last_refresh and lastmod <= entry.last_refresh
+
+    def add_sport(self, sport, teams=None):
+        """Schedule every team in a sport (or the given subset)"""
+        for team in teams or espn_sports[sport]:
+            self.add_team(sport, team)
+
+    def add_team(self, sport, team, team_abbrev=None):
+        """Schedule one team's page types; its first fetch is due immediately"""
+        crawler = SportsCrawler(sport, team, team_abbrev or team[:3], session=self.session,
+                                coordinator=self.coordinator, metrics=self.metrics, base_url=self.base_url,
+                                rate_limiter=self.rate_limiter)
+        self.crawlers[(sport, team)] = crawler
+
+        # Group the team's seed URLs by the page type they route to
+        urls_by_type = {}
+        for url in crawler.seed_urls:
+            page_type = crawler._page_type(url)
+            if page_type in self.ttls:
+                urls_by_type.setdefault(page_type, []).append(url)
+
+        now = self.clock()
+        for page_type, urls in urls_by_type.items():
+            count = self._type_counts.get(page_type, 0)
+            self._type_counts[page_type] = count + 1
+            entry = RefreshEntry(crawler, page_type, urls, self.ttls[page_type], ((count + 1) * GOLDEN) % 1)
+            self._schedule(entry, now)
+        return crawler
+
+    def _schedule(self, entry, due):
+        entry.due = due
+        self._seq += 1
+        heapq.heappush(self.entries, (due, self._seq, entry))
+
+    def next_due(self):
+        """Time the next entry falls due (None with an empty schedule)"""
+        return self.entries[0][0] if self.entries else None
+
+    def data(self, sport, team):
+        """Current scraped_data for a team"""
+        return self.crawlers[(sport, team)].scraped_data
+
+    def _fetch_entry(self, entry):
+        """Fetch the entry's URLs until one yields records; returns them (or None)"""
+        crawler = entry.crawler
+        data_type = crawler.extractors.get(entry.page_type).yields
+        error = None
+        for url in list(entry.urls):
+            try:
+                # Straight to the network: the coordinator's page cache would serve stale pages
+                page = crawler._fetch_and_parse(url)
+            except Exception as e:
+                error = e
+                continue
+            records = page['records'].get(data_type)
+            if records:
+                if url != entry.urls[0]:
+                    entry.urls.remove(url)
+                    entry.urls.insert(0, url)
+                return records
+        if error is not None:
+            raise error
+        return None
+
+    def refresh(self, entry):
+        """Refetch one entry, store changed data and reschedule it; returns the result"""
+        crawler = entry.crawler
+        labels = {'sport': crawler.sport, 'team': crawler.team_name, 'page_type': entry.page_type}
+        now = self.clock()
+        self._reload_sitemaps(now)
+
+        # Sitemap says nothing changed since the last fetch: no request at all
+        # (counted under 'skipped' only, not as a refresh)
+        if self._unchanged_since_refresh(entry):
+            self.stats['skipped'] += 1
+            crawler.metrics.refreshes.inc(result='skipped', **labels)
+            self._schedule(entry, now + entry.ttl)
+            return 'skipped'
+
+        entry.refreshes += 1
+        self.stats['refreshes'] += 1
+
+        try:
+            records = self._fetch_entry(entry)
+        except Exception as e:
+            log.warning("Refresh failed for %s %s: %s", crawler.team_name, entry.page_type, e, extra=labels)
+            records = None
+
+        if not records:
+            # Nothing usable: try again soon, without waiting out a long TTL
+            result = 'failed'
+            entry.failures += 1
+            self._schedule(entry, self.clock() + min(entry.base_ttl, self.failure_retry))
+        else:
+            digest = records_digest(records)
+            if digest != entry.digest:
+                result = 'changed'
+                entry.changes += 1
+                entry.ttl = entry.base_ttl
+                self._store(entry, records)
+            else:
+                # Unchanged data backs off toward max_backoff x the base TTL
+                result = 'unchanged'
+                entry.ttl = min(entry.ttl * self.backoff, entry.base_ttl * self.max_backoff)
+            first = entry.digest is None
+            entry.digest = digest
+            entry.last_refresh = now
+
+            if first:
+                # Stagger the first refresh so entries of one type don't fall due together
+                due = now + entry.ttl * entry.phase
+            else:
+                due = entry.due + entry.ttl
+                if due <= now:
+                    due = now + entry.ttl
+            self._schedule(entry, due)
+
+        self.stats[result] += 1
+        crawler.metrics.refreshes.inc(result=result, **labels)
+        log.info("🔄 %s %s: %s", crawler.team_name, entry.page_type, result, extra=dict(labels, result=result))
+        return result
+
+    def _store(self, entry, records):
+        """Replace the team's data for this page type with the fresh records"""
+        crawler = entry.crawler
+        data_type = crawler.extractors.get(entry.page_type).yields
+        if not isinstance(records, list):
+            records = [records]
+        if data_type == 'news':
+            records = [self.coordinator.register_article(article)[0] for article in records]
+        crawler.scraped_data[data_type] = records
+
+        if self.on_update is not None:
+            self.on_update(crawler.sport, crawler.team_name, entry.page_type, records)
+        if self.output_dir:
+            self._write_team(crawler)
+
+    def _write_team(self, crawler):
+        save_team_data(crawler, self.output_dir)
+
+    def run_pending(self):
+        """Refresh every entry that is due now; returns how many were handled (skips included)"""
+        refreshed = 0
+        while self.entries and self.entries[0][0] <= self.clock():
+            _, _, entry = heapq.heappop(self.entries)
+            self.refresh(entry)
+            refreshed += 1
+        return refreshed
+
+    def run(self, duration=None, max_refreshes=None, max_idle=60.0):
+        """
+        Refresh loop: sleep until the next entry is due, refresh it, repeat
+        Runs until duration seconds pass or max_refreshes refreshes (forever if neither)
+        """
+        deadline = self.clock() + duration if duration is not None else None
+        refreshed = 0
+        try:
+            while self.entries:
+                if max_refreshes is not None and refreshed >= max_refreshes:
+                    break
+                now = self.clock()
+                if deadline is not None and now >= deadline:
+                    break
+
+                due = self.next_due()
+                if due > now:
+                    wait = min(due - now, max_idle)
+                    if deadline is not None:
+                        wait = min(wait, deadline - now)
+                    self.sleep(wait)
+                    continue
+
+                _, _, entry = heapq.heappop(self.entries)
+                self.refresh(entry)
+                refreshed += 1
+        except KeyboardInterrupt:
+            log.info("Refresh stopped")
+        return refreshed
+
+    def schedule(self):
+        """Current schedule rows, soonest first"""
+        rows = []
+        for due, _, entry in sorted(self.entries, key=lambda item: item[:2]):
+            sport, team, page_type = entry.key
+            rows.append({'sport': sport, 'team': team, 'page_type': page_type, 'due': due,
+                         'ttl': entry.ttl, 'refreshes': entry.refreshes, 'changes': entry.changes,
+                         'failures': entry.failures})
+        return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep team data fresh with per-page-type TTLs")
+    parser.add_argument('sport', choices=sorted(espn_sports))
+    parser.add_argument('--teams', help="Comma-separated team names (default: every team)")
+    parser.add_argument('--ttl', action='append', default=[], metavar='TYPE=SECONDS',
+                        help="Override a page type's TTL, e.g. --ttl news=600")
+    parser.add_argument('--min-interval', type=float, default=1.0, help="Seconds between requests")
+    parser.add_argument('--output-dir', default='refresh_data', help="Where per-team JSON is written")
+    parser.add_argument('--sitemap', action='append', dest='sitemaps',
+                        help="Sitemap / sitemap-index URL or file whose lastmod dates skip unchanged pages "
+                             "(repeatable)")
+    parser.add_argument('--duration', type=float, help="Stop after this many seconds")
+    parser.add_argument('--log-format', choices=['text', 'json'], default='text')
+    args = parser.parse_args()
+
+    configure_logging(fmt=args.log_format)
+
+    ttls = dict(DEFAULT_TTLS)
+    for override in args.ttl:
+        page_type, _, seconds = override.partition('=')
+        ttls[page_type] = float(seconds)
+
+    daemon = RefreshDaemon(ttls=ttls, min_interval=args.min_interval, output_dir=args.output_dir)
+    daemon.add_sport(args.sport, args.teams.split(',') if args.teams else None)
+    if args.sitemaps:
+        daemon.add_sitemap(SitemapDiscovery(args.sitemaps, session=daemon.session, sport=args.sport))
+    daemon.run(duration=args.duration)
+    print(f"\n🔄 Refreshes: {daemon.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Crawl timeline / waterfall traces in the Chrome trace-event format
+Per-URL spans for queued, fetch, parse, extract and sleep, with parent link
+and depth. Load the saved JSON in chrome://tracing or https://ui.perfetto.dev
+to see stalls, serialization and wasted fetches in real sweeps
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class CrawlTrace:
+    """Collects trace events; one process track per sport, one thread track per team/worker"""
+
+    def __init__(self):
+        self.events = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._pids = {}
+        self._tids = {}
+
+    def _now_us(self):
+        return (time.perf_counter() - self._start) * 1_000_000
+
+    def _track(self, sport, team):
+        """(pid, tid) for a sport/team on the current thread, naming new tracks"""
+        thread = threading.current_thread()
+        with self._lock:
+            pid = self._pids.get(sport)
+            if pid is None:
+                pid = self._pids[sport] = len(self._pids) + 1
+                self.events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                                    'args': {'name': sport}})
+
+            key = (sport, team, thread.ident)
+            tid = self._tids.get(key)
+            if tid is None:
+                tid = self._tids[key] = len(self._tids) + 1
+                label = team if thread is threading.main_thread() else f"{team} ({thread.name})"
+                self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                                    'args': {'name': label}})
+        return pid, tid
+
+    def _add(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def instant(self, name, sport, team, **args):
+        """Point-in-time event (e.g. a URL being queued)"""
+        pid, tid = self._track(sport, team)
+        self._add({'name': name, 'cat': 'crawl', 'ph': 'i', 's': 't', 'ts': self._now_us(),
+                   'pid': pid, 'tid': tid, 'args': args})
+
+    @contextmanager
+    def span(self, name, sport, team, **args):
+        """Complete event around a block; yields the args dict so callers can add results"""
+        pid, tid = self._track(sport, team)
+        start = self._now_us()
+        try:
+            yield args
+        finally:
+            self._add({'name': name, 'cat': 'crawl', 'ph': 'X', 'ts': start,
+                       'dur': self._now_us() - start, 'pid': pid, 'tid': tid, 'args': args})
+
+    def to_dict(self):
+        with self._lock:
+            events = list(self.events)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save(self, path):
+        """Write the trace JSON (open it in chrome://tracing or Perfetto)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        return path
@@ -0,0 +1,152 @@
+"""
+In-process cache of extraction results
+Keeps what a page parsed into (records and links, never the soup), keyed by
+canonical URL and a hash of the page content. Within the TTL a URL is served
+without touching the network; after that the page is refetched, and if its
+content hash is unchanged the stored result is reused without parsing.
+Bounded by an approximate byte size with LRU eviction
+"""
+
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from fetch_coordinator import canonical_url
+
+
+def content_hash(content):
+    """Short digest of raw page bytes"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def result_size(result, content=b''):
+    """Approximate bytes a cached result holds (pickled size, else the page size)"""
+    try:
+        return len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return len(content)
+
+
+class _Entry:
+    __slots__ = ('result', 'size', 'stored')
+
+    def __init__(self, result, size, stored):
+        self.result = result
+        self.size = size
+        self.stored = stored
+
+
+class ExtractionCache:
+    """
+    LRU of extraction results keyed by (kind, canonical URL, content hash)
+    kind keeps different result shapes for one URL apart ('page', 'player', ...)
+    max_bytes: approximate size budget across all results
+    ttl: seconds a result may be served by URL alone, without refetching
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttl=900, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (kind, canonical URL, content hash) -> _Entry
+        self._latest = {}              # (kind, canonical URL) -> content hash last stored
+        self.bytes = 0
+        self.stats = {
+            'hits': 0,          # served by URL within the TTL (no fetch, no parse)
+            'content_hits': 0,  # refetched, content unchanged (no parse)
+            'misses': 0,        # had to parse
+            'expired': 0,       # URL known but past its TTL
+            'evictions': 0
+        }
+
+    def get(self, url, kind='page'):
+        """Result for url if one was stored within the TTL, else None"""
+        url_key = (kind, canonical_url(url))
+        with self._lock:
+            digest = self._latest.get(url_key)
+            entry = self._entries.get(url_key + (digest,)) if digest else None
+            if entry is None:
+                return None
+            if self.clock() - entry.stored > self.ttl:
+                self.stats['expired'] += 1
+                return None
+            self._entries.move_to_end(url_key + (digest,))
+            self.stats['hits'] += 1
+            return entry.result
+
+    def match(self, url, content, kind='page'):
+        """
+        Result for url if this exact content was parsed before (any age), else
+        None. A match renews the entry's TTL, since the page was just fetched
+        """
+        url_key = (kind, canonical_url(url))
+        digest = content_hash(content)
+        with self._lock:
+            entry = self._entries.get(url_key + (digest,))
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            entry.stored = self.clock()
+            self._latest[url_key] = digest
+            self._entries.move_to_end(url_key + (digest,))
+            self.stats['content_hits'] += 1
+            return entry.result
+
+    def put(self, url, content, result, kind='page'):
+        """Store the result parsed from content; older content for the URL is dropped"""
+        url_key = (kind, canonical_url(url))
+        digest = content_hash(content)
+        size = result_size(result, content)
+        if size > self.max_bytes:
+            return result
+
+        with self._lock:
+            previous = self._latest.get(url_key)
+            if previous is not None:
+                self._drop(url_key + (previous,))
+            self._entries[url_key + (digest,)] = _Entry(result, size, self.clock())
+            self._latest[url_key] = digest
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                key = next(iter(self._entries))
+                self._drop(key)
+                if self._latest.get(key[:2]) == key[2]:
+                    del self._latest[key[:2]]
+                self.stats['evictions'] += 1
+        return result
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+    def load(self, url, fetch, parse, kind='page'):
+        """
+        Cached result for url, fetching (fetch() -> bytes) and parsing
+        (parse(content) -> result) only as much as the cache requires
+        """
+        result = self.get(url, kind)
+        if result is not None:
+            return result
+        content = fetch()
+        result = self.match(url, content, kind)
+        if result is not None:
+            return result
+        return self.put(url, content, parse(content), kind)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._latest.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, url):
+        return ('page', canonical_url(url)) in self._latest
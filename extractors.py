@@ -0,0 +1,162 @@
+"""
+Extractor registry with precompiled URL routing
+Each extractor declares the URL paths it handles and the data type it yields.
+Routing is decided once per URL and cached; every extractor keeps call
+count, wall time and records yielded so the hot one is easy to spot
+"""
+
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+# ESPN team page shapes ("{sport}" is any single path segment)
+TEAM_SECTION = r"^/[^/]+/team/{section}/"                       # /nba/team/roster/_/name/hou/...
+TEAM_SUFFIX = r"^/[^/]+/team/_/name/[^/]+/[^/]+/{section}/?$"   # /nba/team/_/name/hou/houston-rockets/roster
+
+
+def team_routes(section):
+    """Both ESPN URL shapes for one team section"""
+    return [TEAM_SECTION.format(section=section), TEAM_SUFFIX.format(section=section)]
+
+
+class Extractor:
+    """One page extractor: routes, the data type it yields, and its timing"""
+
+    def __init__(self, name, routes, yields, method):
+        self.name = name
+        self.routes = [re.compile(route, re.IGNORECASE) for route in routes]
+        self.yields = yields
+        self.method = method  # SportsCrawler method name
+        self.calls = 0
+        self.wall_time = 0.0
+        self.records = 0
+        self._lock = threading.Lock()
+
+    def matches(self, path):
+        return any(route.search(path) for route in self.routes)
+
+    def extract(self, crawler, soup):
+        """Run the extractor on a parsed page, recording call stats"""
+        start = time.perf_counter()
+        result = getattr(crawler, self.method)(soup)
+        elapsed = time.perf_counter() - start
+
+        count = len(result) if isinstance(result, list) else 1
+        with self._lock:
+            self.calls += 1
+            self.wall_time += elapsed
+            self.records += count
+        return result
+
+    def reset_stats(self):
+        with self._lock:
+            self.calls = 0
+            self.wall_time = 0.0
+            self.records = 0
+
+
+class ExtractorRegistry:
+    """Ordered list of extractors; the first matching route wins"""
+
+    def __init__(self, route_cache_size=4096):
+        self.extractors = []
+        self.route_cache_size = route_cache_size
+        self._route_cache = {}
+
+    def register(self, name, routes, yields, method):
+        """Add an extractor; earlier registrations take priority"""
+        extractor = Extractor(name, routes, yields, method)
+        self.extractors.append(extractor)
+        self._route_cache.clear()
+        return extractor
+
+    def get(self, name):
+        """Look up an extractor by name"""
+        for extractor in self.extractors:
+            if extractor.name == name:
+                return extractor
+        raise KeyError(name)
+
+    def route(self, url):
+        """Return the extractor for a URL (None for link-only pages), cached per URL"""
+        try:
+            return self._route_cache[url]
+        except KeyError:
+            pass
+
+        path = urlparse(url).path
+        extractor = next((e for e in self.extractors if e.matches(path)), None)
+
+        if len(self._route_cache) >= self.route_cache_size:
+            self._route_cache.clear()
+        self._route_cache[url] = extractor
+        return extractor
+
+    def run(self, crawler, url, soup):
+        """Route a page and extract it, returning {data type: records}"""
+        extractor = self.route(url)
+        if extractor is None:
+            return {}
+        return {extractor.yields: extractor.extract(crawler, soup)}
+
+    def snapshot(self):
+        """Current counters per extractor, for stats(since=...)"""
+        return {extractor.name: (extractor.calls, extractor.wall_time, extractor.records)
+                for extractor in self.extractors}
+
+    def stats(self, since=None):
+        """
+        Per-extractor timing, busiest first
+        since: a snapshot() to count from; the registry is shared process-wide,
+        so one crawl's own numbers are the difference from its start
+        """
+        rows = []
+        for extractor in self.extractors:
+            calls, wall_time, records = extractor.calls, extractor.wall_time, extractor.records
+            if since is not None and extractor.name in since:
+                start_calls, start_time, start_records = since[extractor.name]
+                calls, wall_time, records = calls - start_calls, wall_time - start_time, records - start_records
+            rows.append({
+                'extractor': extractor.name,
+                'yields': extractor.yields,
+                'calls': calls,
+                'wall_time': wall_time,
+                'avg_ms': wall_time / calls * 1000 if calls else 0.0,
+                'records': records
+            })
+        rows.sort(key=lambda row: row['wall_time'], reverse=True)
+        return rows
+
+    def reset_stats(self):
+        for extractor in self.extractors:
+            extractor.reset_stats()
+
+    def stats_table(self, since=None):
+        """The per-extractor timing table as text lines, for crawl summaries"""
+        lines = [
+            "\n⏱️  EXTRACTOR TIMING:",
+            "-" * 60,
+            f"{'Extractor':<12} {'Calls':>6} {'Total (s)':>10} {'Avg (ms)':>9} {'Records':>8}",
+            "-" * 60,
+        ]
+        for row in self.stats(since):
+            lines.append(f"{row['extractor']:<12} {row['calls']:>6} {row['wall_time']:>10.3f} "
+                         f"{row['avg_ms']:>9.1f} {row['records']:>8}")
+        return lines
+
+
+def build_default_registry():
+    """Registry for the ESPN page types the crawler understands"""
+    registry = ExtractorRegistry()
+    # Player pages first: a player URL may contain /news or /stats further down
+    registry.register('player', [r"^/[^/]+/player/"], 'players', '_scrape_player_page')
+    registry.register('roster', team_routes('roster'), 'roster', '_scrape_roster_page')
+    registry.register('schedule', team_routes('schedule'), 'schedule', '_scrape_schedule_page')
+    registry.register('news', team_routes('news'), 'news', '_scrape_news_page')
+    registry.register('stats', team_routes('stats'), 'stats', '_scrape_stats_page')
+    return registry
+
+
+# Process-wide registry, shared by every crawler unless one is passed in
+default_registry = build_default_registry()
@@ -0,0 +1,150 @@
+"""
+League-scoped fetch coordination
+Shares fetches across the team crawlers of one league sweep: concurrent
+requests for the same page collapse into one (singleflight), and parsed
+results are kept in a shared LRU keyed by (kind, canonical URL). A shared rate
+limiter keeps request spacing across every crawler in the process
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qsl, urlencode
+
+# Query parameters that never change page content
+TRACKING_PARAMS = ('utm_', 'ex_cid', 'src', 'xhr')
+
+
+def canonical_url(url):
+    """Normalize a URL so equivalent links share one cache key"""
+    parsed = urlparse(url.strip())
+    path = parsed.path.rstrip('/') or '/'
+    query = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PARAMS)]
+    canonical = f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{path}"
+    if query:
+        canonical += f"?{urlencode(sorted(query))}"
+    return canonical
+
+
+class _InflightCall:
+    """One fetch in progress; followers wait on the event"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class FetchCoordinator:
+    """Deduplicates in-flight and completed page loads across crawlers"""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._cache = OrderedDict()
+        self.articles = OrderedDict()  # canonical article URL -> article record
+        self.stats = {
+            'hits': 0,      # served from the shared LRU
+            'misses': 0,    # loaded by this caller
+            'shared': 0     # waited on another crawler's in-flight load
+        }
+
+    def get(self, url, loader, kind='page'):
+        """
+        Return the parsed result for url, calling loader() at most once
+        across all crawlers sharing this coordinator
+        kind keeps different result shapes for one URL apart ('page', 'player', ...)
+        """
+        key = (kind, canonical_url(url))
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return self._cache[key]
+
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _InflightCall()
+                self._inflight[key] = call
+                self.stats['misses'] += 1
+            else:
+                self.stats['shared'] += 1
+
+        # Followers block until the leader's load finishes
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = loader()
+            with self._lock:
+                self._cache[key] = call.result
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+            return call.result
+        except Exception as e:
+            # Failures are not cached; the next caller retries
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.event.set()
+
+    def register_article(self, article):
+        """
+        Record a news article by canonical URL
+        Returns (shared record, True if this is the first time it was seen)
+        """
+        link = article.get('link', 'N/A')
+        if link == 'N/A':
+            return article, True
+
+        key = canonical_url(link)
+        with self._lock:
+            if key in self.articles:
+                return self.articles[key], False
+            self.articles[key] = article
+            return article, True
+
+    def contains(self, url, kind):
+        """True when a result of this kind is cached for the URL"""
+        return (kind, canonical_url(url)) in self._cache
+
+    def __contains__(self, url):
+        return self.contains(url, 'page')
+
+    def __len__(self):
+        return len(self._cache)
+
+
+class RateLimiter:
+    """Minimum spacing between requests, shared by every crawler (and thread) using it"""
+
+    def __init__(self, min_interval=1.0, clock=time.monotonic, sleep=time.sleep):
+        self.min_interval = min_interval
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = None
+        self.waited = 0.0
+
+    def wait(self):
+        """Block until this caller's request slot; returns seconds waited"""
+        # Reserve a slot under the lock, sleep outside it
+        with self._lock:
+            now = self.clock()
+            slot = now if self._next_slot is None else max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            self.sleep(delay)
+            with self._lock:
+                self.waited += delay
+        return max(delay, 0.0)
@@ -0,0 +1,178 @@
+"""
+(sport, team, jersey) -> player index for real-time identification
+A detection loop that reads a jersey number off a video frame needs the
+player in microseconds, not a scan of the roster list. Every team gets one
+row of a NumPy slot table indexed directly by jersey ('0'-'99', plus '00'),
+holding the player's position in a flat player list; the rare jersey that
+doesn't fit (e.g. '100') goes to a small overflow map. Updated at the end
+of each crawl (only the crawled teams change) and saved as an .npz that
+loads in milliseconds
+"""
+
+import json
+import os
+
+import numpy as np
+
+# Slots per team: jerseys 0-99, then '00'
+JERSEY_SLOTS = 101
+DOUBLE_ZERO = 100
+EMPTY = -1
+
+# Written next to the per-team files by league crawls
+JERSEY_INDEX_FILE = 'jersey_index.npz'
+
+
+def normalize_jersey(number):
+    """Jersey as a lookup key ('#7' / ' 7 ' -> '7'), None when missing"""
+    number = str(number).strip().lstrip('#')
+    return number if number and number != 'N/A' else None
+
+
+def jersey_slot(number):
+    """Slot for a jersey in a team row, None if missing, EMPTY if it needs the overflow map"""
+    jersey = normalize_jersey(number)
+    if jersey is None:
+        return None
+    if jersey == '00':
+        return DOUBLE_ZERO
+    if jersey.isdigit() and int(jersey) < 100:
+        return int(jersey)
+    return EMPTY
+
+
+class JerseyIndex:
+    """
+    Player lookup by (sport, team, jersey)
+    teams: {(sport, team): row}; slots: (teams x JERSEY_SLOTS) int32 player
+    positions (EMPTY when free); players: flat list of player records;
+    overflow: {(sport, team, jersey): player position}
+    """
+
+    def __init__(self, teams, slots, players, overflow=None):
+        self.teams = teams
+        self.slots = slots
+        self.players = players
+        self.overflow = overflow or {}
+        self.stats = {'teams': len(teams), 'players': len(players), 'duplicates': 0,
+                      'overflow': len(self.overflow)}
+
+    @classmethod
+    def build(cls, rosters):
+        """Index from {(sport, team): [player record, ...]}; first player wins a shared jersey"""
+        teams = {key: row for row, key in enumerate(rosters)}
+        slots = np.full((len(teams), JERSEY_SLOTS), EMPTY, dtype=np.int32)
+        players = []
+        overflow = {}
+        duplicates = 0
+
+        for (sport, team), roster in rosters.items():
+            row = teams[(sport, team)]
+            for player in roster:
+                slot = jersey_slot(player.get('number', 'N/A'))
+                if slot is None:
+                    continue
+                jersey = normalize_jersey(player['number'])
+                taken = (overflow.get((sport, team, jersey)) if slot == EMPTY
+                         else slots[row, slot] if slots[row, slot] != EMPTY else None)
+                if taken is not None:
+                    duplicates += 1
+                    continue
+                if slot == EMPTY:
+                    overflow[(sport, team, jersey)] = len(players)
+                else:
+                    slots[row, slot] = len(players)
+                players.append(dict(player, sport=sport, team=team))
+
+        index = cls(teams, slots, players, overflow)
+        index.stats['duplicates'] = duplicates
+        return index
+
+    @classmethod
+    def from_crawlers(cls, crawlers):
+        """Index over finished crawlers' rosters"""
+        return cls.build({(crawler.sport, crawler.team_name): crawler.scraped_data['roster']
+                          for crawler in crawlers})
+
+    def rosters(self):
+        """{(sport, team): [player record, ...]} of the indexed players"""
+        rosters = {key: [] for key in self.teams}
+        for player in self.players:
+            rosters[(player['sport'], player['team'])].append(player)
+        return rosters
+
+    def updated(self, rosters):
+        """New index where these {(sport, team): roster} replace (or add to) the indexed teams"""
+        merged = self.rosters()
+        merged.update(rosters)
+        return self.build(merged)
+
+    def position(self, sport, team, jersey):
+        """Position of the player in self.players, or None"""
+        row = self.teams.get((sport, team))
+        if row is None:
+            return None
+        slot = jersey_slot(jersey)
+        if slot is None:
+            return None
+        if slot == EMPTY:
+            return self.overflow.get((sport, team, normalize_jersey(jersey)))
+        position = int(self.slots[row, slot])
+        return position if position != EMPTY else None
+
+    def lookup(self, sport, team, jersey):
+        """Player record for a jersey, or None"""
+        position = self.position(sport, team, jersey)
+        return self.players[position] if position is not None else None
+
+    def team_row(self, sport, team):
+        """The team's slot array (index it by jersey number; 100 is '00')"""
+        return self.slots[self.teams[(sport, team)]]
+
+    def lookup_many(self, sport, team, jerseys):
+        """
+        Players for many jerseys on one team (None where free or not a jersey)
+        Jerseys are keyed like lookup() ('00' is not 0, 'N/A' is a miss); slot
+        jerseys are resolved in one array gather, the rest through the overflow map
+        """
+        row = self.team_row(sport, team)
+        slots = [jersey_slot(jersey) for jersey in jerseys]
+        gather = np.array([slot if slot is not None and slot != EMPTY else 0 for slot in slots], dtype=np.intp)
+        positions = row[gather].tolist()
+
+        players = []
+        for jersey, slot, position in zip(jerseys, slots, positions):
+            if slot is None:
+                position = EMPTY
+            elif slot == EMPTY:
+                position = self.overflow.get((sport, team, normalize_jersey(jersey)), EMPTY)
+            players.append(self.players[position] if position != EMPTY else None)
+        return players
+
+    def save(self, path):
+        """Write the index as an uncompressed .npz (no pickles); atomic, so readers never see a partial file"""
+        meta = {
+            'teams': [list(key) for key in self.teams],
+            'players': self.players,
+            'overflow': [[*key, position] for key, position in self.overflow.items()],
+            'duplicates': self.stats['duplicates']
+        }
+        blob = np.frombuffer(json.dumps(meta, separators=(',', ':')).encode(), dtype=np.uint8)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, slots=self.slots, meta=blob)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            slots = data['slots']
+            meta = json.loads(data['meta'].tobytes())
+        teams = {tuple(key): row for row, key in enumerate(meta['teams'])}
+        overflow = {(sport, team, jersey): position for sport, team, jersey, position in meta['overflow']}
+        index = cls(teams, slots, meta['players'], overflow)
+        index.stats['duplicates'] = meta['duplicates']
+        return index
+
+    def __len__(self):
+        return len(self.players)
@@ -0,0 +1,75 @@
+"""
+DOM-free link extraction
+Pulls <a href> targets straight out of raw page bytes with precompiled
+regexes, for pages the router sends to no extractor (hubs, pagination, link
+lists). Comments and script/style bodies are skipped the way html.parser
+skips them, so the link set matches SportsCrawler._page_links on the soup
+"""
+
+import html
+import re
+from urllib.parse import urljoin, urlparse
+
+# Markup html.parser never turns into tags
+_SKIPPED = re.compile(rb"<!--.*?-->|<script\b.*?</script\s*>|<style\b.*?</style\s*>", re.IGNORECASE | re.DOTALL)
+
+_SKIPPED_START = re.compile(rb"<!--|<script|<style", re.IGNORECASE)
+
+# An <a ...> start tag; quoted attribute values may contain '>'
+_ANCHOR = re.compile(rb"""<a(?=[\s/>])((?:[^>"']|"[^"]*"|'[^']*')*)>""", re.IGNORECASE)
+
+# One attribute of a start tag, as html.parser tokenizes it: a name, then an
+# optional double-quoted, single-quoted or bare value
+_ATTR = re.compile(rb"""(?:\s|/(?!>))*([^\s/>][^\s/=>]*)(?:\s*=+\s*("[^"]*"|'[^']*'|(?!['"])[^>\s]*))?""")
+
+# Root-relative hrefs simple enough to join by concatenation (no '//', dot
+# segments, ';params', whitespace or backslashes for urljoin/urlparse to rework)
+_SIMPLE_PATH = re.compile(r"/(?!/)[^\s;\\]*\Z")
+_DOT_SEGMENT = re.compile(r"(?:^|/)\.\.?(?:/|\Z)|//")
+
+
+def iter_hrefs(content):
+    """Raw href values of every <a> tag, in document order"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    if _SKIPPED_START.search(content):
+        content = _SKIPPED.sub(b'', content)
+    for anchor in _ANCHOR.finditer(content):
+        href = _last_href(anchor.group(1))
+        if href is not None:
+            yield html.unescape(href.decode('utf-8', errors='replace'))
+
+
+def _last_href(attrs):
+    """Value of the tag's last href attribute (the one the soup keeps), or None"""
+    href = None
+    pos = 0
+    while pos < len(attrs):
+        match = _ATTR.match(attrs, pos)
+        if not match:
+            break
+        pos = match.end()
+        if match.group(1).lower() == b'href':
+            value = match.group(2) or b''
+            href = value[1:-1] if value[:1] in (b'"', b"'") else value
+    return href
+
+
+def scan_links(content, current_url):
+    """Absolute, fragment-free link URLs, the same shape _page_links returns"""
+    base = urlparse(current_url)
+    origin = f"{base.scheme}://{base.netloc}"
+    links = []
+    for href in iter_hrefs(content):
+        if _SIMPLE_PATH.match(href):
+            # Same result urljoin + urlparse give, without the general-case work
+            path, _, query = href.partition('#')[0].partition('?')
+            if not _DOT_SEGMENT.search(path):
+                links.append(f"{origin}{path}?{query}" if query else f"{origin}{path}")
+                continue
+        parsed = urlparse(urljoin(current_url, href))
+        clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        if parsed.query:
+            clean_url += f"?{parsed.query}"
+        links.append(clean_url)
+    return links
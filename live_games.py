@@ -0,0 +1,371 @@
+"""
+Live game-day polling
+Follows the games of chosen teams through ESPN's JSON scoreboard (one
+request covers every game in a league) and, optionally, each live game's
+gamecast summary. Poll intervals follow the game: fast during play, slow at
+breaks, counting down to tip-off before it, and polling stops at the final.
+Subscribers get only the fields that changed, and every request is charged
+to a sliding-window budget so a full slate stays polite
+
+    python live_games.py --follow nba:houston-rockets,nfl:green-bay-packers --budget 30
+"""
+
+import argparse
+import heapq
+import json
+import re
+import time
+from collections import deque
+
+import requests
+
+from crawl_logging import get_logger, configure_logging
+from fetch_coordinator import RateLimiter
+from sitemap_discovery import parse_lastmod
+
+log = get_logger('live')
+
+ESPN_API = "https://site.api.espn.com/apis/site/v2/sports"
+
+# espn_sports key -> ESPN API sport/league path
+LEAGUE_PATHS = {
+    'nfl': 'football/nfl',
+    'nba': 'basketball/nba',
+    'mlb': 'baseball/mlb',
+    'nhl': 'hockey/nhl',
+    'college-football': 'football/college-football',
+    'college-basketball': 'basketball/mens-college-basketball',
+    'mls': 'soccer/usa.1',
+    'wnba': 'basketball/wnba',
+}
+
+# Seconds between polls by game phase ('idle': no followed game on the board)
+DEFAULT_INTERVALS = {'live': 15, 'break': 60, 'pre': 300, 'idle': 1800}
+
+# In-game statuses where nothing happens for a while
+BREAK_STATUSES = {'STATUS_HALFTIME', 'STATUS_END_PERIOD', 'STATUS_DELAYED', 'STATUS_RAIN_DELAY',
+                  'STATUS_SUSPENDED'}
+
+
+def slugify(name):
+    """'Houston Rockets' -> 'houston-rockets' (the team names in sports_data)"""
+    return re.sub(r"[^a-z0-9]+", '-', str(name).lower()).strip('-')
+
+
+def _game_from_competition(game_id, competition, date=None):
+    """Flat game state from an ESPN competition object"""
+    status = competition.get('status', {})
+    status_type = status.get('type', {})
+    game = {
+        'game_id': str(game_id),
+        'start': parse_lastmod(competition.get('date') or date),
+        'state': status_type.get('state', 'pre'),   # pre / in / post
+        'status': status_type.get('name'),
+        'detail': status_type.get('shortDetail') or status_type.get('detail'),
+        'period': status.get('period'),
+        'clock': status.get('displayClock'),
+    }
+    for competitor in competition.get('competitors', []):
+        side = competitor.get('homeAway', 'home')
+        team = competitor.get('team', {})
+        game[f"{side}_team"] = team.get('slug') or slugify(team.get('displayName', ''))
+        game[f"{side}_score"] = competitor.get('score')
+    return game
+
+
+def parse_scoreboard(data):
+    """{game id: game state} from a scoreboard response"""
+    games = {}
+    for event in data.get('events', []):
+        competition = (event.get('competitions') or [{}])[0]
+        if 'status' not in competition and 'status' in event:
+            competition = dict(competition, status=event['status'])
+        games[str(event['id'])] = _game_from_competition(event['id'], competition, event.get('date'))
+    return games
+
+
+def parse_gamecast(game_id, data):
+    """Game state plus the latest play from a gamecast summary response"""
+    competition = (data.get('header', {}).get('competitions') or [{}])[0]
+    game = _game_from_competition(game_id, competition)
+    plays = data.get('plays') or []
+    if plays:
+        game['last_play'] = plays[-1].get('text')
+    return game
+
+
+def game_phase(game):
+    """'pre', 'live', 'break' or 'final'"""
+    if game['state'] == 'post':
+        return 'final'
+    if game['state'] == 'in':
+        return 'break' if game.get('status') in BREAK_STATUSES else 'live'
+    return 'pre'
+
+
+class RequestBudget:
+    """At most max_requests in any window seconds"""
+
+    def __init__(self, max_requests=60, window=60.0, clock=time.time):
+        self.max_requests = max_requests
+        self.window = window
+        self.clock = clock
+        self.sent = deque()
+
+    def _trim(self, now):
+        while self.sent and self.sent[0] <= now - self.window:
+            self.sent.popleft()
+
+    def acquire(self):
+        """Charge one request if the budget allows it; False if it doesn't"""
+        now = self.clock()
+        self._trim(now)
+        if len(self.sent) >= self.max_requests:
+            return False
+        self.sent.append(now)
+        return True
+
+    def next_free(self):
+        """When the next request fits in the budget"""
+        now = self.clock()
+        self._trim(now)
+        if len(self.sent) < self.max_requests:
+            return now
+        return self.sent[0] + self.window
+
+
+class LiveGames:
+    """
+    Polls the followed teams' games and pushes deltas to subscribers
+    follow: {sport: [team, ...] or None for every game in the league}
+    budget / window: politeness budget, requests per window seconds across all polls
+    gamecast: also poll each live game's gamecast (latest play); the scoreboard
+    then only needs the break interval to catch games starting and ending
+    max_failures: consecutive failures before a poll is given up; a failed
+    gamecast hands its game back to the scoreboard, which retries it until
+    then and afterwards polls the game itself
+    """
+
+    def __init__(self, follow, intervals=None, budget=30, window=60.0, gamecast=False, session=None,
+                 rate_limiter=None, min_interval=1.0, timeout=10, api_base=ESPN_API, max_failures=3,
+                 clock=time.time, sleep=time.sleep):
+        unknown = set(follow) - set(LEAGUE_PATHS)
+        if unknown:
+            raise ValueError(f"No live endpoints for: {', '.join(sorted(unknown))}")
+        self.follow = {sport: set(teams) if teams else None for sport, teams in follow.items()}
+        self.intervals = dict(DEFAULT_INTERVALS, **(intervals or {}))
+        self.gamecast = gamecast
+        self.session = session or requests.Session()
+        self.rate_limiter = rate_limiter or RateLimiter(min_interval, clock=clock, sleep=sleep)
+        self.timeout = timeout
+        self.api_base = api_base
+        self.clock = clock
+        self.sleep = sleep
+        self.budget = RequestBudget(budget, window, clock)
+        self.max_failures = max_failures
+
+        self.games = {}        # (sport, game id) -> latest game state
+        self.subscribers = []  # (callback, teams or None)
+        self.etags = {}        # URL -> ETag of the last 200
+        self.queue = []        # heap of (due, seq, poll key)
+        self._scheduled = set()
+        self.failures = {}     # poll key -> consecutive failures
+        self._seq = 0
+        self.stats = {'polls': 0, 'not_modified': 0, 'deferred': 0, 'updates': 0, 'failed': 0}
+
+        now = self.clock()
+        for sport in self.follow:
+            self._schedule(('scoreboard', sport), now)
+
+    def subscribe(self, callback, teams=None):
+        """callback(sport, game_id, changes, game) for games involving teams (any followed game if None)"""
+        self.subscribers.append((callback, set(teams) if teams else None))
+
+    def _schedule(self, key, due):
+        self._seq += 1
+        self._scheduled.add(key)
+        heapq.heappush(self.queue, (due, self._seq, key))
+
+    def scoreboard_url(self, sport):
+        return f"{self.api_base}/{LEAGUE_PATHS[sport]}/scoreboard"
+
+    def gamecast_url(self, sport, game_id):
+        return f"{self.api_base}/{LEAGUE_PATHS[sport]}/summary?event={game_id}"
+
+    def _get_json(self, url):
+        """Conditional GET; None when the server says nothing changed (304)"""
+        headers = {'If-None-Match': self.etags[url]} if url in self.etags else {}
+        self.rate_limiter.wait()
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            self.stats['not_modified'] += 1
+            return None
+        response.raise_for_status()
+        etag = getattr(response, 'headers', {}).get('ETag')
+        if etag:
+            self.etags[url] = etag
+        return json.loads(response.content)
+
+    def _followed(self, sport, game):
+        teams = self.follow[sport]
+        return teams is None or game.get('home_team') in teams or game.get('away_team') in teams
+
+    def _update(self, sport, game):
+        """Store a game's new state and push the changed fields; returns them"""
+        key = (sport, game['game_id'])
+        previous = self.games.get(key, {})
+        merged = dict(previous, **game)
+        changes = {field: value for field, value in merged.items() if previous.get(field) != value}
+        self.games[key] = merged
+        if not changes:
+            return changes
+
+        self.stats['updates'] += 1
+        log.info("🏟️  %s %s: %s", sport, game['game_id'], changes, extra={'sport': sport})
+        for callback, teams in self.subscribers:
+            if teams is None or merged.get('home_team') in teams or merged.get('away_team') in teams:
+                callback(sport, game['game_id'], changes, merged)
+        return changes
+
+    def _interval(self, game, now):
+        """Seconds until this game is worth polling again (None once final)"""
+        phase = game_phase(game)
+        if phase == 'final':
+            return None
+        if phase == 'pre':
+            until_start = (game.get('start') or now) - now
+            return min(max(until_start, self.intervals['live']), self.intervals['pre'])
+        return self.intervals[phase]
+
+    def poll_scoreboard(self, sport):
+        """Poll a league's scoreboard; returns seconds until the next scoreboard poll (None: done)"""
+        data = self._get_json(self.scoreboard_url(sport))
+        now = self.clock()
+        if data is not None:
+            for game in parse_scoreboard(data).values():
+                if self._followed(sport, game):
+                    self._update(sport, game)
+
+        followed = [game for (game_sport, _), game in self.games.items() if game_sport == sport]
+        if not followed:
+            return self.intervals['idle']
+
+        intervals = []
+        for game in followed:
+            interval = self._interval(game, now)
+            if interval is None:
+                continue
+            key = ('gamecast', sport, game['game_id'])
+            if self.gamecast and game_phase(game) == 'live' and self.failures.get(key, 0) < self.max_failures:
+                # The gamecast follows the play; the scoreboard just watches for breaks and the final
+                if key not in self._scheduled:
+                    self._schedule(key, now)
+                interval = self.intervals['break']
+            intervals.append(interval)
+        # Every followed game is final: nothing left to poll today
+        return min(intervals) if intervals else None
+
+    def poll_gamecast(self, sport, game_id):
+        """Poll one game's gamecast; returns seconds until its next poll (None: hand back to the scoreboard)"""
+        data = self._get_json(self.gamecast_url(sport, game_id))
+        game = self.games[(sport, game_id)]
+        if data is not None:
+            self._update(sport, parse_gamecast(game_id, data))
+            game = self.games[(sport, game_id)]
+        return self.intervals['live'] if game_phase(game) == 'live' else None
+
+    def run_pending(self):
+        """Run every poll that is due now; returns how many were sent"""
+        sent = 0
+        while self.queue and self.queue[0][0] <= self.clock():
+            _, _, key = heapq.heappop(self.queue)
+            self._scheduled.discard(key)
+
+            if not self.budget.acquire():
+                self.stats['deferred'] += 1
+                self._schedule(key, self.budget.next_free())
+                continue
+
+            self.stats['polls'] += 1
+            sent += 1
+            try:
+                if key[0] == 'scoreboard':
+                    interval = self.poll_scoreboard(key[1])
+                else:
+                    interval = self.poll_gamecast(key[1], key[2])
+            except Exception as e:
+                failures = self.failures.get(key, 0) + 1
+                self.failures[key] = failures
+                self.stats['failed'] += 1
+                log.warning("Live poll %s failed (%d in a row): %s", key, failures, e)
+                # Gamecasts go back to the scoreboard; a scoreboard failing max_failures times is given up
+                if key[0] == 'gamecast' or failures >= self.max_failures:
+                    interval = None
+                else:
+                    interval = self.intervals['break']
+            else:
+                self.failures.pop(key, None)
+            if interval is not None:
+                self._schedule(key, self.clock() + interval)
+        return sent
+
+    def run(self, duration=None, max_polls=None):
+        """Poll until every followed game is final (or duration / max_polls runs out)"""
+        deadline = self.clock() + duration if duration is not None else None
+        polls = 0
+        while self.queue:
+            if max_polls is not None and polls >= max_polls:
+                break
+            due = self.queue[0][0]
+            if deadline is not None and due > deadline:
+                break
+            wait = due - self.clock()
+            if wait > 0:
+                self.sleep(wait)
+            polls += self.run_pending()
+        return polls
+
+
+def parse_follow(value):
+    """'nba:houston-rockets,nfl' -> {'nba': ['houston-rockets'], 'nfl': None}"""
+    follow = {}
+    for item in value.split(','):
+        sport, _, team = item.strip().partition(':')
+        if team:
+            teams = follow.setdefault(sport, [])
+            if teams is not None:
+                teams.append(team)
+        else:
+            follow[sport] = None
+    return follow
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Poll live games for followed teams")
+    parser.add_argument('--follow', required=True, help="sport:team pairs or whole sports, e.g. nba:houston-rockets,nfl")
+    parser.add_argument('--budget', type=int, default=30, help="Max requests per minute across all polls")
+    parser.add_argument('--gamecast', action='store_true', help="Also poll live games' gamecast (latest play)")
+    parser.add_argument('--live-interval', type=float, help="Seconds between polls during play")
+    parser.add_argument('--duration', type=float, help="Stop after this many seconds")
+    parser.add_argument('--log-format', choices=['text', 'json'], default='text')
+    args = parser.parse_args(argv)
+
+    configure_logging(fmt=args.log_format, quiet=True)
+    intervals = {'live': args.live_interval} if args.live_interval else None
+    try:
+        live = LiveGames(parse_follow(args.follow), intervals=intervals, budget=args.budget,
+                         gamecast=args.gamecast)
+    except ValueError as e:
+        parser.error(str(e))
+
+    def show(sport, game_id, changes, game):
+        score = f"{game.get('away_team')} {game.get('away_score')} @ {game.get('home_team')} {game.get('home_score')}"
+        print(f"🏟️  [{sport}] {score} ({game.get('detail')})  changed: {', '.join(sorted(changes))}")
+
+    live.subscribe(show)
+    live.run(duration=args.duration)
+    print(f"\n📡 Live polling done: {live.stats}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""
+Fuzzy player name search
+A trigram inverted index over every player name the crawler has extracted:
+each name is split into padded character trigrams, each trigram keeps the
+ids of the names containing it, and a query is scored against all names at
+once (Dice overlap via NumPy bincount), so typos still find the player.
+Each crawled team's roster replaces its indexed players, and the index saves
+as a compact .npz (CSR postings + JSON records) that loads in milliseconds
+"""
+
+import json
+import os
+import re
+import unicodedata
+from array import array
+
+import numpy as np
+
+# Saved next to the per-sport directories by batch runs
+NAME_INDEX_FILE = 'player_names.npz'
+
+
+def normalize_name(name):
+    """Lowercase ASCII letters/digits, single spaces ('Nikola Jokić' -> 'nikola jokic')"""
+    name = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode()
+    return ' '.join(re.sub(r"[^a-z0-9]+", ' ', name.lower()).split())
+
+
+def trigrams(name):
+    """Distinct padded trigrams of a normalized name"""
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Trigram index of player records
+    Records are keyed by (sport, team, player id or normalized name), so a
+    re-scraped roster updates players in place instead of duplicating them
+    """
+
+    def __init__(self):
+        self.records = []       # id -> player record (with sport/team)
+        self.names = []         # id -> normalized name
+        self.sizes = array('I')  # id -> number of trigrams
+        self.alive = array('B')  # id -> 0 once replaced
+        self.postings = {}      # trigram -> array('I') of ids
+        self._ids = {}          # record key -> id
+        self._sports = {}       # sport -> code, for filtering
+        self.sport_codes = array('H')
+
+    def _key(self, sport, team, player):
+        player_id = player.get('player_id', 'N/A')
+        if player_id and player_id != 'N/A':
+            return sport, team, str(player_id)
+        return sport, team, normalize_name(player.get('name', ''))
+
+    def add(self, sport, team, player):
+        """Add or update one player; returns its id (None if it has no usable name)"""
+        name = normalize_name(player.get('name', ''))
+        if not name or name == 'n a':
+            return None
+        record = dict(player, sport=sport, team=team)
+        key = self._key(sport, team, player)
+
+        existing = self._ids.get(key)
+        if existing is not None:
+            if self.names[existing] == name:
+                self.records[existing] = record
+                return existing
+            self.alive[existing] = 0  # renamed: index the new spelling under a new id
+
+        player_id = len(self.records)
+        grams = trigrams(name)
+        self.records.append(record)
+        self.names.append(name)
+        self.sizes.append(len(grams))
+        self.alive.append(1)
+        self.sport_codes.append(self._sports.setdefault(sport, len(self._sports)))
+        for gram in grams:
+            self.postings.setdefault(gram, array('I')).append(player_id)
+        self._ids[key] = player_id
+        return player_id
+
+    def add_roster(self, sport, team, roster):
+        """Index every player of a scraped roster; returns how many were added or updated"""
+        return sum(self.add(sport, team, player) is not None for player in roster)
+
+    def replace_team(self, sport, team, roster):
+        """
+        Make a freshly crawled roster the team's whole list: its players are
+        added or updated and the team's other players retired, so a traded or
+        released player stops matching under the old team. Returns how many
+        players the team now has
+        """
+        kept = {self.add(sport, team, player) for player in roster} - {None}
+        for key, player_id in list(self._ids.items()):
+            if key[0] == sport and key[1] == team and player_id not in kept:
+                self.alive[player_id] = 0
+                del self._ids[key]
+        return len(kept)
+
+    def search(self, query, k=10, sport=None, team=None, min_score=0.3):
+        """
+        Top-k (score, record) for a possibly misspelled name, best first
+        score is the Dice overlap of trigram sets (1.0 = same trigrams)
+        """
+        name = normalize_name(query)
+        if not name or not self.records:
+            return []
+        grams = [gram for gram in trigrams(name) if gram in self.postings]
+        if not grams:
+            return []
+
+        ids = np.concatenate([np.frombuffer(self.postings[gram], dtype=np.uint32) for gram in grams])
+        overlap = np.bincount(ids, minlength=len(self.records))
+        sizes = np.frombuffer(self.sizes, dtype=np.uint32)
+        scores = 2.0 * overlap / (len(trigrams(name)) + sizes)
+        scores[np.frombuffer(self.alive, dtype=np.uint8) == 0] = 0
+        if sport is not None:
+            code = self._sports.get(sport)
+            if code is None:
+                return []
+            scores[np.frombuffer(self.sport_codes, dtype=np.uint16) != code] = 0
+        if team is not None:
+            candidates = np.flatnonzero(scores >= min_score)
+            keep = np.array([self.records[i]['team'] == team for i in candidates], dtype=bool)
+            scores[candidates[~keep]] = 0
+
+        candidates = np.flatnonzero(scores >= min_score)
+        if candidates.size > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        ranked = sorted(candidates.tolist(), key=lambda i: (-scores[i], self.names[i]))
+        return [(round(float(scores[i]), 4), self.records[i]) for i in ranked]
+
+    @classmethod
+    def from_data_dir(cls, data_dir):
+        """Index every roster in a data directory of {sport}/{team}.json files"""
+        index = cls()
+        for sport in sorted(os.listdir(data_dir)):
+            directory = os.path.join(data_dir, sport)
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if name.endswith('.json'):
+                    with open(os.path.join(directory, name)) as f:
+                        index.add_roster(sport, name[:-len('.json')], json.load(f).get('roster', []))
+        return index
+
+    def save(self, path):
+        """Write the index as an .npz: CSR postings, per-name arrays and JSON records (atomic)"""
+        grams = sorted(self.postings)
+        lengths = np.array([len(self.postings[gram]) for gram in grams], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        data = (np.concatenate([np.frombuffer(self.postings[gram], dtype=np.uint32) for gram in grams])
+                if grams else np.zeros(0, dtype=np.uint32))
+        meta = {
+            'grams': grams,
+            'records': self.records,
+            'names': self.names,
+            'keys': [[*key, player_id] for key, player_id in self._ids.items()],
+            'sports': self._sports
+        }
+        blob = np.frombuffer(json.dumps(meta, separators=(',', ':')).encode(), dtype=np.uint8)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, data=data, offsets=offsets, sizes=np.frombuffer(self.sizes, dtype=np.uint32),
+                     alive=np.frombuffer(self.alive, dtype=np.uint8),
+                     sport_codes=np.frombuffer(self.sport_codes, dtype=np.uint16), meta=blob)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as saved:
+            data = saved['data']
+            offsets = saved['offsets']
+            arrays = {name: saved[name].tobytes() for name in ('sizes', 'alive', 'sport_codes')}
+            meta = json.loads(saved['meta'].tobytes())
+
+        index = cls()
+        index.records = meta['records']
+        index.names = meta['names']
+        index.sizes = array('I', arrays['sizes'])
+        index.alive = array('B', arrays['alive'])
+        index.sport_codes = array('H', arrays['sport_codes'])
+        index._sports = meta['sports']
+        index._ids = {tuple(key[:3]): key[3] for key in meta['keys']}
+        for i, gram in enumerate(meta['grams']):
+            index.postings[gram] = array('I', data[offsets[i]:offsets[i + 1]].tobytes())
+        return index
+
+    def __len__(self):
+        return sum(self.alive)
@@ -0,0 +1,294 @@
+"""
+Serve mode: a local HTTP/JSON query API over crawled data
+Loads the per-team files a crawl writes (output_dir/{sport}/{team}.json) into
+in-memory indexes with the JSON responses encoded up front, so a query is a
+dict lookup and a socket write. The data directory is watched and changed
+teams are reloaded when a crawl (or refresh mode) rewrites them
+
+    python query_server.py --data-dir batch_output --port 8765
+    curl localhost:8765/nba/houston-rockets/roster
+    curl localhost:8765/nba/houston-rockets/player/7
+    curl localhost:8765/nba/houston-rockets/schedule
+    curl 'localhost:8765/search?q=fred+van+fleet&k=3'
+
+    python query_server.py --data-dir batch_output --benchmark
+"""
+
+import argparse
+import http.client
+import json
+import os
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote
+
+from crawl_logging import get_logger, configure_logging
+from jersey_index import JerseyIndex
+from name_index import NameIndex
+
+log = get_logger('serve')
+
+NOT_FOUND = json.dumps({'error': 'not found'}).encode()
+
+
+def _encode(value):
+    return json.dumps(value, separators=(',', ':')).encode()
+
+
+class TeamIndex:
+    """One team's data with every response body pre-encoded"""
+
+    def __init__(self, sport, team, data):
+        self.sport = sport
+        self.team = team
+        self.roster = data.get('roster', [])
+        self.schedule = data.get('schedule', [])
+        self.news = data.get('news', [])
+        self.bodies = {
+            'roster': _encode({'sport': sport, 'team': team, 'players': self.roster}),
+            'schedule': _encode({'sport': sport, 'team': team, 'games': self.schedule}),
+            'news': _encode({'sport': sport, 'team': team, 'articles': self.news}),
+        }
+
+
+class DataStore:
+    """In-memory indexes over a data directory, reloaded team by team as files change"""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.teams = {}      # (sport, team) -> TeamIndex
+        self.jerseys = (JerseyIndex.build({}), [])  # jersey index, encoded player per index position
+        self.names = NameIndex()
+        self._mtimes = {}    # path -> (mtime, size) last loaded
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._stop = threading.Event()
+        self.version = 0
+        self.loaded_at = None
+
+    def _team_files(self):
+        """{path: (sport, team)} for every team file under the data directory"""
+        files = {}
+        if not os.path.isdir(self.data_dir):
+            return files
+        for sport in os.listdir(self.data_dir):
+            directory = os.path.join(self.data_dir, sport)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                if name.endswith('.json'):
+                    files[os.path.join(directory, name)] = (sport, name[:-len('.json')])
+        return files
+
+    def reload(self):
+        """Load new or changed team files and drop removed ones; returns teams reloaded"""
+        with self._lock:
+            files = self._team_files()
+            teams = dict(self.teams)
+            changed = 0
+            for path, key in files.items():
+                try:
+                    stat = os.stat(path)
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                    if self._mtimes.get(path) == signature:
+                        continue
+                    with open(path) as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    # Mid-write or unreadable: keep serving the old copy, retry next scan
+                    log.warning("Skipping %s: %s", path, e)
+                    continue
+                teams[key] = TeamIndex(key[0], key[1], data)
+                self._mtimes[path] = signature
+                changed += 1
+
+            removed = [path for path in self._mtimes if path not in files]
+            for path in removed:
+                del self._mtimes[path]
+            keep = set(files.values())
+            teams = {key: index for key, index in teams.items() if key in keep}
+
+            if changed or removed:
+                jerseys = JerseyIndex.build({key: index.roster for key, index in teams.items()})
+                # Swap in one assignment each: readers see the old or the new set, never half of each
+                self.jerseys = (jerseys, [_encode(player) for player in jerseys.players])
+                names = NameIndex()
+                for (sport, team), index in teams.items():
+                    names.add_roster(sport, team, index.roster)
+                self.names = names
+                self.teams = teams
+                self.version += 1
+                self.loaded_at = time.time()
+                log.info("🔄 Loaded %d team files (%d teams served, version %d)",
+                         changed, len(teams), self.version)
+            return changed
+
+    def watch(self, interval=1.0):
+        """Poll the data directory from a background thread"""
+        def loop():
+            while not self._stop.wait(interval):
+                self.reload()
+
+        self._watcher = threading.Thread(target=loop, daemon=True)
+        self._watcher.start()
+        return self._watcher
+
+    def stop(self):
+        self._stop.set()
+
+    def query(self, path):
+        """(status, body) for a request path"""
+        path, _, query = path.partition('?')
+        parts = [unquote(part) for part in path.strip('/').split('/')]
+        if parts == ['search']:
+            return self.search(parse_qs(query))
+        if parts == ['teams']:
+            return 200, _encode(sorted(f"{sport}/{team}" for sport, team in self.teams))
+        if parts == ['health']:
+            return 200, _encode({'teams': len(self.teams), 'version': self.version, 'loaded_at': self.loaded_at})
+
+        index = self.teams.get((parts[0], parts[1])) if len(parts) >= 3 else None
+        if index is None:
+            return 404, NOT_FOUND
+        if len(parts) == 3 and parts[2] in index.bodies:
+            return 200, index.bodies[parts[2]]
+        if len(parts) == 4 and parts[2] == 'player':
+            jerseys, bodies = self.jerseys
+            position = jerseys.position(parts[0], parts[1], parts[3])
+            if position is not None:
+                return 200, bodies[position]
+        return 404, NOT_FOUND
+
+    def search(self, params):
+        """/search?q=name[&k=5][&sport=nba][&team=...]: fuzzy player name matches"""
+        name = params.get('q', [''])[0]
+        if not name:
+            return 400, _encode({'error': 'missing q'})
+        try:
+            k = max(1, min(int(params.get('k', ['10'])[0]), 100))
+        except ValueError:
+            return 400, _encode({'error': 'bad k'})
+        matches = self.names.search(name, k=k, sport=params.get('sport', [None])[0],
+                                    team=params.get('team', [None])[0])
+        return 200, _encode({'query': name, 'matches': [dict(record, score=score) for score, record in matches]})
+
+
+def serve(store, port=8765, host='127.0.0.1'):
+    """Serve the store's queries from a background thread; returns the server"""
+
+    class Handler(BaseHTTPRequestHandler):
+        # Keep-alive: a client polling from a video loop reuses one connection
+        protocol_version = 'HTTP/1.1'
+        # Headers and body go out as separate writes; don't let Nagle hold the body back
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            status, body = store.query(self.path)
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'p50_us': round(statistics.median(ordered) * 1e6, 2),
+        'p99_us': round(ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1e6, 2),
+        'max_us': round(ordered[-1] * 1e6, 2)
+    }
+
+
+def benchmark_paths(store, limit=200):
+    """A mix of roster, schedule and player queries over the loaded teams"""
+    paths = []
+    for (sport, team), index in list(store.teams.items())[:limit]:
+        paths += [f"/{sport}/{team}/roster", f"/{sport}/{team}/schedule"]
+        paths += [f"/{sport}/{team}/player/{player['number']}" for player in index.roster[:5]]
+    return paths
+
+
+def latency_benchmark(store, queries=10000, server=None):
+    """
+    Per-query latency of the store (in-process) and, given a running server,
+    of HTTP round trips over one keep-alive connection
+    """
+    paths = benchmark_paths(store)
+    if not paths:
+        return {}
+    results = {}
+
+    samples = []
+    for i in range(queries):
+        start = time.perf_counter()
+        store.query(paths[i % len(paths)])
+        samples.append(time.perf_counter() - start)
+    results['in_process'] = _summary(samples)
+
+    if server is not None:
+        host, port = server.server_address[:2]
+        connection = http.client.HTTPConnection(host, port)
+        samples = []
+        for i in range(min(queries, 2000)):
+            start = time.perf_counter()
+            connection.request('GET', paths[i % len(paths)])
+            connection.getresponse().read()
+            samples.append(time.perf_counter() - start)
+        connection.close()
+        results['http'] = _summary(samples)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local query API over crawled team data")
+    parser.add_argument('--data-dir', default='batch_output', help="Directory with {sport}/{team}.json files")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--reload-interval', type=float, default=1.0, help="Seconds between data dir scans")
+    parser.add_argument('--benchmark', action='store_true', help="Measure query latency and exit")
+    parser.add_argument('--queries', type=int, default=10000)
+    parser.add_argument('--log-format', choices=['text', 'json'], default='text')
+    parser.add_argument('--quiet', action='store_true', help="Warnings only")
+    args = parser.parse_args(argv)
+
+    configure_logging(fmt=args.log_format, quiet=args.quiet)
+    store = DataStore(args.data_dir)
+    store.reload()
+    server = serve(store, port=args.port, host=args.host)
+
+    if args.benchmark:
+        results = latency_benchmark(store, queries=args.queries, server=server)
+        server.shutdown()
+        if not results:
+            parser.error(f"no team data under {args.data_dir}")
+        for name, result in results.items():
+            print(f"{name:<12} p50 {result['p50_us']:>8.1f} µs   p99 {result['p99_us']:>8.1f} µs   "
+                  f"({result['count']} queries)")
+        return
+
+    store.watch(args.reload_interval)
+    print(f"🛰️  Serving {len(store.teams)} teams from {args.data_dir} on http://{args.host}:{server.server_address[1]}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.stop()
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
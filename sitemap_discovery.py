@@ -0,0 +1,207 @@
+"""
+Sitemap-driven discovery
+Reads ESPN-style sitemap and sitemap-index XML with a streaming pull parser
+(plain or gzipped, from URLs or local files), runs every entry through a
+crawler's filters and seeds its frontier directly, so team pages are found
+without fetching hub pages for links. Player pages carry no team, so they
+are left to each team's roster-driven player stage.
+Each URL's lastmod is kept so refresh mode can skip pages that haven't changed
+"""
+
+import os
+import zlib
+from collections import deque
+from datetime import datetime, timezone
+from xml.etree import ElementTree
+
+import requests
+
+from crawl_logging import get_logger
+from fetch_coordinator import canonical_url
+from sports_crawler import PLAYER_URL_PATTERN
+
+log = get_logger('sitemap')
+
+CHUNK_SIZE = 64 * 1024
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _local_name(tag):
+    """Tag without its XML namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def parse_lastmod(value):
+    """W3C datetime ('2024-01-15', '2024-01-15T10:00:00Z', ...) as epoch seconds, or None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _gunzip(chunks):
+    """Decompress gzipped chunks on the fly; plain chunks pass through"""
+    decompressor = None
+    for i, chunk in enumerate(chunks):
+        if i == 0 and chunk.startswith(GZIP_MAGIC):
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if decompressor is None:
+            yield chunk
+        else:
+            yield decompressor.decompress(chunk)
+    if decompressor is not None:
+        yield decompressor.flush()
+
+
+def iter_sitemap(chunks):
+    """
+    Stream (kind, loc, lastmod) from sitemap XML chunks
+    kind is 'sitemap' for sitemap-index children and 'url' for page entries;
+    each entry is detached from the root once read so memory stays flat on
+    large files
+    """
+    parser = ElementTree.XMLPullParser(events=('start', 'end'))
+    root = []
+    for chunk in _gunzip(chunks):
+        parser.feed(chunk)
+        yield from _read_entries(parser, root)
+    parser.close()
+    yield from _read_entries(parser, root)
+
+
+def _read_entries(parser, root):
+    for event, element in parser.read_events():
+        if event == 'start':
+            if not root:
+                root.append(element)
+            continue
+        kind = _local_name(element.tag)
+        if kind not in ('url', 'sitemap'):
+            continue
+        fields = {_local_name(child.tag): (child.text or '').strip() for child in element}
+        # Clearing the entry alone would leave an empty element per entry on the root
+        # (entries still being parsed are held by the parser, not the root)
+        root[0].clear()
+        if fields.get('loc'):
+            yield kind, fields['loc'], parse_lastmod(fields.get('lastmod'))
+
+
+class SitemapDiscovery:
+    """
+    Loads sitemap entries once and seeds team crawlers from them
+    sources: sitemap / sitemap-index URLs or local paths
+    sport: keep only entries under /{sport}/ (cheap prefilter while streaming)
+    child_filter: optional predicate on child sitemap URLs in an index
+    """
+
+    def __init__(self, sources, session=None, sport=None, max_sitemaps=100, timeout=10, child_filter=None):
+        self.sources = [sources] if isinstance(sources, str) else list(sources)
+        self.session = session or requests.Session()
+        self.sport = sport
+        self.max_sitemaps = max_sitemaps
+        self.timeout = timeout
+        self.child_filter = child_filter
+        self.lastmod = {}   # canonical URL -> lastmod epoch seconds
+        self._entries = None
+        self.stats = {'sitemaps': 0, 'entries': 0, 'kept': 0}
+
+    def _chunks(self, source):
+        """Raw bytes of a sitemap in chunks, from a URL or a local file"""
+        if source.startswith(('http://', 'https://')):
+            response = self.session.get(source, timeout=self.timeout, stream=True)
+            response.raise_for_status()
+            if hasattr(response, 'iter_content'):
+                return response.iter_content(CHUNK_SIZE)
+            return [response.content]
+
+        path = source[len('file://'):] if source.startswith('file://') else source
+
+        def read_file():
+            with open(path, 'rb') as f:
+                while True:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+        return read_file()
+
+    def _resolve(self, parent, loc):
+        """Child sitemap location; relative paths in a local index resolve next to it"""
+        if loc.startswith(('http://', 'https://', 'file://', '/')) or parent.startswith(('http://', 'https://')):
+            return loc
+        return os.path.join(os.path.dirname(parent), loc)
+
+    def reload(self):
+        """Reread the sitemaps, picking up new entries and lastmod dates"""
+        self._entries = None
+        self.lastmod = {}
+        self.stats = {'sitemaps': 0, 'entries': 0, 'kept': 0}
+        return self.entries()
+
+    def entries(self):
+        """Every page entry [(url, lastmod)] across the sitemaps (loaded once, until reload())"""
+        if self._entries is not None:
+            return self._entries
+
+        entries = []
+        pending = deque(self.sources)
+        seen = set()
+        prefix = f"/{self.sport}/" if self.sport else None
+
+        while pending and self.stats['sitemaps'] < self.max_sitemaps:
+            source = pending.popleft()
+            if source in seen:
+                continue
+            seen.add(source)
+            self.stats['sitemaps'] += 1
+
+            try:
+                for kind, loc, lastmod in iter_sitemap(self._chunks(source)):
+                    if kind == 'sitemap':
+                        if self.child_filter is None or self.child_filter(loc):
+                            pending.append(self._resolve(source, loc))
+                        continue
+                    self.stats['entries'] += 1
+                    if prefix and prefix not in loc:
+                        continue
+                    # Player pages would pass every team's filters; rosters find them instead
+                    if not PLAYER_URL_PATTERN.search(loc):
+                        entries.append((loc, lastmod))
+                    if lastmod is not None:
+                        self.lastmod[canonical_url(loc)] = lastmod
+            except Exception as e:
+                log.warning("Sitemap %s failed: %s", source, e, extra={'url': source})
+
+        self.stats['kept'] = len(entries)
+        self._entries = entries
+        return entries
+
+    def seed(self, crawler, skip_hubs=True):
+        """
+        Put the sitemap's URLs for this team into its seeds. With skip_hubs,
+        link-only seed pages are dropped once the sitemap has supplied pages
+        with extractors. Returns the URLs added
+        """
+        added = []
+        for url, _ in self.entries():
+            if url not in crawler.seed_urls and crawler._should_crawl_url(url):
+                added.append(url)
+
+        routed = [url for url in added if crawler._page_type(url) != 'link']
+        seeds = routed + [url for url in crawler.seed_urls + added if url not in routed]
+        if skip_hubs and routed:
+            seeds = [url for url in seeds if crawler._page_type(url) != 'link']
+        crawler.seed_urls = seeds
+        added = [url for url in added if url in seeds]
+
+        log.info("🗺️  %s: %d URLs from sitemap", crawler.team_name, len(added),
+                 extra={'sport': crawler.sport, 'team': crawler.team_name})
+        return added
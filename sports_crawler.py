@@ -2,32 +2,116 @@ import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+import json
+import os
 import time
 import re
 from sports_data import espn_sports, nba_teams, all_teams
+from sports_stats import extract_stat_matrices, combine_stat_matrices, pick_leader_column
+from fetch_coordinator import FetchCoordinator, canonical_url
+from extractors import default_registry
+from link_scanner import scan_links
+from table_scoring import default_scorer
+from jersey_index import JerseyIndex, JERSEY_INDEX_FILE
+from crawl_logging import get_logger, ContextAdapter, configure_logging, info_enabled
+from crawl_metrics import default_metrics
+
+# League-level progress (per-team lines)
+log = get_logger('league')
+
+# Responses worth retrying (rate limited / transient server errors)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# ESPN player page URLs carry a numeric player id
+PLAYER_URL_PATTERN = re.compile(r"/player/(?:[^/]+/)*_/id/(\d+)")
+
+# Schedule rows link to game pages carrying a numeric game id
+GAME_URL_PATTERN = re.compile(r"/game/_/gameId/(\d+)")
+
+# Minimum records per data type before a team's crawl can stop early.
+# 'schedule': 1 stands in for "a season": ESPN team schedule pages list the
+# whole season on one page, so the first schedule row means the season's page
+# was found. Season lengths differ too much by sport (and preseason/postseason
+# splits) for a fixed row count to work as a goal
+DEFAULT_GOALS = {'roster': 10, 'schedule': 1, 'news': 5}
 
 class SportsCrawler:
-    def __init__(self, sport, team_name, team_abbrev):
+    def __init__(self, sport, team_name, team_abbrev, session=None, coordinator=None, extractors=None,
+                 metrics=None, base_url=None, rate_limiter=None, table_scorer=None, cache=None,
+                 season=None):
         self.sport = sport
         self.team_name = team_name
         self.team_abbrev = team_abbrev
-        self.base_url = "https://www.espn.com"
+        self.base_url = base_url or "https://www.espn.com"
+        
+        # Past season to crawl (e.g. 2019); None crawls the current season
+        self.season = season
         
         # Crawl frontier - BFS queue
         self.url_queue = deque()
         self.visited_urls = set()
+        self.url_parents = {}  # url -> (parent url, depth) for traces
+        self.page_log = []     # per crawled page: url and records yielded per data type
         self.scraped_data = {
             'roster': [],
             'schedule': [],
             'news': [],
-            'stats': []
+            'stats': [],
+            'players': []
         }
         
+        # Player pages are fetched by the player-detail stage, not the BFS frontier
+        self.player_urls = {}  # player id -> player page URL
+        self.crawled_player_ids = set()
+        
         # Request headers
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
+        # Shared HTTP session (keeps connections warm between pages)
+        self.session = session or requests.Session()
+        
+        # Request timeout and retry policy (429 / 5xx / timeouts / broken bodies)
+        self.timeout = 10
+        self.max_retries = 2
+        self.retry_backoff = 1.0
+        self.retry_count = 0
+        
+        # Why the last crawl() stopped: 'goals', 'budget' or 'frontier'
+        self.stop_reason = None
+        
+        # Optional crawl_trace.CrawlTrace, set for the duration of crawl(trace=...)
+        self.trace = None
+        
+        # League-scoped coordinator shares page loads across team crawlers
+        self.coordinator = coordinator
+        
+        # Optional fetch_coordinator.RateLimiter shared by every crawler in the process
+        self.rate_limiter = rate_limiter
+        
+        # URL -> extractor routing (and per-extractor timing)
+        self.extractors = extractors or default_registry
+        # Registry counters when the last crawl() started (the default registry is shared)
+        self.extractor_start = None
+        
+        # Optional extraction_cache.ExtractionCache: parsed results reused across crawls in this process
+        self.cache = cache
+        
+        # Roster table weights (table_scoring; table_weights.json if present)
+        self.table_scorer = table_scorer or default_scorer
+        
+        # Link-only pages (no extractor) skip the DOM: links come straight from the bytes
+        self.fast_links = True
+        
+        # Per-stage latency histograms and counters (see crawl_metrics)
+        self.metrics = metrics or default_metrics
+        
+        # Every record from this crawler carries its sport and team
+        self.log = ContextAdapter(get_logger('crawler'), {'sport': sport, 'team': team_name})
+        
         # Initialize seed URLs
         self.seed_urls = self._generate_seed_urls()
         
@@ -41,6 +125,12 @@ class SportsCrawler:
             rf"/{sport}/player/.*"  # Individual player pages
         ]
         
+        # Past seasons stay on that season's pages (team hubs and player pages show the current one)
+        if season is not None:
+            self.include_patterns = [
+                rf"/{sport}/team/(roster|schedule|stats)/_/name/{team_abbrev}/season/{season}(/|$)"
+            ]
+        
         self.exclude_patterns = [
             r"/login",
             r"/register", 
@@ -58,6 +148,10 @@ class SportsCrawler:
     
     def _generate_seed_urls(self):
         """Generate starting URLs for the crawler"""
+        if self.season is not None:
+            return [f"{self.base_url}/{self.sport}/team/{section}/_/name/{self.team_abbrev}/season/{self.season}"
+                    for section in ('roster', 'schedule', 'stats')]
+        
         base_team_url = f"{self.base_url}/{self.sport}/team/_/name/{self.team_abbrev}/{self.team_name}"
         
         seed_urls = [
@@ -84,8 +178,131 @@ class SportsCrawler:
         
         return False
     
-    def _extract_links(self, soup, current_url):
-        """Extract and filter links from the current page"""
+    def _page_type(self, url):
+        """Page type label for metrics: the routed extractor, or 'link' for link-only pages"""
+        extractor = self.extractors.route(url)
+        return extractor.name if extractor else 'link'
+    
+    def _metric_labels(self, page_type):
+        return {'sport': self.sport, 'team': self.team_name, 'page_type': page_type}
+    
+    def _span(self, name, **args):
+        """Trace span for this crawler's track (no-op without a trace)"""
+        if self.trace is None:
+            return nullcontext(args)
+        return self.trace.span(name, self.sport, self.team_name, **args)
+    
+    def _enqueue(self, url, parent=None):
+        """Add a URL to the frontier, remembering its parent and depth"""
+        if url not in self.url_parents:
+            depth = self.url_parents[parent][1] + 1 if parent in self.url_parents else 0
+            self.url_parents[url] = (parent, depth)
+        self.url_queue.append(url)
+        if self.trace is not None:
+            parent, depth = self.url_parents[url]
+            self.trace.instant('queued', self.sport, self.team_name, url=url, parent=parent, depth=depth)
+    
+    def _fetch(self, url, timeout=None):
+        """Fetch a URL, retrying rate limits and transient failures with backoff"""
+        with self._span('fetch', url=url) as span:
+            response = self._fetch_with_retries(url, timeout)
+            span['status'] = response.status_code
+            span['bytes'] = len(response.content)
+            return response
+    
+    def _fetch_with_retries(self, url, timeout=None):
+        timeout = timeout or self.timeout
+        attempt = 0
+        
+        while True:
+            try:
+                response = self._fetch_once(url, timeout)
+            except requests.RequestException:
+                # Timeouts, connection resets, truncated bodies
+                if attempt >= self.max_retries:
+                    raise
+                wait = self.retry_backoff * (2 ** attempt)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response
+                wait = self._retry_after(response, self.retry_backoff * (2 ** attempt))
+            
+            attempt += 1
+            self.retry_count += 1
+            self.metrics.retries.inc(sport=self.sport, team=self.team_name)
+            self.log.debug("    Retry %d for %s in %.2fs", attempt, url, wait, extra={'url': url})
+            time.sleep(wait)
+    
+    def _retry_after(self, response, default):
+        """Seconds to wait from a Retry-After header, else the backoff default"""
+        value = getattr(response, 'headers', {}).get('Retry-After')
+        try:
+            return min(float(value), 60.0)
+        except (TypeError, ValueError):
+            return default
+    
+    def _fetch_once(self, url, timeout):
+        """One GET with the crawler's session and headers, recorded in metrics"""
+        labels = self._metric_labels(self._page_type(url))
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+        start = time.perf_counter()
+        response = self.session.get(url, headers=self.headers, timeout=timeout)
+        total = time.perf_counter() - start
+        
+        # requests' elapsed runs from sending the request until the headers are parsed
+        # (connection setup plus the server's time to first byte); the rest is the body
+        elapsed = getattr(response, 'elapsed', None)
+        ttfb = min(elapsed.total_seconds(), total) if elapsed is not None else total
+        self.metrics.observe_stage('ttfb', ttfb, **labels)
+        self.metrics.observe_stage('download', total - ttfb, **labels)
+        self.metrics.responses.inc(sport=self.sport, team=self.team_name, status=response.status_code)
+        self.metrics.response_bytes.inc(len(response.content), **labels)
+        return response
+    
+    def _remember_player_url(self, url):
+        """Record a player page URL for the player-detail stage"""
+        match = PLAYER_URL_PATTERN.search(url)
+        if match and match.group(1) not in self.player_urls:
+            self.player_urls[match.group(1)] = url
+        return match is not None
+    
+    def _fetch_and_parse(self, url):
+        """Fetch and parse a page into its extracted records and outgoing links"""
+        if self.cache is not None:
+            return self.cache.load(url, lambda: self._fetch(url).content,
+                                   lambda content: self._parse_page(url, content))
+        return self._parse_page(url, self._fetch(url).content)
+    
+    def _parse_page(self, url, content):
+        """Extracted records and outgoing links from a page's raw bytes"""
+        labels = self._metric_labels(self._page_type(url))
+        
+        if self.fast_links and self.extractors.route(url) is None:
+            with self._span('parse', url=url, fast=True), self.metrics.time_stage('parse', **labels):
+                links = scan_links(content, url)
+            return {'url': url, 'records': {}, 'links': links}
+        
+        with self._span('parse', url=url), self.metrics.time_stage('parse', **labels):
+            soup = BeautifulSoup(content, 'html.parser')
+        with self._span('extract', url=url), self.metrics.time_stage('extract', **labels):
+            records = self._extract_page_records(url, soup)
+        
+        return {
+            'url': url,
+            'records': records,
+            'links': self._page_links(soup, url)
+        }
+    
+    def _load_page(self, url):
+        """Load a parsed page, through the league coordinator when there is one"""
+        if self.coordinator is not None:
+            return self.coordinator.get(url, lambda: self._fetch_and_parse(url))
+        return self._fetch_and_parse(url)
+    
+    def _page_links(self, soup, current_url):
+        """Return every outgoing link on a page as a clean absolute URL"""
         links = []
         
         for link in soup.find_all('a', href=True):
@@ -100,14 +317,21 @@ class SportsCrawler:
             if parsed.query:
                 clean_url += f"?{parsed.query}"
             
-            # Check if we should crawl this URL
-            if (clean_url not in self.visited_urls and 
-                self._should_crawl_url(clean_url) and
-                clean_url.startswith(self.base_url)):
-                links.append(clean_url)
+            links.append(clean_url)
         
         return links
     
+    def _filter_links(self, links):
+        """Keep links this crawler should follow"""
+        return [url for url in links
+                if (url not in self.visited_urls and 
+                    self._should_crawl_url(url) and
+                    url.startswith(self.base_url))]
+    
+    def _extract_links(self, soup, current_url):
+        """Extract and filter links from the current page"""
+        return self._filter_links(self._page_links(soup, current_url))
+    
     def _scrape_roster_page(self, soup):
         """Extract roster information from roster page"""
         roster_data = []
@@ -116,12 +340,12 @@ class SportsCrawler:
         roster_table = self._find_roster_table_improved(soup)
         
         if not roster_table:
-            print(f"    ❌ No roster table found on page")
+            self.log.debug("    ❌ No roster table found on page")
             return roster_data
         
         if roster_table:
             rows = roster_table.find_all('tr')
-            print(f"    DEBUG: Processing {len(rows)} rows from roster table")
+            self.log.debug("    Processing %d rows from roster table", len(rows))
             
             for row in rows[1:]:  # Skip header
                 cells = row.find_all('td')
@@ -130,8 +354,16 @@ class SportsCrawler:
                     name_cell = cells[1] if len(cells) > 1 else None
                     player_name = 'N/A'
                     player_number = 'N/A'
+                    player_id = 'N/A'
+                    player_url = 'N/A'
                     
                     if name_cell:
+                        # Player profile link gives the id for the player-detail stage
+                        player_link = name_cell.find('a', href=PLAYER_URL_PATTERN)
+                        if player_link:
+                            player_url = urljoin(self.base_url, player_link['href'])
+                            player_id = PLAYER_URL_PATTERN.search(player_url).group(1)
+                        
                         # Look for the number in the specific class
                         number_element = name_cell.find(class_='pl2 n10')
                         if number_element:
@@ -143,7 +375,7 @@ class SportsCrawler:
                         player_name = name_cell.get_text(strip=True)
                     
                     # Debug: Show what we're extracting
-                    print(f"      DEBUG: Extracted name='{player_name}', number='{player_number}'")
+                    self.log.debug("      Extracted name=%r, number=%r", player_name, player_number)
                     
                     # Only add if we found a real player name (not team names)
                     if (player_name != 'N/A' and 
@@ -157,106 +389,38 @@ class SportsCrawler:
                             'age': cells[3].get_text(strip=True) if len(cells) > 3 else 'N/A',
                             'height': cells[4].get_text(strip=True) if len(cells) > 4 else 'N/A',
                             'weight': cells[5].get_text(strip=True) if len(cells) > 5 else 'N/A',
-                            'college': cells[6].get_text(strip=True) if len(cells) > 6 else 'N/A'
+                            'college': cells[6].get_text(strip=True) if len(cells) > 6 else 'N/A',
+                            'player_id': player_id,
+                            'player_url': player_url
                         }
                         roster_data.append(player_info)
+                        
+                        if player_id != 'N/A':
+                            self._remember_player_url(player_url)
         
         return roster_data
     
     def _find_roster_table_improved(self, soup):
         """
         Improved roster table detection using multiple strategies
-        Returns the table most likely to contain roster data
+        Returns the table most likely to contain roster data: every table's
+        features are scored in one pass against the crawler's table weights
         """
+        score_start = time.perf_counter()
         
         tables = soup.find_all('table')
-        print(f"    DEBUG: Analyzing {len(tables)} tables for roster data")
-        table_scores = []
+        self.log.debug("    Analyzing %d tables for roster data", len(tables))
+        best = self.table_scorer.best(tables)
+        self.metrics.observe_stage('score', time.perf_counter() - score_start, **self._metric_labels('roster'))
         
-        for i, table in enumerate(tables):
-            score = 0
-            reasons = []
-            
-            # STRATEGY 1: Header Analysis (Weight: 30 points)
-            header_row = table.find('thead') or table.find('tr')
-            if header_row:
-                header_text = header_row.get_text().lower()
-                roster_keywords = ['name', 'player', '#', 'no', 'pos', 'age', 'height', 'weight', 'college']
-                header_matches = sum(1 for keyword in roster_keywords if keyword in header_text)
-                
-                if header_matches >= 3:
-                    score += 30
-                    reasons.append(f"Headers match ({header_matches} keywords)")
-            
-            # STRATEGY 2: Jersey Numbers (Weight: 25 points)
-            jersey_elements = table.find_all(class_='pl2 n10')
-            if len(jersey_elements) >= 5:
-                score += 25
-                reasons.append(f"Jersey numbers ({len(jersey_elements)} found)")
-            elif len(jersey_elements) >= 1:
-                score += 10
-                reasons.append(f"Some jersey numbers ({len(jersey_elements)} found)")
-            
-            # STRATEGY 3: Player Profile Links (Weight: 20 points)
-            player_links = table.find_all('a', href=lambda x: x and '/player/' in x)
-            if len(player_links) >= 10:
-                score += 20
-                reasons.append(f"Many player links ({len(player_links)} found)")
-            elif len(player_links) >= 3:
-                score += 10
-                reasons.append(f"Some player links ({len(player_links)} found)")
-            
-            # STRATEGY 4: Data Patterns (Weight: 15 points)
-            rows = table.find_all('tr')[1:]  # Skip header
-            height_patterns = 0
-            weight_patterns = 0
-            
-            for row in rows[:10]:  # Check first 10 rows
-                cells = row.find_all('td')
-                row_text = ' '.join(cell.get_text() for cell in cells)
-                
-                # Look for height patterns
-                if "'" in row_text or '"' in row_text:
-                    height_patterns += 1
-                
-                # Look for weight patterns  
-                if 'lbs' in row_text or 'kg' in row_text:
-                    weight_patterns += 1
-            
-            if height_patterns >= 3:
-                score += 10
-                reasons.append(f"Height patterns ({height_patterns} found)")
-            
-            if weight_patterns >= 3:
-                score += 5
-                reasons.append(f"Weight patterns ({weight_patterns} found)")
-            
-            # STRATEGY 5: Table Size (Weight: 10 points)
-            row_count = len(table.find_all('tr'))
-            if 10 <= row_count <= 25:  # Typical roster size
-                score += 10
-                reasons.append(f"Good size ({row_count} rows)")
-            elif row_count >= 5:
-                score += 5
-                reasons.append(f"Decent size ({row_count} rows)")
-            
-            table_scores.append({
-                'table': table,
-                'score': score,
-                'reasons': reasons,
-                'index': i
-            })
-        
-        # Sort by score and return best match
-        table_scores.sort(key=lambda x: x['score'], reverse=True)
-        
-        if table_scores and table_scores[0]['score'] > 0:
-            best = table_scores[0]
-            print(f"    ✅ Selected table {best['index']} (Score: {best['score']})")
-            print(f"    Reasons: {', '.join(best['reasons'])}")
-            return best['table']
-        
-        print(f"    ❌ No good roster table found")
+        if best is not None:
+            index, score, features = best
+            self.log.debug("    ✅ Selected table %d (Score: %g)", index, score,
+                           extra={'table_index': index, 'table_score': score})
+            self.log.debug("    Reasons: %s", ', '.join(self.table_scorer.reasons(features)))
+            return tables[index]
+        
+        self.log.debug("    ❌ No good roster table found")
         return None
     
     def _scrape_schedule_page(self, soup):
@@ -283,6 +447,11 @@ class SportsCrawler:
                 if text and len(text) > 10:
                     game_info['raw_text'] = text[:100]  # Store raw text for now
                 
+                # Game id for the box score stage (shared by both teams' schedules)
+                game_link = game.find('a', href=GAME_URL_PATTERN)
+                if game_link:
+                    game_info['game_id'] = GAME_URL_PATTERN.search(game_link['href']).group(1)
+                
                 schedule_data.append(game_info)
         
         return schedule_data
@@ -298,9 +467,9 @@ class SportsCrawler:
             title_elem = article.find('h1') or article.find('h2') or article.find('h3')
             title = title_elem.get_text(strip=True) if title_elem else 'N/A'
             
-            # Look for article link
+            # Look for article link (canonical, so the same story dedupes across teams)
             link_elem = article.find('a', href=True)
-            link = urljoin(self.base_url, link_elem['href']) if link_elem else 'N/A'
+            link = canonical_url(urljoin(self.base_url, link_elem['href'])) if link_elem else 'N/A'
             
             if title != 'N/A' and len(title) > 5:
                 news_data.append({
@@ -310,35 +479,203 @@ class SportsCrawler:
         
         return news_data
     
+    def _scrape_player_page(self, soup):
+        """Extract bio and headline stat fields from a player page"""
+        player = {
+            'name': 'N/A',
+            'bio': {},
+            'stats': {}
+        }
+        
+        # Player name is split across spans in the header (first / last)
+        name_elem = soup.find('h1', class_=re.compile(r'PlayerHeader__Name')) or soup.find('h1')
+        if name_elem:
+            player['name'] = ' '.join(name_elem.stripped_strings)
+        
+        # Bio list: label / value pairs (HT/WT, BIRTHDATE, COLLEGE, ...)
+        bio_list = soup.find(class_=re.compile(r'PlayerHeader__Bio_List'))
+        if bio_list:
+            for item in bio_list.find_all('li'):
+                parts = list(item.stripped_strings)
+                if len(parts) >= 2:
+                    player['bio'][parts[0]] = ' '.join(parts[1:])
+        
+        # Headline stat blocks: label / value pairs (PTS, REB, AST, ...)
+        for block in soup.find_all(class_=re.compile(r'StatBlockInner\b')):
+            label = block.find(class_=re.compile(r'StatBlockInner__Label'))
+            value = block.find(class_=re.compile(r'StatBlockInner__Value'))
+            if label and value:
+                player['stats'][label.get_text(strip=True)] = value.get_text(strip=True)
+        
+        return player
+    
+    def _scrape_stats_page(self, soup):
+        """Extract per-player stat tables as numeric StatMatrix objects"""
+        return extract_stat_matrices(soup)
+    
+    def _extract_page_records(self, url, soup):
+        """Route a page to its extractor and return {data type: records}"""
+        return self.extractors.run(self, url, soup)
+    
+    def _store_page_records(self, records):
+        """Add extracted records to scraped_data"""
+        labels = {
+            'roster': 'roster entries',
+            'schedule': 'schedule entries',
+            'news': 'news articles',
+            'stats': 'stat tables',
+            'players': 'player pages'
+        }
+        
+        for data_type, data in records.items():
+            if not isinstance(data, list):
+                data = [data]
+            if data_type == 'news' and self.coordinator is not None:
+                # Share article records league-wide, keyed by canonical URL
+                data = [self.coordinator.register_article(article)[0] for article in data]
+            self.scraped_data[data_type].extend(data)
+            self.log.info("  → Scraped %d %s", len(data), labels.get(data_type, data_type),
+                          extra={'page_type': data_type, 'records': len(data)})
+    
     def _scrape_page_content(self, url, soup):
         """Determine page type and scrape appropriate content"""
-        if '/roster' in url:
-            roster_data = self._scrape_roster_page(soup)
-            self.scraped_data['roster'].extend(roster_data)
-            print(f"  → Scraped {len(roster_data)} roster entries")
-            
-        elif '/schedule' in url:
-            schedule_data = self._scrape_schedule_page(soup)
-            self.scraped_data['schedule'].extend(schedule_data)
-            print(f"  → Scraped {len(schedule_data)} schedule entries")
-            
-        elif '/news' in url:
-            news_data = self._scrape_news_page(soup)
-            self.scraped_data['news'].extend(news_data)
-            print(f"  → Scraped {len(news_data)} news articles")
+        self._store_page_records(self._extract_page_records(url, soup))
+    
+    def crawl_players(self, max_players=25, workers=4, delay=0.5, link_cap=2):
+        """
+        Player-detail stage: fetch the player pages discovered on the roster
+        Runs with its own page budget and concurrency, separate from max_pages.
+        At most link_cap new non-player links per player page go back into the
+        general frontier, so player pages can't flood the BFS queue.
+        """
+        pending = [(player_id, url) for player_id, url in self.player_urls.items()
+                   if player_id not in self.crawled_player_ids][:max_players]
+        if not pending:
+            return []
+        
+        self.log.info("  → Player stage: fetching %d player pages (%d workers)", len(pending), workers)
+        
+        def parse_player(url, content):
+            labels = self._metric_labels('player')
+            with self._span('parse', url=url), self.metrics.time_stage('parse', **labels):
+                soup = BeautifulSoup(content, 'html.parser')
+            with self._span('extract', url=url), self.metrics.time_stage('extract', **labels):
+                player = self.extractors.get('player').extract(self, soup)
+            return {
+                'player': player,
+                'links': self._page_links(soup, url)
+            }
+        
+        def load_player(url):
+            if self.cache is not None:
+                page = self.cache.load(url, lambda: self._fetch(url).content,
+                                       lambda content: parse_player(url, content), kind='player')
+            else:
+                page = parse_player(url, self._fetch(url).content)
+            self.metrics.pages.inc(**self._metric_labels('player'))
+            return page
+        
+        def fetch_player(item):
+            player_id, url = item
+            try:
+                # Player pages are shared across teams (trades, opponents) in a league sweep
+                if self.coordinator is not None:
+                    page = self.coordinator.get(url, lambda: load_player(url), kind='player')
+                else:
+                    page = load_player(url)
+                player = dict(page['player'], player_id=player_id, url=url)
+                links = [link for link in self._filter_links(page['links'])
+                         if not PLAYER_URL_PATTERN.search(link)]
+                return player, links
+            except Exception as e:
+                self.log.warning("    → Error crawling player %s: %s", url, e, extra={'url': url})
+                return None, []
+            finally:
+                # Respectful delay, per worker
+                with self._span('sleep'), self.metrics.time_stage('sleep', **self._metric_labels('player')):
+                    time.sleep(delay)
+        
+        players = []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for (player_id, _), (player, links) in zip(pending, pool.map(fetch_player, pending)):
+                self.crawled_player_ids.add(player_id)
+                if player is None:
+                    continue
+                players.append(player)
+                
+                # Capped fan-out back into the general frontier
+                added = 0
+                for link in links:
+                    if added >= link_cap:
+                        break
+                    if link not in self.visited_urls and link not in self.url_queue:
+                        self._enqueue(link, parent=self.player_urls[player_id])
+                        added += 1
+        
+        self.scraped_data['players'].extend(players)
+        self.log.info("  → Scraped %d player pages", len(players))
+        return players
+    
+    def goals_met(self, goals):
+        """True when every data type in goals has at least its minimum record count"""
+        return all(len(self.scraped_data.get(data_type, [])) >= count for data_type, count in goals.items())
+    
+    def goal_shortfall(self, goals):
+        """Records still missing per data type ({} once every goal is met)"""
+        return {data_type: count - len(self.scraped_data.get(data_type, []))
+                for data_type, count in goals.items()
+                if len(self.scraped_data.get(data_type, [])) < count}
+    
+    def crawl(self, max_pages=10, delay=1, player_pages=0, player_workers=4, profile=None, trace=None,
+              goals=None, write_profile=True):
+        """
+        Main crawling method using BFS
+        player_pages > 0 runs the player-detail stage after each roster page,
+        with its own budget, instead of letting player pages into the frontier
+        profile: optional crawl_profiling.CrawlProfiler (per page or per team)
+        write_profile: write the profiler's reports when done; league sweeps pass
+        False and write them once at the end
+        trace: optional crawl_trace.CrawlTrace recording a per-URL timeline
+        goals: {data type: minimum records} (e.g. DEFAULT_GOALS); the crawl stops
+        as soon as every goal is met. Calling crawl() again resumes the frontier
+        Returns the number of pages crawled (max_pages minus this is unused budget)
+        """
+        self.trace = trace
+        self.extractor_start = self.extractors.snapshot()
+        team_profile = profile.team(self.sport, self.team_name) if profile is not None else nullcontext()
+        try:
+            with team_profile, self._span('crawl', max_pages=max_pages):
+                pages_crawled = self._crawl_frontier(max_pages, delay, player_pages, player_workers,
+                                                     profile, goals)
+        finally:
+            self.trace = None
+        
+        if profile is not None and write_profile:
+            profile.write_reports()
+        
+        self.log.info("\nCrawl completed! Visited %d pages (%s)", len(self.visited_urls), self.stop_reason,
+                      extra={'pages_visited': len(self.visited_urls), 'stop_reason': self.stop_reason})
+        if info_enabled(self.log):
+            self._print_summary()
+        return pages_crawled
     
-    def crawl(self, max_pages=10, delay=1):
-        """Main crawling method using BFS"""
-        print(f"Starting crawl for {self.team_name} ({self.sport.upper()})")
-        print(f"Seed URLs: {len(self.seed_urls)}")
+    def _crawl_frontier(self, max_pages, delay, player_pages, player_workers, profile, goals=None):
+        """BFS loop over the frontier until max_pages, an empty queue or met goals"""
+        self.log.info("Starting crawl for %s (%s)", self.team_name, self.sport.upper())
+        self.log.info("Seed URLs: %d", len(self.seed_urls))
         
-        # Add seed URLs to queue
+        # Add seed URLs to queue (a resumed crawl doesn't queue them again)
         for url in self.seed_urls:
-            self.url_queue.append(url)
+            if url not in self.url_parents:
+                self._enqueue(url)
         
         pages_crawled = 0
+        crawl_start = time.perf_counter()
+        team_labels = {'sport': self.sport, 'team': self.team_name}
         
-        while self.url_queue and pages_crawled < max_pages:
+        while self.url_queue and pages_crawled < max_pages and not (goals and self.goals_met(goals)):
+            self.metrics.frontier_depth.set(len(self.url_queue), **team_labels)
+            
             # Pop URL from queue (BFS)
             current_url = self.url_queue.popleft()
             
@@ -346,173 +683,423 @@ class SportsCrawler:
             if current_url in self.visited_urls:
                 continue
             
-            print(f"\n[{pages_crawled + 1}] Crawling: {current_url}")
+            self.log.info("\n[%d] Crawling: %s", pages_crawled + 1, current_url,
+                          extra={'url': current_url, 'page': pages_crawled + 1})
             
-            try:
-                # Fetch page
-                response = requests.get(current_url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Mark as visited
-                self.visited_urls.add(current_url)
-                pages_crawled += 1
-                
-                # Scrape content based on page type
-                self._scrape_page_content(current_url, soup)
-                
-                # Extract new links
-                new_links = self._extract_links(soup, current_url)
-                print(f"  → Found {len(new_links)} new links to crawl")
-                
-                # Add new links to queue
-                for link in new_links:
-                    if link not in self.visited_urls:
-                        self.url_queue.append(link)
-                
-                # Respectful delay
+            parent, depth = self.url_parents.get(current_url, (None, 0))
+            page_type = self._page_type(current_url)
+            page_labels = self._metric_labels(page_type)
+            
+            with self._span('page', url=current_url, parent=parent, depth=depth, page_type=page_type) as page_span:
+                try:
+                    # Fetch and parse page (shared with other team crawlers if coordinated)
+                    if profile is not None:
+                        with profile.page(current_url, page_type):
+                            page = self._load_page(current_url)
+                    else:
+                        page = self._load_page(current_url)
+                    
+                    # Mark as visited
+                    self.visited_urls.add(current_url)
+                    pages_crawled += 1
+                    self.metrics.pages.inc(**page_labels)
+                    self.metrics.pages_per_second.set(
+                        pages_crawled / max(time.perf_counter() - crawl_start, 1e-9), **team_labels)
+                    
+                    # Store content scraped for this page type
+                    self._store_page_records(page['records'])
+                    
+                    # Extract new links (player pages go to the player stage instead)
+                    new_links = []
+                    for link in self._filter_links(page['links']):
+                        self.url_parents.setdefault(link, (current_url, depth + 1))
+                        if not self._remember_player_url(link):
+                            new_links.append(link)
+                    self.log.info("  → Found %d new links to crawl", len(new_links),
+                                  extra={'url': current_url, 'new_links': len(new_links)})
+                    
+                    # Add new links to queue
+                    for link in new_links:
+                        if link not in self.visited_urls:
+                            self._enqueue(link, parent=current_url)
+                    
+                    # Per-page yield, kept for crawl history (budgets and seed order)
+                    yields = {data_type: len(data) if isinstance(data, list) else 1
+                              for data_type, data in page['records'].items()}
+                    self.page_log.append({'url': current_url, 'records': yields})
+                    
+                    # A fetch that yields no records and no new links was wasted
+                    records = sum(yields.values())
+                    page_span.update(records=records, new_links=len(new_links),
+                                     wasted=not records and not new_links)
+                    
+                    # Player-detail stage once the roster has given us player ids
+                    if player_pages > len(self.crawled_player_ids) and self.scraped_data['roster']:
+                        with self._span('player_stage'):
+                            self.crawl_players(max_players=player_pages - len(self.crawled_player_ids),
+                                               workers=player_workers, delay=delay)
+                    
+                except Exception as e:
+                    self.log.warning("  → Error crawling %s: %s", current_url, e, extra={'url': current_url})
+                    self.metrics.errors.inc(**page_labels)
+                    page_span['error'] = str(e)
+                    continue
+            
+            # Goals met: stop now rather than sleeping before a page we won't fetch
+            if goals and self.goals_met(goals):
+                self.log.info("  → Goals met after %d pages", pages_crawled, extra={'pages': pages_crawled})
+                break
+            
+            # Respectful delay
+            with self._span('sleep'), self.metrics.time_stage('sleep', **page_labels):
                 time.sleep(delay)
-                
-            except Exception as e:
-                print(f"  → Error crawling {current_url}: {e}")
-                continue
         
-        print(f"\nCrawl completed! Visited {len(self.visited_urls)} pages")
-        self._print_summary()
+        self.metrics.frontier_depth.set(len(self.url_queue), **team_labels)
+        
+        if goals and self.goals_met(goals):
+            self.stop_reason = 'goals'
+        elif pages_crawled >= max_pages:
+            self.stop_reason = 'budget'
+        else:
+            self.stop_reason = 'frontier'
+        return pages_crawled
     
     def _print_summary(self):
-        """Print summary of scraped data"""
-        print("\n" + "="*60)
-        print("CRAWL SUMMARY")
-        print("="*60)
+        """Log a summary of scraped data (one record, so JSON logs stay one object per line)"""
+        lines = []
+        lines.append("\n" + "="*60)
+        lines.append("CRAWL SUMMARY")
+        lines.append("="*60)
         
-        print(f"Roster Players: {len(self.scraped_data['roster'])}")
-        print(f"Schedule Entries: {len(self.scraped_data['schedule'])}")
-        print(f"News Articles: {len(self.scraped_data['news'])}")
+        lines.append(f"Roster Players: {len(self.scraped_data['roster'])}")
+        lines.append(f"Schedule Entries: {len(self.scraped_data['schedule'])}")
+        lines.append(f"News Articles: {len(self.scraped_data['news'])}")
+        lines.append(f"Stat Tables: {len(self.scraped_data['stats'])}")
+        lines.append(f"Player Pages: {len(self.scraped_data['players'])}")
         
         # Show sample roster data
         if self.scraped_data['roster']:
-            print(f"\nSAMPLE ROSTER DATA:")
-            print("-" * 80)
-            print(f"{'Name':<25} {'Jersey':<8} {'Pos':<5} {'Age':<4} {'Height':<8} {'College':<15}")
-            print("-" * 80)
+            lines.append(f"\nSAMPLE ROSTER DATA:")
+            lines.append("-" * 80)
+            lines.append(f"{'Name':<25} {'Jersey':<8} {'Pos':<5} {'Age':<4} {'Height':<8} {'College':<15}")
+            lines.append("-" * 80)
             for i, player in enumerate(self.scraped_data['roster'][:10], 1):
                 jersey = f"#{player['number']}" if player['number'] != 'N/A' else 'N/A'
-                print(f"{player['name']:<25} {jersey:<8} {player['position']:<5} {player['age']:<4} {player['height']:<8} {player['college']:<15}")
+                lines.append(f"{player['name']:<25} {jersey:<8} {player['position']:<5} {player['age']:<4} {player['height']:<8} {player['college']:<15}")
             
             # Debug: Show raw data for first player
             if self.scraped_data['roster']:
-                print(f"\nDEBUG - First player raw data:")
-                print(f"  {self.scraped_data['roster'][0]}")
+                lines.append(f"\nDEBUG - First player raw data:")
+                lines.append(f"  {self.scraped_data['roster'][0]}")
         
         # Show sample news
         if self.scraped_data['news']:
-            print(f"\nSAMPLE NEWS:")
-            print("-" * 40)
+            lines.append(f"\nSAMPLE NEWS:")
+            lines.append("-" * 40)
             for i, article in enumerate(self.scraped_data['news'][:3], 1):
-                print(f"{i}. {article['title'][:60]}...")
+                lines.append(f"{i}. {article['title'][:60]}...")
+        
+        # Which extractor is spending the time in this crawl
+        lines.extend(self.extractors.stats_table(since=self.extractor_start))
+        
+        # Show team leaders from the first stat table
+        if self.scraped_data['stats']:
+            matrix = self.scraped_data['stats'][0]
+            column = pick_leader_column(matrix)
+            lines.append(f"\nTEAM LEADERS ({matrix.title or 'Stats'} - {column}):")
+            lines.append("-" * 40)
+            for i, (player, _, value) in enumerate(matrix.leaderboard(column, n=5), 1):
+                lines.append(f"{i}. {player:<25} {value:g}")
+        
+        self.log.info("\n".join(lines))
 
-def crawl_all_teams(sport, max_pages_per_team=5):
-    """Crawl all teams in a sport"""
-    print(f"\n🏆 CRAWLING ALL {sport.upper()} TEAMS")
-    print("="*60)
-    
-    all_teams = espn_sports[sport]
+def crawl_all_teams(sport, max_pages_per_team=5, player_pages_per_team=0, coordinator=None,
+                    metrics_file=None, profile=None, trace=None, teams=None, confirm=True,
+                    session=None, rate_limiter=None, delay=1, output_dir=None, goals=None, history=None,
+                    prober=None, sitemap=None, table_scorer=None, cache=None, name_index=None,
+                    box_scores=None):
+    """
+    Crawl all teams in a sport (or the given teams) and return the league data
+    confirm=False skips the y/n prompt for unattended runs; session, coordinator
+    and rate_limiter can be shared across sports by a batch run
+    goals: per-team {data type: minimum records}; teams stop once they're met and
+    their unused pages go to a league pool for teams still short afterwards
+    history: optional crawl_history.CrawlHistory; sets each team's budget and seed
+    order from past runs (max_pages_per_team is the default for unknown teams)
+    prober: optional url_templates.TemplateProber; probes ESPN URL templates and
+    promotes the live ones to the front of each team's seeds
+    sitemap: optional sitemap_discovery.SitemapDiscovery; its URLs for each team
+    are seeded directly (loaded once per sweep) instead of found via hub pages
+    table_scorer: optional table_scoring.TableScorer (e.g. calibrated weights)
+    cache: optional extraction_cache.ExtractionCache kept across sweeps in one
+    process; pages parsed earlier are served without refetching or reparsing
+    name_index: optional name_index.NameIndex; each crawled team's roster replaces
+    the players indexed for that team
+    box_scores: optional box_scores.BoxScoreStage; fetches the box scores of the
+    games found in the teams' schedules once the team crawls are done
+    """
+    all_teams = teams or espn_sports[sport]
     total_teams = len(all_teams)
     
-    print(f"Found {total_teams} teams in {sport.upper()}")
-    print(f"Max pages per team: {max_pages_per_team}")
-    print(f"Estimated total pages: {total_teams * max_pages_per_team}")
+    log.info("\n🏆 CRAWLING ALL %s TEAMS\n%s\nFound %d teams in %s\nMax pages per team: %d\n"
+             "Estimated total pages: %d", sport.upper(), "=" * 60, total_teams, sport.upper(),
+             max_pages_per_team, total_teams * max_pages_per_team, extra={'sport': sport})
     
     # Confirm before starting large crawl
-    confirm = input(f"\nProceed with crawling {total_teams} teams? (y/n): ").lower()
-    if confirm != 'y':
-        print("Crawl cancelled.")
-        return
+    if confirm:
+        answer = input(f"\nProceed with crawling {total_teams} teams? (y/n): ").lower()
+        if answer != 'y':
+            print("Crawl cancelled.")
+            return None
     
-    # Aggregate results across all teams
-    league_data = {
-        'teams_crawled': 0,
-        'total_players': 0,
-        'total_games': 0,
-        'total_news': 0,
-        'team_summaries': []
-    }
+    # One coordinator per sweep: shared news/player/opponent pages load once
+    coordinator = coordinator or FetchCoordinator()
+    fetch_stats_start = dict(coordinator.stats)
+    cache_stats_start = dict(cache.stats) if cache is not None else None
+    
+    # Budget handed back by teams that met their goals early
+    league_pool = 0
+    crawlers = {}
     
     for i, team in enumerate(all_teams, 1):
-        print(f"\n[{i}/{total_teams}] 🏀 CRAWLING: {team.upper()}")
-        print("-" * 50)
+        log.info("\n[%d/%d] 🏀 CRAWLING: %s\n%s", i, total_teams, team.upper(), "-" * 50,
+                 extra={'sport': sport, 'team': team})
         
         try:
             # Create crawler for this team
             team_abbrev = team[:3]  # Simple abbreviation
-            crawler = SportsCrawler(sport, team, team_abbrev)
+            crawler = SportsCrawler(sport, team, team_abbrev, session=session, coordinator=coordinator,
+                                    rate_limiter=rate_limiter, table_scorer=table_scorer, cache=cache)
             
-            # Crawl this team
-            crawler.crawl(max_pages=max_pages_per_team, delay=1)
+            # Speculative seeds straight from URL templates
+            if prober is not None:
+                prober.promote(crawler)
             
-            # Collect team summary
-            team_summary = {
-                'team': team,
-                'players': len(crawler.scraped_data['roster']),
-                'schedule_entries': len(crawler.scraped_data['schedule']),
-                'news_articles': len(crawler.scraped_data['news']),
-                'pages_visited': len(crawler.visited_urls)
-            }
+            # Known URLs straight from the sitemap, ahead of everything else
+            if sitemap is not None:
+                sitemap.seed(crawler)
             
-            league_data['team_summaries'].append(team_summary)
-            league_data['teams_crawled'] += 1
-            league_data['total_players'] += team_summary['players']
-            league_data['total_games'] += team_summary['schedule_entries']
-            league_data['total_news'] += team_summary['news_articles']
+            # Budget and seed order learned from earlier runs
+            team_budget = max_pages_per_team
+            if history is not None:
+                team_budget = history.budget(sport, team, max_pages_per_team, data_types=goals)
+                history.order_seeds(crawler)
+                log.info("📚 %s: budget %d pages from history", team, team_budget,
+                         extra={'sport': sport, 'team': team, 'budget': team_budget})
+            
+            # Crawl this team
+            pages_crawled = crawler.crawl(max_pages=team_budget, delay=delay,
+                                          player_pages=player_pages_per_team, profile=profile, trace=trace,
+                                          goals=goals, write_profile=False)
+            crawlers[team] = crawler
+            if goals and crawler.stop_reason == 'goals':
+                league_pool += team_budget - pages_crawled
             
-            print(f"✅ {team}: {team_summary['players']} players, {team_summary['schedule_entries']} games")
+            log.info("✅ %s: %d players, %d games", team, len(crawler.scraped_data['roster']),
+                     len(crawler.scraped_data['schedule']), extra={'sport': sport, 'team': team})
+            
+            # Refresh the exposition file so a local scraper sees progress mid-sweep
+            if metrics_file:
+                crawler.metrics.dump(metrics_file)
             
         except Exception as e:
-            print(f"❌ Error crawling {team}: {e}")
+            log.warning("❌ Error crawling %s: %s", team, e, extra={'sport': sport, 'team': team})
             continue
     
+    # Second pass: teams still short of their goals resume with budget from the pool
+    if goals:
+        for team, crawler in crawlers.items():
+            if league_pool <= 0:
+                break
+            if crawler.stop_reason != 'budget':
+                continue
+            grant = min(league_pool, max_pages_per_team)
+            log.info("🎯 %s short of goals %s: +%d pages from league pool", team,
+                     crawler.goal_shortfall(goals), grant, extra={'sport': sport, 'team': team})
+            try:
+                league_pool -= crawler.crawl(max_pages=grant, delay=delay, player_pages=player_pages_per_team,
+                                             profile=profile, trace=trace, goals=goals, write_profile=False)
+            except Exception as e:
+                log.warning("❌ Error crawling %s: %s", team, e, extra={'sport': sport, 'team': team})
+    
+    # Aggregate results across all teams
+    league_data = {
+        'teams_crawled': 0,
+        'total_players': 0,
+        'total_games': 0,
+        'total_news': 0,
+        'team_summaries': [],
+        'stats': {}
+    }
+    
+    # Per-team stat matrices, stacked into league matrices below
+    team_stats = {}
+    league_articles = set()
+    
+    for team, crawler in crawlers.items():
+        if history is not None:
+            history.record(crawler)
+        if prober is not None:
+            prober.record_yields(crawler)
+        # Whole team at once: players gone from the roster drop out of search
+        if name_index is not None and crawler.scraped_data['roster']:
+            name_index.replace_team(sport, team, crawler.scraped_data['roster'])
+        
+        # Collect team summary
+        team_summary = {
+            'team': team,
+            'players': len(crawler.scraped_data['roster']),
+            'schedule_entries': len(crawler.scraped_data['schedule']),
+            'news_articles': len(crawler.scraped_data['news']),
+            'stat_tables': len(crawler.scraped_data['stats']),
+            'pages_visited': len(crawler.visited_urls),
+            'stop_reason': crawler.stop_reason
+        }
+        if goals:
+            team_summary['goals_met'] = crawler.goals_met(goals)
+        
+        league_data['team_summaries'].append(team_summary)
+        if output_dir:
+            # Per-team files: what serve mode (query_server) loads
+            save_team_data(crawler, output_dir)
+        league_data['teams_crawled'] += 1
+        league_data['total_players'] += team_summary['players']
+        league_data['total_games'] += team_summary['schedule_entries']
+        team_stats[team] = crawler.scraped_data['stats']
+        league_articles.update(article['link'] if article.get('link', 'N/A') != 'N/A' else id(article)
+                               for article in crawler.scraped_data['news'])
+    
+    if goals:
+        league_data['unused_pool'] = league_pool
+    if history is not None:
+        history.save()
+    if prober is not None and prober.cache_path:
+        prober.save()
+    # Profiles of every team in the sweep, written once; tracemalloc (memory_top)
+    # would otherwise stay on and slow every later sweep in the process
+    if profile is not None:
+        profile.write_reports()
+        profile.close()
+    
+    # (team, jersey) -> player index for real-time lookups, next to the team files;
+    # teams outside this sweep (subset runs, failed teams) keep their indexed rosters
+    if output_dir and crawlers:
+        os.makedirs(os.path.join(output_dir, sport), exist_ok=True)
+        jersey_path = os.path.join(output_dir, sport, JERSEY_INDEX_FILE)
+        if os.path.exists(jersey_path):
+            rosters = {(sport, team): crawler.scraped_data['roster'] for team, crawler in crawlers.items()}
+            JerseyIndex.load(jersey_path).updated(rosters).save(jersey_path)
+        else:
+            JerseyIndex.from_crawlers(crawlers.values()).save(jersey_path)
+    
+    # Stack team stat tables into league matrices (one per table title)
+    league_data['stats'] = combine_stat_matrices(team_stats)
+    
+    # Box scores of scheduled games, each fetched once however many schedules list it
+    if box_scores is not None:
+        league_data['box_scores'], league_data['box_score_stats'] = box_scores.run(sport, crawlers.values())
+    
+    # Articles are counted once per sweep, however many teams linked them
+    # (the coordinator may be shared with other sports, so count this sweep's own)
+    league_data['total_news'] = len(league_articles)
+    league_data['fetch_stats'] = {key: value - fetch_stats_start.get(key, 0)
+                                  for key, value in coordinator.stats.items()}
+    if cache is not None:
+        league_data['cache_stats'] = {key: value - cache_stats_start.get(key, 0)
+                                      for key, value in cache.stats.items()}
+    
     # Print league-wide summary
-    print_league_summary(sport, league_data)
+    if info_enabled(log):
+        print_league_summary(sport, league_data, output_dir=output_dir)
+    else:
+        save_league_data(sport, league_data, output_dir=output_dir)
+    
+    return league_data
 
-def print_league_summary(sport, league_data):
-    """Print comprehensive league summary"""
-    print(f"\n🏆 {sport.upper()} LEAGUE CRAWL SUMMARY")
-    print("="*70)
+def print_league_summary(sport, league_data, output_dir=None):
+    """Log a comprehensive league summary (one record) and save it"""
+    lines = []
+    lines.append(f"\n🏆 {sport.upper()} LEAGUE CRAWL SUMMARY")
+    lines.append("="*70)
     
-    print(f"Teams Successfully Crawled: {league_data['teams_crawled']}")
-    print(f"Total Players Found: {league_data['total_players']}")
-    print(f"Total Schedule Entries: {league_data['total_games']}")
-    print(f"Total News Articles: {league_data['total_news']}")
+    lines.append(f"Teams Successfully Crawled: {league_data['teams_crawled']}")
+    lines.append(f"Total Players Found: {league_data['total_players']}")
+    lines.append(f"Total Schedule Entries: {league_data['total_games']}")
+    lines.append(f"Total News Articles: {league_data['total_news']}")
+    if 'unused_pool' in league_data:
+        lines.append(f"Unused Page Budget: {league_data['unused_pool']}")
+    if 'fetch_stats' in league_data:
+        fetch_stats = league_data['fetch_stats']
+        lines.append(f"Shared Fetches: {fetch_stats['hits'] + fetch_stats['shared']} "
+                     f"(loaded {fetch_stats['misses']} pages)")
+    if 'cache_stats' in league_data:
+        cache_stats = league_data['cache_stats']
+        lines.append(f"Extraction Cache: {cache_stats['hits']} hits, {cache_stats['content_hits']} unchanged, "
+                     f"{cache_stats['misses']} parsed")
+    if 'box_score_stats' in league_data:
+        box_score_stats = league_data['box_score_stats']
+        lines.append(f"Box Scores: {box_score_stats['fetched']} games fetched "
+                     f"({box_score_stats['unique_games']} games in {box_score_stats['game_refs']} schedule rows)")
     
     # Top teams by data found
     if league_data['team_summaries']:
-        print(f"\n📊 TOP TEAMS BY ROSTER SIZE:")
-        print("-" * 40)
+        lines.append(f"\n📊 TOP TEAMS BY ROSTER SIZE:")
+        lines.append("-" * 40)
         sorted_teams = sorted(league_data['team_summaries'], 
                             key=lambda x: x['players'], reverse=True)
         
         for i, team in enumerate(sorted_teams[:10], 1):
-            print(f"{i:2d}. {team['team']:<25} {team['players']:3d} players")
+            lines.append(f"{i:2d}. {team['team']:<25} {team['players']:3d} players")
         
-        print(f"\n📅 TOP TEAMS BY SCHEDULE DATA:")
-        print("-" * 40)
+        lines.append(f"\n📅 TOP TEAMS BY SCHEDULE DATA:")
+        lines.append("-" * 40)
         sorted_by_games = sorted(league_data['team_summaries'], 
                                key=lambda x: x['schedule_entries'], reverse=True)
         
         for i, team in enumerate(sorted_by_games[:10], 1):
-            print(f"{i:2d}. {team['team']:<25} {team['schedule_entries']:3d} games")
+            lines.append(f"{i:2d}. {team['team']:<25} {team['schedule_entries']:3d} games")
+    
+    # League leaderboards computed over the stacked stat matrices
+    for title, matrix in league_data.get('stats', {}).items():
+        column = pick_leader_column(matrix)
+        if not column:
+            continue
+        lines.append(f"\n📈 LEAGUE LEADERS - {title or 'STATS'} ({column}):")
+        lines.append("-" * 40)
+        for i, (player, team, value) in enumerate(matrix.leaderboard(column, n=10), 1):
+            lines.append(f"{i:2d}. {player:<25} {team:<25} {value:g}")
+    
+    log.info("\n".join(lines), extra={'sport': sport})
     
     # Save results to file
-    save_league_data(sport, league_data)
+    save_league_data(sport, league_data, output_dir=output_dir)
+
+def export_scraped_data(scraped_data):
+    """JSON-ready copy of a crawler's scraped_data (stat matrices via to_dict)"""
+    export = dict(scraped_data)
+    export['stats'] = [matrix.to_dict() for matrix in export.get('stats', [])]
+    return export
 
-def save_league_data(sport, league_data):
+def save_team_data(crawler, output_dir):
+    """Write a team's scraped data to output_dir/{sport}/{team}.json (atomic); returns the path"""
+    directory = os.path.join(output_dir, crawler.sport)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{crawler.team_name}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(export_scraped_data(crawler.scraped_data), f, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+def save_league_data(sport, league_data, output_dir=None):
     """Save league data to a file"""
     filename = f"{sport}_league_data.txt"
+    if output_dir:
+        filename = os.path.join(output_dir, filename)
     
     try:
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         with open(filename, 'w') as f:
             f.write(f"{sport.upper()} LEAGUE CRAWL RESULTS\n")
             f.write("="*50 + "\n\n")
@@ -531,12 +1118,14 @@ def save_league_data(sport, league_data):
                 f.write(f"Games: {team['schedule_entries']:3d} | ")
                 f.write(f"News: {team['news_articles']:3d}\n")
         
-        print(f"\n💾 Results saved to: {filename}")
+        log.info("\n💾 Results saved to: %s", filename, extra={'sport': sport})
         
     except Exception as e:
-        print(f"❌ Error saving results: {e}")
+        log.warning("❌ Error saving results: %s", e, extra={'sport': sport})
 
 def main():
+    configure_logging()
+    
     print("ESPN Sports Crawler")
     print("="*50)
     
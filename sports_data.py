@@ -1,3 +1,5 @@
+import datetime
+
 # NFL Teams
 nfl_teams = [
     'arizona-cardinals', 'atlanta-falcons', 'baltimore-ravens', 'buffalo-bills',
@@ -111,4 +113,25 @@ espn_sports = {
 }
 
 # All teams combined
-all_teams = nfl_teams + nba_teams + mlb_teams + nhl_teams + college_football_teams + college_basketball_teams + mls_teams + wnba_teams
\ No newline at end of file
+all_teams = nfl_teams + nba_teams + mlb_teams + nhl_teams + college_football_teams + college_basketball_teams + mls_teams + wnba_teams
+
+# Season calendars: (month the season starts, labelled by the year it ends)
+# ESPN URLs call the 2024-25 NBA season season/2025 but the 2024 NFL season season/2024
+season_calendars = {
+    'nfl': (9, False),
+    'nba': (10, True),
+    'mlb': (3, False),
+    'nhl': (10, True),
+    'college-football': (8, False),
+    'college-basketball': (11, True),
+    'mls': (2, False),
+    'wnba': (5, False)
+}
+
+
+def current_season(sport, today=None):
+    """ESPN season label of the latest season of a sport to have started"""
+    today = today or datetime.date.today()
+    start_month, labelled_by_end = season_calendars.get(sport, (1, False))
+    started = today.year if today.month >= start_month else today.year - 1
+    return started + 1 if labelled_by_end else started
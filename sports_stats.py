@@ -0,0 +1,241 @@
+"""
+Stats page extraction into NumPy-backed stat matrices
+Turns ESPN team stats tables into numeric per-player arrays with column labels
+"""
+
+import re
+import numpy as np
+
+# Cells ESPN uses for "no value"
+MISSING_VALUES = {'', '-', '--', '—', 'N/A', 'NA'}
+
+# Common leaderboard columns, in order of preference, per table
+LEADER_COLUMNS = ['PTS', 'YDS', 'G', 'HR', 'AVG', 'GP']
+
+
+class StatMatrix:
+    """Numeric per-player stat table: one row per player, one column per stat"""
+
+    def __init__(self, players, columns, values, title='', teams=None):
+        self.players = list(players)
+        self.columns = list(columns)
+        self.values = np.asarray(values, dtype=np.float64).reshape(len(self.players), len(self.columns))
+        self.title = title
+        self.teams = list(teams) if teams is not None else [''] * len(self.players)
+
+    def __len__(self):
+        return len(self.players)
+
+    def __repr__(self):
+        return f"StatMatrix({self.title!r}, {len(self.players)} players x {len(self.columns)} stats)"
+
+    def column(self, name):
+        """Return the values of one stat column as a 1-D array"""
+        return self.values[:, self.columns.index(name)]
+
+    def leaderboard(self, column, n=10, ascending=False):
+        """Return the top n (player, team, value) rows for a stat column"""
+        values = self.column(column)
+        valid = np.flatnonzero(~np.isnan(values))
+        if valid.size == 0:
+            return []
+
+        # argsort only the non-missing values, then map back to row indices
+        order = np.argsort(values[valid], kind='stable')
+        if not ascending:
+            order = order[::-1]
+        rows = valid[order[:n]]
+
+        return [(self.players[i], self.teams[i], float(values[i])) for i in rows]
+
+    def to_dict(self):
+        """Convert to plain lists (JSON friendly, NaN becomes None)"""
+        rows = [[None if np.isnan(v) else float(v) for v in row] for row in self.values]
+        return {
+            'title': self.title,
+            'players': self.players,
+            'teams': self.teams,
+            'columns': self.columns,
+            'values': rows
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a StatMatrix from to_dict() output"""
+        values = [[np.nan if v is None else v for v in row] for row in data['values']]
+        if not values:
+            values = np.empty((0, len(data['columns'])))
+        return cls(data['players'], data['columns'], values,
+                   title=data.get('title', ''), teams=data.get('teams'))
+
+
+def parse_stat_value(text):
+    """Convert an ESPN stat cell to a float (NaN when missing)"""
+    text = text.strip().replace(',', '')
+    if text in MISSING_VALUES:
+        return np.nan
+
+    if text.endswith('%'):
+        text = text[:-1]
+
+    # Time on ice / minutes like "18:42" -> minutes as a float
+    if ':' in text:
+        minutes, _, seconds = text.partition(':')
+        try:
+            return float(minutes) + float(seconds) / 60
+        except ValueError:
+            return np.nan
+
+    try:
+        return float(text)
+    except ValueError:
+        return np.nan
+
+
+def _table_headers(table):
+    """Return the text of the last header row of a table"""
+    header_rows = table.find('thead')
+    header_rows = header_rows.find_all('tr') if header_rows else table.find_all('tr')[:1]
+    if not header_rows:
+        return []
+    return [cell.get_text(strip=True) for cell in header_rows[-1].find_all(['th', 'td'])]
+
+
+def _table_body_rows(table):
+    """Return the data rows of a table (everything outside thead)"""
+    body = table.find('tbody')
+    if body:
+        return body.find_all('tr')
+    return table.find_all('tr')[1:]
+
+
+def _player_name(cell):
+    """Extract the player name from a name cell (link text if present)"""
+    link = cell.find('a')
+    if link:
+        return link.get_text(strip=True)
+    return cell.get_text(strip=True)
+
+
+def _table_title(table):
+    """Find the section title shown above a stats table"""
+    title = table.find_previous(class_=re.compile(r'Table__Title'))
+    return title.get_text(strip=True) if title else ''
+
+
+def _is_name_header(header):
+    return header.lower() in ('name', 'player')
+
+
+def _build_matrix(names, headers, rows, title):
+    """Build a StatMatrix from player names and rows of stat cell text"""
+    players = []
+    values = []
+    for name, cells in zip(names, rows):
+        # Skip team total rows and empty names
+        if not name or name.lower() in ('total', 'totals', 'team'):
+            continue
+        players.append(name)
+        values.append([parse_stat_value(cell) for cell in cells[:len(headers)]])
+
+    if not players or not headers:
+        return None
+
+    # Pad short rows so the matrix is rectangular
+    width = len(headers)
+    values = [row + [np.nan] * (width - len(row)) for row in values]
+    return StatMatrix(players, headers, values, title=title)
+
+
+def extract_stat_matrices(soup):
+    """
+    Extract every per-player stats table on a page as a StatMatrix
+    Handles ESPN's split layout (fixed name table + scrolling stats table)
+    and plain single tables with a Name column
+    """
+    matrices = []
+    tables = soup.find_all('table')
+    i = 0
+
+    while i < len(tables):
+        table = tables[i]
+        headers = _table_headers(table)
+        rows = _table_body_rows(table)
+
+        # ESPN layout: a one-column "Name" table followed by the stat columns
+        if len(headers) == 1 and _is_name_header(headers[0]) and i + 1 < len(tables):
+            stats_table = tables[i + 1]
+            stats_rows = _table_body_rows(stats_table)
+            if len(stats_rows) == len(rows):
+                names = [_player_name(row.find('td')) if row.find('td') else '' for row in rows]
+                cells = [[td.get_text(strip=True) for td in row.find_all('td')] for row in stats_rows]
+                matrix = _build_matrix(names, _table_headers(stats_table), cells, _table_title(table))
+                if matrix:
+                    matrices.append(matrix)
+                i += 2
+                continue
+
+        # Single table with a name column and stat columns after it
+        name_index = next((j for j, h in enumerate(headers) if _is_name_header(h)), None)
+        if name_index is not None and len(headers) > name_index + 1:
+            names = []
+            cells = []
+            for row in rows:
+                tds = row.find_all('td')
+                if len(tds) <= name_index:
+                    continue
+                names.append(_player_name(tds[name_index]))
+                cells.append([td.get_text(strip=True) for td in tds[name_index + 1:]])
+            matrix = _build_matrix(names, headers[name_index + 1:], cells, _table_title(table))
+            if matrix:
+                matrices.append(matrix)
+
+        i += 1
+
+    return matrices
+
+
+def combine_stat_matrices(team_matrices):
+    """
+    Stack per-team stat matrices into one league matrix per table title
+    team_matrices: {team_name: [StatMatrix, ...]}
+    Columns are unioned; stats a team's table doesn't have are NaN
+    """
+    grouped = {}
+    for team, matrices in team_matrices.items():
+        for matrix in matrices:
+            grouped.setdefault(matrix.title, []).append((team, matrix))
+
+    league = {}
+    for title, parts in grouped.items():
+        # Union of columns, keeping first-seen order
+        columns = []
+        for _, matrix in parts:
+            columns.extend(c for c in matrix.columns if c not in columns)
+        col_index = {c: j for j, c in enumerate(columns)}
+
+        total_rows = sum(len(matrix) for _, matrix in parts)
+        values = np.full((total_rows, len(columns)), np.nan)
+        players = []
+        teams = []
+
+        offset = 0
+        for team, matrix in parts:
+            # Scatter each team's block into the league matrix in one go
+            targets = [col_index[c] for c in matrix.columns]
+            values[offset:offset + len(matrix), targets] = matrix.values
+            players.extend(matrix.players)
+            teams.extend([team] * len(matrix))
+            offset += len(matrix)
+
+        league[title] = StatMatrix(players, columns, values, title=title, teams=teams)
+
+    return league
+
+
+def pick_leader_column(matrix):
+    """Pick the most useful column to rank a stats table by"""
+    for column in LEADER_COLUMNS:
+        if column in matrix.columns:
+            return column
+    return matrix.columns[0] if matrix.columns else None
@@ -4,8 +4,62 @@ from bs4 import BeautifulSoup
 
 # Import the sports teams data
 from sports_data import espn_sports, nba_teams, all_teams
+from extraction_cache import ExtractionCache
 
-def get_roster_info(sport, team_abbrev, team_name):
+# Rosters parsed in this session, by URL and page content
+roster_cache = ExtractionCache(max_bytes=8 * 1024 * 1024, ttl=900)
+
+def parse_roster(content):
+    """Extract roster rows from a roster page's HTML"""
+    # Parse the HTML content
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # Find roster table or player information
+    roster_data = []
+    
+    # Look for roster table (ESPN uses different structures for different sports)
+    roster_table = soup.find('table', class_='Table')
+    if roster_table:
+        rows = roster_table.find_all('tr')
+        for row in rows[1:]:  # Skip header row
+            cells = row.find_all('td')
+            if len(cells) >= 3:
+                # Extract player name and number separately
+                name_cell = cells[1] if len(cells) > 1 else None
+                player_name = 'N/A'
+                player_number = 'N/A'
+                
+                if name_cell:
+                    # Look for the number in the specific class
+                    number_element = name_cell.find(class_='pl2 n10')
+                    if number_element:
+                        player_number = number_element.get_text(strip=True)
+                        # Remove the number element to get clean name
+                        number_element.decompose()
+                    
+                    # Get the clean player name
+                    player_name = name_cell.get_text(strip=True)
+                
+                # Extract additional player details from other columns
+                age = cells[3].get_text(strip=True) if len(cells) > 3 else 'N/A'
+                height = cells[4].get_text(strip=True) if len(cells) > 4 else 'N/A'
+                weight = cells[5].get_text(strip=True) if len(cells) > 5 else 'N/A'
+                college = cells[6].get_text(strip=True) if len(cells) > 6 else 'N/A'
+                
+                player_info = {
+                    'name': player_name,
+                    'position': cells[2].get_text(strip=True) if len(cells) > 2 else 'N/A',
+                    'number': player_number,
+                    'age': age,
+                    'height': height,
+                    'weight': weight,
+                    'college': college
+                }
+                roster_data.append(player_info)
+    
+    return roster_data
+
+def get_roster_info(sport, team_abbrev, team_name, cache=roster_cache):
     """Scrape roster information from ESPN team roster page"""
     roster_url = f"https://www.espn.com/{sport}/team/roster/_/name/{team_abbrev}/{team_name}"
     print(f"Scraping roster from: {roster_url}")
@@ -15,56 +69,16 @@ def get_roster_info(sport, team_abbrev, team_name):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        response = requests.get(roster_url, headers=headers)
-        response.raise_for_status()
         
-        # Parse the HTML content
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find roster table or player information
-        roster_data = []
-        
-        # Look for roster table (ESPN uses different structures for different sports)
-        roster_table = soup.find('table', class_='Table')
-        if roster_table:
-            rows = roster_table.find_all('tr')
-            for row in rows[1:]:  # Skip header row
-                cells = row.find_all('td')
-                if len(cells) >= 3:
-                    # Extract player name and number separately
-                    name_cell = cells[1] if len(cells) > 1 else None
-                    player_name = 'N/A'
-                    player_number = 'N/A'
-                    
-                    if name_cell:
-                        # Look for the number in the specific class
-                        number_element = name_cell.find(class_='pl2 n10')
-                        if number_element:
-                            player_number = number_element.get_text(strip=True)
-                            # Remove the number element to get clean name
-                            number_element.decompose()
-                        
-                        # Get the clean player name
-                        player_name = name_cell.get_text(strip=True)
-                    
-                    # Extract additional player details from other columns
-                    age = cells[3].get_text(strip=True) if len(cells) > 3 else 'N/A'
-                    height = cells[4].get_text(strip=True) if len(cells) > 4 else 'N/A'
-                    weight = cells[5].get_text(strip=True) if len(cells) > 5 else 'N/A'
-                    college = cells[6].get_text(strip=True) if len(cells) > 6 else 'N/A'
-                    
-                    player_info = {
-                        'name': player_name,
-                        'position': cells[2].get_text(strip=True) if len(cells) > 2 else 'N/A',
-                        'number': player_number,
-                        'age': age,
-                        'height': height,
-                        'weight': weight,
-                        'college': college
-                    }
-                    roster_data.append(player_info)
+        def fetch():
+            response = requests.get(roster_url, headers=headers)
+            response.raise_for_status()
+            return response.content
         
-        return roster_data
+        # Repeat lookups skip the request (within the TTL) or the parse (unchanged page)
+        if cache is None:
+            return parse_roster(fetch())
+        return cache.load(roster_url, fetch, parse_roster, kind='roster')
         
     except requests.RequestException as e:
         print(f"Error fetching roster: {e}")
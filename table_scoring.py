@@ -0,0 +1,290 @@
+"""
+Vectorized roster table scoring
+Each table on a page is reduced to a few counts (header keyword hits, jersey
+elements, player links, height/weight rows, row count), binned into indicator
+features and scored with one dot product against a weight vector. Weights
+come from a JSON config and can be fitted on a labelled corpus:
+
+    python table_scoring.py --synthetic 300 --output synthetic_weights.json
+    python table_scoring.py --corpus labelled.jsonl --output fitted_weights.json
+
+Fitted weights are only picked up by default once copied to
+table_weights.json next to this module
+"""
+
+import argparse
+import json
+import os
+import random
+
+import numpy as np
+from bs4 import BeautifulSoup
+
+ROSTER_KEYWORDS = ['name', 'player', '#', 'no', 'pos', 'age', 'height', 'weight', 'college']
+
+# Raw per-table counts, in column order
+COUNTS = ['header_keywords', 'jerseys', 'player_links', 'height_rows', 'weight_rows', 'rows']
+
+# Indicator features and the weights the original hand-tuned scoring used
+FEATURES = [
+    'header_keywords',    # >= 3 roster keywords in the header row
+    'jersey_many',        # >= 5 jersey elements
+    'jersey_some',        # 1-4 jersey elements
+    'player_links_many',  # >= 10 player links
+    'player_links_some',  # 3-9 player links
+    'height_rows',        # >= 3 of the first 10 rows look like heights
+    'weight_rows',        # >= 3 of the first 10 rows look like weights
+    'typical_size',       # 10-25 rows
+    'decent_size',        # 5+ rows otherwise
+    'bias',
+]
+
+DEFAULT_WEIGHTS = {
+    'header_keywords': 30,
+    'jersey_many': 25,
+    'jersey_some': 10,
+    'player_links_many': 20,
+    'player_links_some': 10,
+    'height_rows': 10,
+    'weight_rows': 5,
+    'typical_size': 10,
+    'decent_size': 5,
+    'bias': 0,
+}
+
+DEFAULT_WEIGHTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'table_weights.json')
+
+
+def table_counts(table):
+    """COUNTS for one <table> element, from a single walk over its descendants"""
+    thead = None
+    rows = []
+    jerseys = player_links = 0
+    for element in table.descendants:
+        name = element.name
+        if name is None:
+            continue
+        if name == 'tr':
+            rows.append(element)
+        elif name == 'a':
+            href = element.get('href')
+            if href and '/player/' in href:
+                player_links += 1
+        elif name == 'thead' and thead is None:
+            thead = element
+        classes = element.get('class')
+        if classes and ' '.join(classes) == 'pl2 n10':
+            jerseys += 1
+
+    header_row = thead or (rows[0] if rows else None)
+    header_text = header_row.get_text().lower() if header_row else ''
+    header_matches = sum(1 for keyword in ROSTER_KEYWORDS if keyword in header_text)
+
+    height_rows = weight_rows = 0
+    for row in rows[1:11]:  # First 10 rows after the header
+        row_text = ' '.join(cell.get_text() for cell in row.find_all('td'))
+        if "'" in row_text or '"' in row_text:
+            height_rows += 1
+        if 'lbs' in row_text or 'kg' in row_text:
+            weight_rows += 1
+
+    return header_matches, jerseys, player_links, height_rows, weight_rows, len(rows)
+
+
+def count_matrix(tables):
+    """(tables x COUNTS) integer matrix"""
+    return np.array([table_counts(table) for table in tables], dtype=np.int64).reshape(len(tables), len(COUNTS))
+
+
+def feature_matrix(counts):
+    """Bin a count matrix into the (tables x FEATURES) indicator matrix"""
+    counts = np.asarray(counts).reshape(-1, len(COUNTS))
+    header, jerseys, links, heights, weights, rows = counts.T
+    typical = (rows >= 10) & (rows <= 25)
+    return np.column_stack([
+        header >= 3,
+        jerseys >= 5,
+        (jerseys >= 1) & (jerseys < 5),
+        links >= 10,
+        (links >= 3) & (links < 10),
+        heights >= 3,
+        weights >= 3,
+        typical,
+        (rows >= 5) & ~typical,
+        np.ones(len(counts), dtype=bool),
+    ]).astype(np.float64)
+
+
+class TableScorer:
+    """Scores tables as features @ weights; a table needs a positive score to be picked"""
+
+    def __init__(self, weights=None):
+        unknown = set(weights or {}) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown table features: {', '.join(sorted(unknown))}")
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.vector = np.array([self.weights[name] for name in FEATURES], dtype=np.float64)
+
+    @classmethod
+    def load(cls, path):
+        """Scorer from a JSON weights file ({"weights": {...}} or a flat mapping)"""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data.get('weights', data))
+
+    def save(self, path, **extra):
+        with open(path, 'w') as f:
+            json.dump(dict(extra, weights=self.weights), f, indent=2)
+
+    def score(self, features):
+        """Score every row of a feature matrix at once"""
+        return features @ self.vector
+
+    def best(self, tables):
+        """(index, score, feature row) of the best-scoring table, or None"""
+        if not tables:
+            return None
+        features = feature_matrix(count_matrix(tables))
+        scores = self.score(features)
+        index = int(np.argmax(scores))
+        if scores[index] <= 0:
+            return None
+        return index, float(scores[index]), features[index]
+
+    def best_per_page(self, pages):
+        """
+        Best table index (or None) for each page's table list, scoring every
+        table of every page in a single dot product
+        """
+        counts = count_matrix([table for tables in pages for table in tables])
+        scores = self.score(feature_matrix(counts))
+        results = []
+        start = 0
+        for tables in pages:
+            page_scores = scores[start:start + len(tables)]
+            start += len(tables)
+            index = int(np.argmax(page_scores)) if len(tables) else None
+            results.append(index if index is not None and page_scores[index] > 0 else None)
+        return results
+
+    def reasons(self, features):
+        """Active features of a table with their weight"""
+        return [f"{name} ({self.weights[name]:+g})" for name, on in zip(FEATURES, features)
+                if on and name != 'bias']
+
+
+def load_default_scorer():
+    """Scorer from table_weights.json next to this module, else the built-in weights"""
+    if os.path.exists(DEFAULT_WEIGHTS_FILE):
+        return TableScorer.load(DEFAULT_WEIGHTS_FILE)
+    return TableScorer()
+
+
+default_scorer = load_default_scorer()
+
+
+def accuracy(pages, labels, vector):
+    """Fraction of pages where the pick matches the label (None = no roster table)"""
+    correct = 0
+    for features, label in zip(pages, labels):
+        scores = features @ vector
+        pick = int(np.argmax(scores)) if len(scores) and scores.max() > 0 else None
+        correct += pick == label
+    return correct / len(pages) if pages else 0.0
+
+
+def calibrate(pages, labels, start=None, epochs=30, rate=5.0, seed=0):
+    """
+    Fit weights with an averaged perceptron over pages of feature matrices
+    labels: index of the roster table per page, None for pages without one.
+    Starts from `start` (default weights) and returns whichever of the start,
+    the final and the averaged weights has the best accuracy on the corpus
+    """
+    start = TableScorer(start).vector
+    weights = start.copy()
+    total = np.zeros_like(weights)
+    steps = 0
+    order = list(range(len(pages)))
+    rng = random.Random(seed)
+
+    for _ in range(epochs):
+        rng.shuffle(order)
+        for i in order:
+            features, label = pages[i], labels[i]
+            if not len(features):
+                continue
+            scores = features @ weights
+            pick = int(np.argmax(scores))
+            if label is None:
+                if scores[pick] > 0:
+                    weights -= rate * features[pick]
+            elif pick != label:
+                weights += rate * (features[label] - features[pick])
+            elif scores[pick] <= 0:
+                weights += rate * features[label]
+            total += weights
+            steps += 1
+
+    candidates = [start, weights, total / max(steps, 1)]
+    best = max(candidates, key=lambda vector: accuracy(pages, labels, vector))
+    return {name: round(float(value), 3) for name, value in zip(FEATURES, best)}
+
+
+def load_corpus(path):
+    """
+    Labelled pages from a JSONL file: {"html": ...} or {"path": ...} (relative
+    to the corpus file) plus "roster_table", the index of the roster table or null
+    """
+    corpus = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            html = entry.get('html')
+            if html is None:
+                with open(os.path.join(os.path.dirname(path), entry['path']), encoding='utf-8') as page:
+                    html = page.read()
+            corpus.append((html, entry.get('roster_table')))
+    return corpus
+
+
+def corpus_features(corpus):
+    """([feature matrix per page], [label per page]) for (html, label) pairs"""
+    pages = []
+    for html, _ in corpus:
+        tables = BeautifulSoup(html, 'html.parser').find_all('table')
+        pages.append(feature_matrix(count_matrix(tables)))
+    return pages, [label for _, label in corpus]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit roster table scoring weights on a labelled corpus")
+    parser.add_argument('--corpus', help="labelled pages (JSONL with html/path and roster_table)")
+    parser.add_argument('--synthetic', type=int, default=0, help="also use N generated fixture pages")
+    parser.add_argument('--weights', help="starting weights JSON (default: built-in weights)")
+    parser.add_argument('--epochs', type=int, default=30)
+    # Required: writing table_weights.json here would change every crawler's roster detection
+    parser.add_argument('--output', required=True, help="where to write the fitted weights")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(args.corpus) if args.corpus else []
+    if args.synthetic:
+        from benchmarks import fixtures
+        corpus += fixtures.labelled_table_pages(args.synthetic)
+    if not corpus:
+        parser.error("give --corpus and/or --synthetic")
+
+    start = TableScorer.load(args.weights).weights if args.weights else None
+    pages, labels = corpus_features(corpus)
+    before = accuracy(pages, labels, TableScorer(start).vector)
+    weights = calibrate(pages, labels, start=start, epochs=args.epochs)
+    after = accuracy(pages, labels, TableScorer(weights).vector)
+
+    TableScorer(weights).save(args.output, pages=len(pages), accuracy=round(after, 4))
+    print(f"📐 Calibrated on {len(pages)} pages: accuracy {before:.1%} -> {after:.1%}")
+    print(f"💾 Weights saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
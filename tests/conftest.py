@@ -0,0 +1,14 @@
+"""
+Shared test setup
+"""
+
+import pytest
+
+from crawl_logging import preserved_logging
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    """Tests that call configure_logging() don't leak their handlers or level into later tests"""
+    with preserved_logging():
+        yield
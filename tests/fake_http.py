@@ -0,0 +1,30 @@
+"""
+Offline HTTP stand-ins for crawler tests
+"""
+
+
+class FakeResponse:
+    def __init__(self, html, status_code=200):
+        self.content = html.encode()
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Serves canned HTML by URL and records every fetch"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+        self.probed = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.fetched.append(url)
+        return FakeResponse(self.pages.get(url, ''), 200 if url in self.pages else 404)
+
+    def head(self, url, headers=None, timeout=None, allow_redirects=True):
+        self.probed.append(url)
+        return FakeResponse('', 200 if url in self.pages else 404)
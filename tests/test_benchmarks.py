@@ -0,0 +1,44 @@
+"""
+Smoke tests for the offline benchmark suite and its fixture corpus
+"""
+
+from bs4 import BeautifulSoup
+from benchmarks import fixtures
+from benchmarks.run_benchmarks import run_benchmarks, compare
+from sports_crawler import SportsCrawler
+
+
+def test_fixture_roster_is_selected_among_many_tables():
+    soup = BeautifulSoup(fixtures.many_tables_page(tables=10), 'html.parser')
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou')
+
+    table = crawler._find_roster_table_improved(soup)
+    assert table is not None
+    assert table.find(class_='pl2 n10') is not None
+
+
+def test_replayed_crawl_finds_team_data():
+    site = fixtures.team_site(extra_pages=2)
+    session = fixtures.ReplaySession(site)
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=session)
+    crawler.crawl(max_pages=len(site), delay=0)
+
+    assert len(crawler.scraped_data['roster']) == 18
+    assert crawler.scraped_data['news']
+    assert crawler.scraped_data['schedule']
+
+
+def test_quick_suite_and_regression_check():
+    document = run_benchmarks(size='quick', repeat=1)
+    assert set(document['results']) == {
+        'parse_large_roster', 'parse_many_tables', 'find_roster_table', 'score_tables_batch',
+        'scrape_roster_page',
+        'extract_links', 'link_scan_fast', 'link_scan_soup', 'jersey_lookup',
+        'name_search', 'should_crawl_url', 'replay_crawl'
+    }
+
+    # A baseline twice as fast as this run must flag every benchmark
+    baseline = {'results': {name: dict(result, median=result['median'] / 2)
+                            for name, result in document['results'].items()}}
+    rows = compare(document, baseline, threshold=0.2)
+    assert rows and all(row['regression'] for row in rows)
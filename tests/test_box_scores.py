@@ -0,0 +1,74 @@
+"""
+Tests for the box score stage fed by schedule game ids
+"""
+
+import json
+
+import numpy as np
+
+from box_scores import BoxScoreStage, collect_game_ids
+from crawl_batch import league_export
+from sports_crawler import crawl_all_teams
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def schedule(*games):
+    rows = ''.join(f'<tr><td>Sat, Jan {i + 1}</td><td><a href="/nba/team/_/name/x/{opponent}">vs {opponent}</a></td>'
+                   f'<td><a href="https://www.espn.com/nba/game/_/gameId/{game_id}/matchup">W 110-102</a></td></tr>'
+                   for i, (game_id, opponent) in enumerate(games))
+    return f'<table class="Table"><tr><th>DATE</th><th>OPPONENT</th><th>RESULT</th></tr>{rows}</table>'
+
+
+def box_score(*lines):
+    rows = ''.join(f'<tr><td><a href="/nba/player/_/id/{i}/p">{name}</a></td><td>{minutes}</td><td>{points}</td></tr>'
+                   for i, (name, minutes, points) in enumerate(lines))
+    return (f'<div class="Table__Title">Starters</div><table><thead><tr><th>Name</th><th>MIN</th><th>PTS</th></tr>'
+            f'</thead><tbody>{rows}</tbody></table>')
+
+
+def test_shared_games_are_fetched_once_per_sweep(tmp_path):
+    session = FakeSession({
+        f"{BASE}/nba/team/_/name/hou/houston-rockets/schedule": schedule(('401', 'los-angeles-lakers'),
+                                                                       ('402', 'miami-heat')),
+        f"{BASE}/nba/team/_/name/mia/miami-heat/schedule": schedule(('402', 'houston-rockets'),
+                                                                   ('403', 'boston-celtics')),
+        f"{BASE}/nba/boxscore/_/gameId/401": box_score(('Jalen Green', '36', '28'), ('Fred VanVleet', '34', '17')),
+        f"{BASE}/nba/boxscore/_/gameId/402": box_score(('Jalen Green', '30', '19'), ('Bam Adebayo', '35', '22')),
+    })
+
+    league_data = crawl_all_teams('nba', max_pages_per_team=6, teams=['houston-rockets', 'miami-heat'],
+                                  confirm=False, session=session, delay=0, output_dir=str(tmp_path),
+                                  box_scores=BoxScoreStage(session=session, workers=2))
+
+    box_score_urls = [url for url in session.fetched if '/boxscore/' in url]
+    assert sorted(box_score_urls) == [f"{BASE}/nba/boxscore/_/gameId/{game_id}" for game_id in ('401', '402', '403')]
+    # 403 has no box score page yet
+    assert league_data['box_score_stats'] == {'game_refs': 4, 'unique_games': 3, 'fetched': 2, 'failed': 1}
+
+    box_scores = league_data['box_scores']
+    matrix = box_scores.tables['Starters']
+    assert matrix.values.dtype == np.float64 and box_scores.game_ids['Starters'].dtype == np.int64
+    assert box_scores.game_ids['Starters'].tolist() == [401, 401, 402, 402]
+    assert box_scores.lines('Starters', '402') == [('Jalen Green', {'MIN': 30.0, 'PTS': 19.0}),
+                                                   ('Bam Adebayo', {'MIN': 35.0, 'PTS': 22.0})]
+    assert matrix.leaderboard('PTS', n=1)[0][0] == 'Jalen Green'
+
+    export = json.loads(json.dumps(league_export('nba', league_data)))
+    assert export['box_scores']['Starters']['game_ids'] == [401, 401, 402, 402]
+
+
+def test_game_budget_and_schedule_refs():
+    class Crawler:
+        def __init__(self, team, game_ids):
+            self.team_name = team
+            self.scraped_data = {'schedule': [{'game_id': game_id} for game_id in game_ids] + [{'date': 'N/A'}]}
+
+    crawlers = [Crawler('a', ['1', '2']), Crawler('b', ['2', '3']), Crawler('c', ['3', '1'])]
+    assert collect_game_ids(crawlers) == {'1': ['a', 'c'], '2': ['a', 'b'], '3': ['b', 'c']}
+
+    session = FakeSession({f"{BASE}/nba/boxscore/_/gameId/{i}": box_score(('P', '10', '2')) for i in '123'})
+    box_scores, stats = BoxScoreStage(session=session, max_games=2).run('nba', crawlers)
+    assert len(session.fetched) == 2 and len(box_scores) == 2
+    assert stats == {'game_refs': 6, 'unique_games': 3, 'fetched': 2, 'failed': 0}
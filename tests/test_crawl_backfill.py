@@ -0,0 +1,75 @@
+"""
+Tests for the multi-season backfill queue
+"""
+
+import json
+import os
+
+from crawl_backfill import Backfill, expand_units, parse_seasons, unit_path
+from fetch_coordinator import RateLimiter
+from sports_crawler import SportsCrawler
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def roster(*names):
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    rows = ''.join(f'<tr><td></td><td><a href="/nba/player/_/id/{i}/p">{name}</a><span class="pl2 n10">{i}</span></td>'
+                   f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>'
+                   for i, name in enumerate(names))
+    return f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"
+
+
+def season_roster_url(team, season):
+    return f"{BASE}/nba/team/roster/_/name/{team[:3]}/season/{season}"
+
+
+def test_seasons_and_units():
+    assert parse_seasons('2015-2017,2021') == [2015, 2016, 2017, 2021]
+    assert parse_seasons('2020') == [2020]
+    units = list(expand_units({'nba': ['boston-celtics', 'miami-heat']}, [2019, 2020]))
+    assert units[0] == ('nba', 'boston-celtics', 2020) and len(units) == 4
+
+    crawler = SportsCrawler('nba', 'miami-heat', 'mia', season=2019)
+    assert crawler.seed_urls[0] == f"{BASE}/nba/team/roster/_/name/mia/season/2019"
+    assert crawler._should_crawl_url(f"{BASE}/nba/team/schedule/_/name/mia/season/2019/seasontype/2")
+    assert not crawler._should_crawl_url(f"{BASE}/nba/team/_/name/mia/miami-heat/roster")
+    assert not crawler._should_crawl_url(f"{BASE}/nba/team/roster/_/name/mia/season/2020")
+
+
+def test_backfill_partitions_by_season_and_resumes(tmp_path):
+    output_dir = str(tmp_path)
+    session = FakeSession({
+        season_roster_url('boston-celtics', 2019): roster('Kemba Walker', 'Jayson Tatum'),
+        season_roster_url('boston-celtics', 2020): roster('Jayson Tatum'),
+        season_roster_url('miami-heat', 2020): roster('Jimmy Butler'),
+    })
+    targets = {'nba': ['boston-celtics', 'miami-heat']}
+
+    def backfill(**kwargs):
+        return Backfill(targets, [2019, 2020], output_dir=output_dir, session=session,
+                        rate_limiter=RateLimiter(0), workers=2, **kwargs)
+
+    # A first run stopped after two units
+    assert backfill().run(max_units=2) == {'crawled': 2, 'skipped': 0, 'failed': 0}
+    with open(os.path.join(output_dir, 'backfill_checkpoint.json')) as f:
+        assert sorted(json.load(f)['done']) == ['2020/nba/boston-celtics', '2020/nba/miami-heat']
+
+    # The restart skips finished units; miami-heat 2019 has no data and is retried later
+    stats = backfill().run()
+    assert stats == {'crawled': 1, 'skipped': 2, 'failed': 1}
+    with open(unit_path(output_dir, ('nba', 'boston-celtics', 2019))) as f:
+        assert [p['name'] for p in json.load(f)['roster']] == ['Kemba Walker', 'Jayson Tatum']
+    with open(unit_path(output_dir, ('nba', 'boston-celtics', 2020))) as f:
+        assert [p['name'] for p in json.load(f)['roster']] == ['Jayson Tatum']
+    assert not os.path.exists(unit_path(output_dir, ('nba', 'miami-heat', 2019)))
+
+    # Existing outputs are skipped even without a checkpoint; failures give up after max_attempts
+    os.remove(os.path.join(output_dir, 'backfill_checkpoint.json'))
+    fetched = len(session.fetched)
+    assert backfill().run()['skipped'] == 3
+    assert len(session.fetched) > fetched
+    fetched = len(session.fetched)
+    assert backfill(max_attempts=1).run() == {'crawled': 0, 'skipped': 4, 'failed': 0}
+    assert len(session.fetched) == fetched
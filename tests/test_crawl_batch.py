@@ -0,0 +1,88 @@
+"""
+Tests for unattended multi-sport batch runs
+"""
+
+import json
+import pytest
+from crawl_batch import parse_targets, run_batch, validate_targets
+from fetch_coordinator import RateLimiter
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def roster(*names):
+    rows = ''.join(f'<tr><td></td><td><a href="/nba/player/_/id/{i}/p">{name}</a><span class="pl2 n10">{i}</span></td>'
+                   f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>'
+                   for i, name in enumerate(names))
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    return f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"
+
+
+def news(sport, *titles):
+    return ''.join(f'<article><h2>{title}</h2><a href="/{sport}/story/_/id/{i}">x</a></article>'
+                   for i, title in enumerate(titles))
+
+
+def pages():
+    return {
+        f"{BASE}/nba/team/_/name/bos/boston-celtics/roster": roster('Jayson Tatum', 'Jaylen Brown'),
+        f"{BASE}/nba/team/news/_/name/mia/miami-heat": news('nba', 'Heat close out a long road trip'),
+        f"{BASE}/nba/team/news/_/name/bos/boston-celtics": news('nba', 'Heat close out a long road trip'),
+        f"{BASE}/nfl/team/_/name/buf/buffalo-bills/roster": roster('Josh Allen', 'James Cook', 'Dalton Kincaid'),
+    }
+
+
+def test_parse_targets():
+    assert parse_targets('nba,NFL') == {'nba': None, 'nfl': None}
+    assert parse_targets('nba,nfl', 'nba:boston-celtics,nba:miami-heat') == \
+        {'nba': ['boston-celtics', 'miami-heat'], 'nfl': None}
+    assert parse_targets(None, 'nhl:boston-bruins') == {'nhl': ['boston-bruins']}
+    with pytest.raises(ValueError):
+        parse_targets(None, 'boston-bruins')
+
+
+def test_validate_targets_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        validate_targets({'cricket': None})
+    with pytest.raises(ValueError):
+        validate_targets({'nba': ['boston-bruins']})
+
+
+def test_batch_runs_sports_in_one_process(tmp_path, monkeypatch):
+    def no_prompts(prompt=''):
+        raise AssertionError(f"unexpected prompt: {prompt}")
+    monkeypatch.setattr('builtins.input', no_prompts)
+
+    session = FakeSession(pages())
+    limiter = RateLimiter(0)
+    targets = {'nba': ['boston-celtics', 'miami-heat'], 'nfl': ['buffalo-bills']}
+    results = run_batch(targets, max_pages_per_team=5, delay=0, output_dir=str(tmp_path),
+                        session=session, rate_limiter=limiter)
+
+    assert set(results) == {'nba', 'nfl'}
+    assert results['nba']['teams_crawled'] == 2
+    assert results['nba']['total_players'] == 2
+    assert results['nba']['total_news'] == 1
+    assert results['nfl']['total_players'] == 3
+    assert results['nfl']['total_news'] == 0
+
+    # One session served both sports
+    assert any('/nba/' in url for url in session.fetched)
+    assert any('/nfl/' in url for url in session.fetched)
+
+    for sport in ('nba', 'nfl'):
+        assert (tmp_path / f"{sport}_league_data.txt").exists()
+        with open(tmp_path / f"{sport}_league_data.json") as f:
+            assert json.load(f)['sport'] == sport
+    with open(tmp_path / 'batch_summary.json') as f:
+        summary = json.load(f)
+    assert summary['sports']['nfl']['teams_crawled'] == 1
+
+
+def test_rate_limiter_spaces_requests():
+    now = [0.0]
+    limiter = RateLimiter(0.5, clock=lambda: now[0], sleep=lambda seconds: now.__setitem__(0, now[0] + seconds))
+    waits = [limiter.wait() for _ in range(4)]
+    assert waits == [0.0, 0.5, 0.5, 0.5]
+    assert now[0] == 1.5
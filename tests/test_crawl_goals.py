@@ -0,0 +1,75 @@
+"""
+Tests for goal-driven early stopping and the league page pool
+"""
+
+from sports_crawler import SportsCrawler, crawl_all_teams
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def roster_page(player_count):
+    rows = ''.join(
+        f'<tr><td></td><td><a href="/nba/player/_/id/{i}/p">Player Number{i}</a><span class="pl2 n10">{i}</span></td>'
+        f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>'
+        for i in range(player_count))
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    return f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"
+
+
+def team_url(abbrev, team, suffix=''):
+    return f"{BASE}/nba/team/_/name/{abbrev}/{team}{suffix}"
+
+
+def test_crawl_stops_once_goals_are_met():
+    roster_url = team_url('hou', 'houston-rockets', '/roster')
+    session = FakeSession({
+        roster_url: roster_page(12) + f'<a href="{team_url("hou", "houston-rockets", "/more")}">more</a>',
+        team_url('hou', 'houston-rockets', '/more'): '<p>more</p>',
+    })
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=session)
+    crawler.seed_urls = [roster_url]
+
+    pages = crawler.crawl(max_pages=5, delay=0, goals={'roster': 10})
+    assert pages == 1
+    assert crawler.stop_reason == 'goals'
+    assert session.fetched == [roster_url]
+    assert crawler.goal_shortfall({'roster': 10, 'news': 2}) == {'news': 2}
+
+
+def test_stop_reasons_without_goals_met():
+    url = team_url('hou', 'houston-rockets')
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=FakeSession({url: '<p>x</p>'}))
+    crawler.seed_urls = [url]
+    assert crawler.crawl(max_pages=5, delay=0, goals={'roster': 10}) == 1
+    assert crawler.stop_reason == 'frontier'
+
+
+def test_leftover_budget_goes_to_teams_still_short(tmp_path):
+    # Celtics: roster is their second seed, so they finish in one page
+    # Heat: roster sits at the end of a chain of link pages, beyond max_pages
+    chain = [team_url('mia', 'miami-heat', f'/p{i}') for i in range(3)]
+    chain.append(f"{BASE}/nba/team/roster/_/name/mia/miami-heat")
+    pages = {
+        team_url('bos', 'boston-celtics', '/roster'): roster_page(12),
+        team_url('mia', 'miami-heat'): f'<a href="{chain[0]}">next</a>',
+    }
+    for current, following in zip(chain, chain[1:]):
+        pages[current] = f'<a href="{following}">next</a>'
+    pages[chain[-1]] = roster_page(11)
+    session = FakeSession(pages)
+
+    league_data = crawl_all_teams('nba', max_pages_per_team=3, teams=['boston-celtics', 'miami-heat'],
+                                  confirm=False, session=session, delay=0, goals={'roster': 10},
+                                  output_dir=str(tmp_path))
+
+    summaries = {summary['team']: summary for summary in league_data['team_summaries']}
+    assert summaries['boston-celtics']['pages_visited'] == 1
+    assert summaries['boston-celtics']['stop_reason'] == 'goals'
+    assert summaries['miami-heat']['goals_met']
+    assert summaries['miami-heat']['pages_visited'] == 5
+    assert league_data['unused_pool'] == 0
+    assert league_data['total_players'] == 23
+
+    # Seeds that failed on the first pass aren't retried when the Heat resume
+    assert session.fetched.count(team_url('mia', 'miami-heat', '/schedule')) == 1
@@ -0,0 +1,113 @@
+"""
+Tests for history-driven page budgets and seed order
+"""
+
+from crawl_history import CrawlHistory, url_shape
+from sports_crawler import SportsCrawler, crawl_all_teams
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def roster_page(player_count):
+    rows = ''.join(
+        f'<tr><td></td><td><a href="/nba/player/_/id/{i}/p">Player Number{i}</a><span class="pl2 n10">{i}</span></td>'
+        f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>'
+        for i in range(player_count))
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    return f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"
+
+
+def news_page():
+    return '<article><h2>Celtics win a close one at home</h2><a href="/nba/story/_/id/1">x</a></article>'
+
+
+def celtics_pages():
+    team = f"{BASE}/nba/team/_/name/bos/boston-celtics"
+    pages = {f"{team}/p{i}": '<p>more</p>' for i in range(10)}
+    pages.update({
+        team: ''.join(f'<a href="{team}/p{i}">more</a>' for i in range(10)),
+        f"{team}/roster": '<p>no roster here</p>',
+        f"{team}/schedule": '<p>no schedule here</p>',
+        f"{team}/stats": '<p>no stats here</p>',
+        f"{BASE}/nba/team/news/_/name/bos/boston-celtics": news_page(),
+    })
+    return pages
+
+
+def test_url_shape():
+    assert url_shape(f"{BASE}/nba/team/roster/_/name/bos/boston-celtics", 'nba', 'boston-celtics', 'bos') == \
+        "/{sport}/team/roster/_/name/{abbrev}/{team}"
+    assert url_shape(f"{BASE}/nba/player/_/id/4065648/jayson-tatum", 'nba', 'boston-celtics', 'bos') == \
+        "/{sport}/player/_/id/{id}/jayson-tatum"
+
+
+def test_budget_from_team_then_sport_history(tmp_path):
+    history = CrawlHistory(str(tmp_path / 'history.json'))
+    assert history.budget('nba', 'boston-celtics', 10) == 10
+
+    crawler = SportsCrawler('nba', 'boston-celtics', 'bos', session=FakeSession(celtics_pages()))
+    crawler.crawl(max_pages=10, delay=0)
+    history.record(crawler)
+
+    # News turned up on the 5th page
+    assert history.teams['nba/boston-celtics'][0]['found_at'] == {'news': 5}
+    assert history.budget('nba', 'boston-celtics', 10, data_types=['news']) == 6
+
+    # No roster within 10 pages: next time the team gets more (capped at 3x the default)
+    assert history.budget('nba', 'boston-celtics', 10) == 21
+    assert history.budget('nba', 'boston-celtics', 5) == 15
+
+    # A team with no history of its own falls back to the sport's
+    assert history.budget('nba', 'miami-heat', 10, data_types=['news']) == 6
+    assert history.budget('nfl', 'buffalo-bills', 10) == 10
+
+    history.save()
+    reloaded = CrawlHistory(str(tmp_path / 'history.json'))
+    assert reloaded.teams == history.teams
+    assert reloaded.sports == history.sports
+
+
+def test_short_runs_grow_the_budget(tmp_path):
+    history = CrawlHistory(str(tmp_path / 'history.json'))
+    history.teams['nba/boston-celtics'] = [{'pages': 3, 'found_at': {'news': 2}, 'stop_reason': 'budget'}]
+    assert history.budget('nba', 'boston-celtics', 3) == 7
+    assert history.budget('nba', 'boston-celtics', 3, max_pages=5) == 5
+
+
+def test_dry_frontier_runs_keep_the_default_for_missing_types(tmp_path):
+    history = CrawlHistory(str(tmp_path / 'history.json'))
+    # Frontier ran out after 3 pages with news found but no roster or schedule
+    history.teams['nba/boston-celtics'] = [{'pages': 3, 'found_at': {'news': 2}, 'stop_reason': 'frontier'}]
+    assert history.budget('nba', 'boston-celtics', 10) == 11
+    assert history.budget('nba', 'boston-celtics', 10, data_types=['news']) == 3
+
+
+def test_seeds_that_paid_off_go_first(tmp_path):
+    history = CrawlHistory(str(tmp_path / 'history.json'))
+    crawler = SportsCrawler('nba', 'boston-celtics', 'bos', session=FakeSession(celtics_pages()))
+    crawler.crawl(max_pages=10, delay=0)
+    history.record(crawler)
+
+    heat = SportsCrawler('nba', 'miami-heat', 'mia', session=FakeSession({}))
+    history.order_seeds(heat)
+    assert heat.seed_urls[0] == f"{BASE}/nba/team/news/_/name/mia/miami-heat"
+
+
+def test_league_crawl_uses_and_updates_history(tmp_path):
+    history = CrawlHistory(str(tmp_path / 'history.json'))
+    session = FakeSession(celtics_pages())
+    crawl_all_teams('nba', max_pages_per_team=10, teams=['boston-celtics'], confirm=False, session=session,
+                    delay=0, output_dir=str(tmp_path), history=history, goals={'news': 1})
+    first_run = len(session.fetched)
+
+    session.fetched.clear()
+    history = CrawlHistory(str(tmp_path / 'history.json'))
+    assert history.budget('nba', 'boston-celtics', 10, data_types=['news']) == 6
+    crawl_all_teams('nba', max_pages_per_team=10, teams=['boston-celtics'], confirm=False, session=session,
+                    delay=0, output_dir=str(tmp_path), history=history, goals={'news': 1})
+
+    # The news seed now goes first, so the goal is met on the first page
+    assert first_run == 5
+    assert session.fetched == [f"{BASE}/nba/team/news/_/name/bos/boston-celtics"]
+    assert len(CrawlHistory(str(tmp_path / 'history.json')).teams['nba/boston-celtics']) == 2
@@ -0,0 +1,96 @@
+"""
+Tests for structured crawl logging
+"""
+
+import io
+import json
+import logging
+from crawl_logging import configure_logging, get_logger, preserved_logging, ContextAdapter, _install_default_handler
+from sports_crawler import crawl_all_teams
+from fake_http import FakeSession
+
+
+class Exploding:
+    """Fails if anything tries to format it"""
+
+    def __repr__(self):
+        raise AssertionError("formatted while level disabled")
+
+    __str__ = __repr__
+
+
+def test_json_output_carries_context_fields():
+    stream = io.StringIO()
+    configure_logging(level='INFO', fmt='json', stream=stream)
+    log = ContextAdapter(get_logger('crawler'), {'sport': 'nba', 'team': 'houston-rockets'})
+
+    log.info("\n[%d] Crawling: %s", 1, "https://www.espn.com/nba", extra={'page': 1})
+
+    record = json.loads(stream.getvalue())
+    assert record['msg'] == "[1] Crawling: https://www.espn.com/nba"
+    assert record['level'] == 'INFO'
+    assert record['sport'] == 'nba'
+    assert record['team'] == 'houston-rockets'
+    assert record['page'] == 1
+
+
+def test_quiet_mode_skips_formatting():
+    stream = io.StringIO()
+    configure_logging(quiet=True, stream=stream)
+    log = get_logger('crawler')
+
+    log.debug("row %r", Exploding())
+    log.info("page %s", Exploding())
+    log.warning("kept %s", 'warning')
+
+    assert stream.getvalue() == "WARNING: kept warning\n"
+
+
+def test_queue_handler_delivers_records():
+    stream = io.StringIO()
+    configure_logging(level='DEBUG', stream=stream, use_queue=True)
+    get_logger('crawler').debug("queued %d", 7)
+
+    # Reconfiguring stops (and drains) the listener
+    configure_logging(level=logging.WARNING, stream=io.StringIO())
+    assert stream.getvalue() == "queued 7\n"
+
+
+def test_default_output_and_quiet_league_header(capsys, tmp_path):
+    # Library use with no configure_logging() still prints progress
+    logger = get_logger()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    _install_default_handler()
+    get_logger('crawler').info("page %d", 3)
+    assert capsys.readouterr().out == "page 3\n"
+
+    # Quiet mode silences the league header too
+    configure_logging(quiet=True)
+    crawl_all_teams('nba', max_pages_per_team=0, teams=['houston-rockets'], confirm=False, delay=0,
+                    output_dir=str(tmp_path))
+    assert capsys.readouterr().out == ''
+
+
+def test_json_logs_stay_json_through_summaries(capsys, tmp_path):
+    stream = io.StringIO()
+    configure_logging(fmt='json', stream=stream)
+    news_url = "https://www.espn.com/nba/team/news/_/name/hou/houston-rockets"
+    session = FakeSession({news_url: '<article><h2>Rockets win at home tonight</h2></article>'})
+    crawl_all_teams('nba', max_pages_per_team=2, teams=['houston-rockets'], confirm=False, session=session,
+                    delay=0, output_dir=str(tmp_path))
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    messages = [record['msg'] for record in records]
+    assert any(msg.startswith('=' * 60 + '\nCRAWL SUMMARY') and 'EXTRACTOR TIMING' in msg for msg in messages)
+    assert any('NBA LEAGUE CRAWL SUMMARY' in msg for msg in messages)
+    assert capsys.readouterr().out == ''
+
+
+def test_preserved_logging_restores_the_logger():
+    logger = get_logger()
+    handlers, level = list(logger.handlers), logger.level
+    with preserved_logging():
+        configure_logging(quiet=True, stream=io.StringIO(), use_queue=True)
+        assert logger.handlers != handlers
+    assert logger.handlers == handlers and logger.level == level
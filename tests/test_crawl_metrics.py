@@ -0,0 +1,61 @@
+"""
+Tests for per-stage crawl metrics and the text exporter
+"""
+
+import urllib.request
+from crawl_metrics import CrawlMetrics, MetricsRegistry
+from sports_crawler import SportsCrawler
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def test_histogram_exposition():
+    registry = MetricsRegistry()
+    histogram = registry.histogram('demo_seconds', 'Demo', ('stage',), buckets=(0.1, 1.0))
+    histogram.observe(0.05, stage='parse')
+    histogram.observe(0.5, stage='parse')
+    histogram.observe(3.0, stage='parse')
+
+    text = registry.render()
+    assert '# TYPE demo_seconds histogram' in text
+    assert 'demo_seconds_bucket{stage="parse",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{stage="parse",le="1.0"} 2' in text
+    assert 'demo_seconds_bucket{stage="parse",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{stage="parse"} 3' in text
+
+
+def test_crawl_records_stage_metrics():
+    news_url = f"{BASE}/nba/team/news/_/name/hou/houston-rockets"
+    missing_url = f"{BASE}/nba/team/stats/_/name/hou/houston-rockets"
+    session = FakeSession({news_url: '<article><h2>Rockets win again</h2><a href="/nba/story/_/id/1">x</a></article>'})
+    metrics = CrawlMetrics()
+
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=session, metrics=metrics)
+    crawler.seed_urls = [news_url, missing_url]
+    crawler.crawl(max_pages=2, delay=0)
+
+    labels = {'sport': 'nba', 'team': 'houston-rockets', 'page_type': 'news'}
+    assert metrics.pages.value(**labels) == 1
+    assert metrics.response_bytes.value(**labels) == len(session.pages[news_url])
+    for stage in ('ttfb', 'download', 'parse', 'extract', 'sleep'):
+        assert metrics.stage_seconds.count(stage=stage, **labels) == 1
+    assert metrics.responses.value(sport='nba', team='houston-rockets', status=404) == 1
+    assert metrics.errors.value(sport='nba', team='houston-rockets', page_type='stats') == 1
+
+
+def test_metrics_endpoint_and_dump(tmp_path):
+    metrics = CrawlMetrics()
+    metrics.pages.inc(sport='nba', team='houston-rockets', page_type='roster')
+
+    server = metrics.serve(port=0)
+    try:
+        port = server.server_address[1]
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics").read().decode()
+    finally:
+        metrics.registry.stop()
+    assert 'crawl_pages_total{sport="nba",team="houston-rockets",page_type="roster"} 1' in body
+
+    path = tmp_path / 'crawl.prom'
+    metrics.dump(str(path))
+    assert path.read_text() == metrics.render()
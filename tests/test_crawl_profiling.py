@@ -0,0 +1,76 @@
+"""
+Tests for opt-in crawl profiling
+"""
+
+import json
+import os
+import tracemalloc
+
+from crawl_profiling import CrawlProfiler
+from sports_crawler import SportsCrawler, crawl_all_teams
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+NEWS_URL = f"{BASE}/nba/team/news/_/name/hou/houston-rockets"
+MAIN_URL = f"{BASE}/nba/team/_/name/hou/houston-rockets"
+
+
+def make_crawler():
+    articles = ''.join(f'<article><h2>Rockets story number {i}</h2><a href="/nba/story/_/id/{i}">x</a></article>'
+                       for i in range(50))
+    session = FakeSession({NEWS_URL: articles, MAIN_URL: '<a href="/nba/">home</a>' * 20})
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=session)
+    crawler.seed_urls = [NEWS_URL, MAIN_URL]
+    return crawler
+
+
+def test_page_profiles_and_memory_report(tmp_path):
+    profiler = CrawlProfiler(mode='cprofile', scope='page', output_dir=str(tmp_path), memory_top=1)
+    make_crawler().crawl(max_pages=2, delay=0, profile=profiler)
+    profiler.close()
+
+    assert set(profiler.profiles) == {f"news:{NEWS_URL}", f"link:{MAIN_URL}"}
+    files = os.listdir(tmp_path)
+    assert sum(name.endswith('.prof') for name in files) == 2
+    assert 'profile.collapsed' in files
+
+    # Collapsed stacks are tagged with the page type and URL at the root
+    with open(tmp_path / 'profile.collapsed') as f:
+        lines = f.read().splitlines()
+    assert lines and all(line.startswith(('news:', 'link:')) for line in lines)
+
+    # Only the largest page is kept in the memory report
+    with open(tmp_path / 'memory_top_pages.json') as f:
+        pages = json.load(f)['pages']
+    assert len(pages) == 1
+    assert pages[0]['url'] == NEWS_URL
+    assert pages[0]['top_allocations']
+
+
+def test_team_scope_sampling(tmp_path):
+    profiler = CrawlProfiler(mode='sample', scope='team', output_dir=str(tmp_path), sample_interval=0.001)
+    make_crawler().crawl(max_pages=2, delay=0.05, profile=profiler)
+
+    stacks = profiler.collapsed_stacks()
+    assert stacks
+    assert all(stack.startswith('nba:houston-rockets;') for stack in stacks)
+
+
+def test_league_sweep_writes_reports_once(tmp_path):
+    class CountingProfiler(CrawlProfiler):
+        writes = 0
+
+        def write_reports(self):
+            self.writes += 1
+            return super().write_reports()
+
+    profiler = CountingProfiler(mode='cprofile', scope='team', output_dir=str(tmp_path / 'profiles'),
+                                memory_top=1)
+    session = FakeSession({NEWS_URL: '<article><h2>Rockets win again tonight</h2></article>'})
+    crawl_all_teams('nba', max_pages_per_team=2, teams=['houston-rockets', 'miami-heat', 'boston-celtics'],
+                    confirm=False, session=session, delay=0, output_dir=str(tmp_path), profile=profiler)
+
+    assert profiler.writes == 1
+    assert sum(name.endswith('.prof') for name in os.listdir(tmp_path / 'profiles')) == 3
+    # The sweep's memory tracking ends with it
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,136 @@
+"""
+Tests for the TTL-based refresh daemon
+"""
+
+import json
+from crawl_metrics import CrawlMetrics
+from crawl_refresh import RefreshDaemon
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+TEAM_URL = f"{BASE}/nba/team/_/name/hou/houston-rockets"
+NEWS_URL = f"{BASE}/nba/team/news/_/name/hou/houston-rockets"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def news_page(*titles):
+    return ''.join(f'<article><h2>{title}</h2><a href="/nba/story/_/id/{i}">x</a></article>'
+                   for i, title in enumerate(titles))
+
+
+def make_daemon(pages, **kwargs):
+    clock = FakeClock()
+    session = FakeSession(pages)
+    daemon = RefreshDaemon(session=session, metrics=CrawlMetrics(), clock=clock, sleep=clock.sleep,
+                           min_interval=1.0, **kwargs)
+    daemon.add_team('nba', 'houston-rockets', 'hou')
+    return daemon, session, clock
+
+
+def test_only_due_entries_are_refetched():
+    daemon, session, clock = make_daemon({NEWS_URL: news_page('Rockets win at home tonight')},
+                                         ttls={'news': 600, 'roster': 86400}, failure_retry=3600)
+    assert {row['page_type'] for row in daemon.schedule()} == {'news', 'roster'}
+
+    # Cold start: both entries are due
+    assert daemon.run_pending() == 2
+    assert daemon.data('nba', 'houston-rockets')['news'][0]['title'] == 'Rockets win at home tonight'
+
+    # Nothing is due until the staggered first refresh
+    session.fetched.clear()
+    assert daemon.run_pending() == 0
+    assert session.fetched == []
+
+    clock.now += 600
+    daemon.run_pending()
+    assert NEWS_URL in session.fetched
+    assert f"{TEAM_URL}/roster" not in session.fetched
+
+
+def test_unchanged_data_backs_off_and_changes_reset_ttl():
+    pages = {NEWS_URL: news_page('Rockets win at home tonight')}
+    daemon, _, clock = make_daemon(pages, ttls={'news': 600}, backoff=2.0, max_backoff=4.0)
+
+    def next_cycle():
+        clock.now = daemon.next_due()
+        assert daemon.run_pending() == 1
+        return daemon.schedule()[0]
+
+    assert daemon.run_pending() == 1 and daemon.stats['changed'] == 1
+    for expected_ttl in (1200, 2400, 2400):
+        assert next_cycle()['ttl'] == expected_ttl
+    assert daemon.stats['unchanged'] == 3
+
+    pages[NEWS_URL] = news_page('Rockets trade for a new center')
+    row = next_cycle()
+    assert row['ttl'] == 600 and row['changes'] == 2
+    assert daemon.stats == {'refreshes': 5, 'changed': 2, 'unchanged': 3, 'skipped': 0, 'failed': 0}
+
+
+def test_skipped_refreshes_are_not_counted_as_refreshes():
+    daemon, session, clock = make_daemon({NEWS_URL: news_page('Rockets win at home tonight')},
+                                         ttls={'news': 600})
+    daemon.run_pending()
+    # A sitemap read after the fetch says the page hasn't changed since
+    daemon.lastmod[NEWS_URL] = (clock.now - 60, clock.now + 1)
+
+    clock.now = daemon.next_due()
+    assert daemon.run_pending() == 1
+    assert len(session.fetched) == 1
+    assert daemon.stats == {'refreshes': 1, 'changed': 1, 'unchanged': 0, 'skipped': 1, 'failed': 0}
+    assert daemon.schedule()[0]['refreshes'] == 1
+
+
+def test_failed_refresh_retries_soon():
+    daemon, _, clock = make_daemon({}, ttls={'roster': 86400}, failure_retry=120)
+    assert daemon.run_pending() == 1
+    assert daemon.stats['failed'] == 1
+    assert daemon.next_due() == clock.now + 120
+
+
+def test_first_refreshes_are_staggered():
+    clock = FakeClock()
+    daemon = RefreshDaemon(session=FakeSession({}), metrics=CrawlMetrics(), clock=clock, sleep=clock.sleep,
+                           ttls={'news': 1000}, min_interval=0)
+    teams = ['houston-rockets', 'boston-celtics', 'miami-heat', 'utah-jazz', 'denver-nuggets']
+    for team in teams:
+        page = daemon.add_team('nba', team).seed_urls[-1]
+        daemon.session.pages[page] = news_page(f'{team} news of the day')
+    daemon.run_pending()
+
+    # Next refreshes land spread across the TTL instead of all at +1000s
+    offsets = sorted(row['due'] - clock.now for row in daemon.schedule())
+    assert len(offsets) == 5
+    gaps = [b - a for a, b in zip([0] + offsets, offsets)]
+    assert max(offsets) < 1000
+    assert min(gaps) > 80
+
+
+def test_requests_are_paced_and_output_written(tmp_path):
+    daemon, _, clock = make_daemon({NEWS_URL: news_page('Rockets win at home tonight')},
+                                   ttls={'news': 600, 'roster': 86400, 'schedule': 3600},
+                                   output_dir=str(tmp_path))
+    start = clock.now
+    daemon.run_pending()
+    assert clock.now - start >= 2.0
+
+    with open(tmp_path / 'nba' / 'houston-rockets.json') as f:
+        assert json.load(f)['news'][0]['title'] == 'Rockets win at home tonight'
+
+
+def test_run_stops_at_duration():
+    daemon, _, clock = make_daemon({NEWS_URL: news_page('Rockets win at home tonight')}, ttls={'news': 600})
+    start = clock.now
+    refreshed = daemon.run(duration=3600)
+    assert clock.now >= start + 3600
+    assert 3 <= refreshed <= 7
@@ -0,0 +1,66 @@
+"""
+Tests for crawl timeline traces
+"""
+
+import json
+from crawl_trace import CrawlTrace
+from sports_crawler import SportsCrawler
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+MAIN_URL = f"{BASE}/nba/team/_/name/hou/houston-rockets"
+NEWS_URL = f"{BASE}/nba/team/news/_/name/hou/houston-rockets"
+EMPTY_URL = f"{BASE}/nba/team/_/name/hou/houston-rockets/empty"
+
+
+def crawl_with_trace():
+    session = FakeSession({
+        MAIN_URL: f'<a href="{NEWS_URL}">news</a>',
+        NEWS_URL: '<article><h2>Rockets win a close one at home</h2></article>',
+    })
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=session)
+    crawler.seed_urls = [MAIN_URL]
+    trace = CrawlTrace()
+    crawler.crawl(max_pages=2, delay=0, trace=trace)
+    return crawler, trace
+
+
+def test_spans_cover_each_stage():
+    crawler, trace = crawl_with_trace()
+    spans = [event for event in trace.events if event['ph'] == 'X']
+    names = {event['name'] for event in spans}
+    assert {'crawl', 'page', 'fetch', 'parse', 'extract', 'sleep'} <= names
+    assert crawler.trace is None
+
+    pages = {event['args']['url']: event['args'] for event in spans if event['name'] == 'page'}
+    assert pages[MAIN_URL]['depth'] == 0 and pages[MAIN_URL]['parent'] is None
+    assert pages[NEWS_URL]['depth'] == 1 and pages[NEWS_URL]['parent'] == MAIN_URL
+    assert pages[NEWS_URL]['records'] == 1
+    assert not pages[NEWS_URL]['wasted']
+
+
+def test_queued_markers_record_parent_and_depth():
+    _, trace = crawl_with_trace()
+    queued = {event['args']['url']: event['args'] for event in trace.events if event['name'] == 'queued'}
+    assert queued[NEWS_URL] == {'url': NEWS_URL, 'parent': MAIN_URL, 'depth': 1}
+
+
+def test_wasted_fetch_flagged():
+    session = FakeSession({EMPTY_URL: '<p>nothing here</p>'})
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=session)
+    crawler.seed_urls = [EMPTY_URL]
+    trace = CrawlTrace()
+    crawler.crawl(max_pages=1, delay=0, trace=trace)
+
+    page = next(event for event in trace.events if event['name'] == 'page')
+    assert page['args']['wasted']
+
+
+def test_save_writes_chrome_trace(tmp_path):
+    _, trace = crawl_with_trace()
+    path = trace.save(str(tmp_path / 'traces' / 'nba.json'))
+    with open(path) as f:
+        data = json.load(f)
+    assert data['displayTimeUnit'] == 'ms'
+    tracks = [event for event in data['traceEvents'] if event['ph'] == 'M']
+    assert {event['args']['name'] for event in tracks} >= {'nba', 'houston-rockets'}
@@ -0,0 +1,96 @@
+"""
+Tests for the in-process extraction result cache
+"""
+
+from extraction_cache import ExtractionCache
+from sports_crawler import SportsCrawler
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Loader:
+    """Counts fetches and parses for ExtractionCache.load"""
+
+    def __init__(self, content):
+        self.content = content
+        self.fetches = 0
+        self.parses = 0
+
+    def fetch(self):
+        self.fetches += 1
+        return self.content
+
+    def parse(self, content):
+        self.parses += 1
+        return {'parsed': content.decode()}
+
+
+def test_ttl_then_content_hash_then_reparse():
+    clock = Clock()
+    cache = ExtractionCache(ttl=60, clock=clock)
+    loader = Loader(b'<p>v1</p>')
+    url = f"{BASE}/nba/team/_/name/hou/houston-rockets"
+
+    assert cache.load(url, loader.fetch, loader.parse) == {'parsed': '<p>v1</p>'}
+    # Same page by another spelling of the URL, within the TTL: no fetch, no parse
+    assert cache.load(url + '/?utm_source=x', loader.fetch, loader.parse)['parsed'] == '<p>v1</p>'
+    assert (loader.fetches, loader.parses) == (1, 1)
+
+    # Past the TTL: refetched, but unchanged content isn't parsed again
+    clock.now = 61
+    cache.load(url, loader.fetch, loader.parse)
+    assert (loader.fetches, loader.parses) == (2, 1)
+
+    # Changed content is parsed and replaces the old result
+    clock.now = 200
+    loader.content = b'<p>v2</p>'
+    assert cache.load(url, loader.fetch, loader.parse) == {'parsed': '<p>v2</p>'}
+    assert (loader.fetches, loader.parses) == (3, 2)
+    assert len(cache) == 1
+    assert cache.stats == {'hits': 1, 'content_hits': 1, 'misses': 2, 'expired': 2, 'evictions': 0}
+
+
+def test_size_eviction_is_lru_and_kinds_are_separate():
+    cache = ExtractionCache(max_bytes=3000)
+    pages = [f"{BASE}/nba/page/{i}" for i in range(4)]
+    for url in pages[:3]:
+        cache.put(url, url.encode(), 'x' * 900)
+    cache.get(pages[0])                      # page 0 is now most recently used
+    cache.put(pages[3], b'3', 'x' * 900)     # over budget: page 1 goes
+
+    assert pages[1] not in cache
+    assert all(url in cache for url in (pages[0], pages[2], pages[3]))
+    assert cache.stats['evictions'] == 1
+    assert cache.bytes <= cache.max_bytes
+
+    # A player result for the same URL doesn't collide with the page result
+    cache.put(pages[0], b'0', {'player': 'p'}, kind='player')
+    assert cache.get(pages[0]) == 'x' * 900
+    assert cache.get(pages[0], kind='player') == {'player': 'p'}
+
+
+def test_second_crawl_is_served_from_the_cache():
+    roster_url = f"{BASE}/nba/team/roster/_/name/hou/houston-rockets"
+    hub = f"{BASE}/nba/team/_/name/hou/houston-rockets"
+    session = FakeSession({hub: f'<a href="{roster_url}">Roster</a>', roster_url: '<p>roster</p>'})
+    cache = ExtractionCache()
+
+    first = SportsCrawler('nba', 'houston-rockets', 'hou', session=session, cache=cache)
+    first.seed_urls = [hub]
+    first.crawl(max_pages=2, delay=0)
+    assert session.fetched == [hub, roster_url]
+
+    second = SportsCrawler('nba', 'houston-rockets', 'hou', session=session, cache=cache)
+    second.seed_urls = [hub]
+    assert second.crawl(max_pages=2, delay=0) == 2
+    assert session.fetched == [hub, roster_url]
+    assert cache.stats['hits'] == 2
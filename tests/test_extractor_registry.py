@@ -0,0 +1,90 @@
+"""
+Tests for extractor routing and per-extractor timing
+"""
+
+from bs4 import BeautifulSoup
+from extractors import build_default_registry
+from sports_crawler import SportsCrawler
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def route_name(registry, path):
+    extractor = registry.route(BASE + path)
+    return extractor.name if extractor else None
+
+
+def test_routes_by_page_shape():
+    registry = build_default_registry()
+
+    assert route_name(registry, "/nba/team/roster/_/name/hou/houston-rockets") == 'roster'
+    assert route_name(registry, "/nba/team/_/name/hou/houston-rockets/roster") == 'roster'
+    assert route_name(registry, "/nba/team/schedule/_/name/hou/houston-rockets/seasontype/2") == 'schedule'
+    assert route_name(registry, "/nba/team/news/_/name/hou/houston-rockets") == 'news'
+    assert route_name(registry, "/nba/team/stats/_/name/hou/houston-rockets") == 'stats'
+
+    # Substring routing used to get these wrong
+    assert route_name(registry, "/nba/player/news/_/id/4871144/alperen-sengun") == 'player'
+    assert route_name(registry, "/nba/player/stats/_/id/4871144/alperen-sengun") == 'player'
+    assert route_name(registry, "/nba/team/_/name/hou/houston-rockets") is None
+    assert route_name(registry, "/nba/team/_/name/hou/houston-rockets?ref=/roster") is None
+
+
+def test_route_decision_is_cached():
+    registry = build_default_registry()
+    url = BASE + "/nba/team/roster/_/name/hou/houston-rockets"
+
+    first = registry.route(url)
+    registry.extractors.clear()  # a fresh decision would now find nothing
+    assert registry.route(url) is first
+
+
+def test_extractor_timing():
+    class Crawler:
+        def _scrape_news_page(self, soup):
+            return [{'title': 'one'}, {'title': 'two'}]
+
+    registry = build_default_registry()
+    soup = BeautifulSoup('<p></p>', 'html.parser')
+    for _ in range(3):
+        records = registry.run(Crawler(), BASE + "/nba/team/news/_/name/hou/houston-rockets", soup)
+
+    assert records == {'news': [{'title': 'one'}, {'title': 'two'}]}
+    news = next(row for row in registry.stats() if row['extractor'] == 'news')
+    assert news['calls'] == 3
+    assert news['records'] == 6
+    assert news['wall_time'] > 0
+
+
+def test_timing_since_a_snapshot():
+    class Crawler:
+        def _scrape_news_page(self, soup):
+            return [{'title': 'one'}]
+
+    registry = build_default_registry()
+    soup = BeautifulSoup('<p></p>', 'html.parser')
+    url = BASE + "/nba/team/news/_/name/hou/houston-rockets"
+    registry.run(Crawler(), url, soup)
+
+    start = registry.snapshot()
+    registry.run(Crawler(), url, soup)
+    news = next(row for row in registry.stats(since=start) if row['extractor'] == 'news')
+    assert news['calls'] == 1 and news['records'] == 1
+    assert next(row for row in registry.stats() if row['extractor'] == 'news')['calls'] == 2
+    assert any(line.startswith('news ') and line.split()[1] == '1' for line in registry.stats_table(since=start))
+
+
+def test_team_summaries_count_their_own_crawl():
+    registry = build_default_registry()
+    pages = {f"{BASE}/nba/team/news/_/name/{abbrev}/{team}": '<article><h2>Big win at home tonight</h2></article>'
+             for abbrev, team in (('hou', 'houston-rockets'), ('mia', 'miami-heat'))}
+    session = FakeSession(pages)
+    for team in ('houston-rockets', 'miami-heat'):
+        crawler = SportsCrawler('nba', team, team[:3], session=session, extractors=registry)
+        crawler.seed_urls = [url for url in pages if team in url]
+        crawler.crawl(max_pages=1, delay=0)
+
+    # The second team's summary counts its own news page, not the first team's too
+    news = next(row for row in registry.stats(since=crawler.extractor_start) if row['extractor'] == 'news')
+    assert news['calls'] == 1
@@ -0,0 +1,76 @@
+"""
+Tests for league-scoped fetch deduplication
+"""
+
+import threading
+import time
+from fetch_coordinator import FetchCoordinator, canonical_url
+from sports_crawler import SportsCrawler
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def test_canonical_url():
+    assert canonical_url("HTTPS://WWW.ESPN.com/nba/story/_/id/1/?utm_source=x&b=2&a=1") == \
+        "https://www.espn.com/nba/story/_/id/1?a=1&b=2"
+
+
+def test_singleflight_collapses_concurrent_loads():
+    coordinator = FetchCoordinator()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return {'records': {}, 'links': []}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(coordinator.get(f"{BASE}/a", loader)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert coordinator.stats['misses'] == 1
+
+
+def test_lru_eviction():
+    coordinator = FetchCoordinator(max_entries=2)
+    for name in ('a', 'b', 'c'):
+        coordinator.get(f"{BASE}/{name}", lambda: name)
+
+    assert f"{BASE}/a" not in coordinator
+    assert f"{BASE}/c" in coordinator
+    assert len(coordinator) == 2
+
+
+def test_team_crawlers_share_news_pages_and_articles():
+    shared_news = f"{BASE}/nba/story/_/id/42/trade-deadline"
+    pages = {}
+    for abbrev, team in (('hou', 'houston-rockets'), ('bos', 'boston-celtics')):
+        pages[f"{BASE}/nba/team/news/_/name/{abbrev}/{team}"] = (
+            f'<article><h2>Big trade deadline story</h2><a href="{shared_news}?utm_source=x">read</a></article>'
+        )
+
+    session = FakeSession(pages)
+    coordinator = FetchCoordinator()
+    crawlers = []
+    for abbrev, team in (('hou', 'houston-rockets'), ('bos', 'boston-celtics')):
+        crawler = SportsCrawler('nba', team, abbrev, session=session, coordinator=coordinator)
+        crawler.seed_urls = [f"{BASE}/nba/team/news/_/name/{abbrev}/{team}"]
+        crawler.crawl(max_pages=1, delay=0)
+        crawlers.append(crawler)
+
+    # Both teams report the article; the league keeps one record for it
+    assert all(len(c.scraped_data['news']) == 1 for c in crawlers)
+    assert list(coordinator.articles) == [shared_news]
+    assert crawlers[0].scraped_data['news'][0] is crawlers[1].scraped_data['news'][0]
+
+    # Same page requested twice loads once
+    crawlers[1]._load_page(crawlers[0].seed_urls[0])
+    assert session.fetched.count(crawlers[0].seed_urls[0]) == 1
@@ -0,0 +1,115 @@
+"""
+Tests for the (sport, team, jersey) player index
+"""
+
+import os
+
+import pytest
+
+from benchmarks import fixtures
+from jersey_index import JERSEY_INDEX_FILE, JerseyIndex, jersey_slot
+from sports_crawler import crawl_all_teams
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def test_slots_and_lookups():
+    assert [jersey_slot(n) for n in ('0', '7', '#23', ' 99 ', '00', '100', 'N/A', '')] == \
+        [0, 7, 23, 99, 100, -1, None, None]
+
+    index = JerseyIndex.build({
+        ('nba', 'houston-rockets'): [
+            {'name': 'Zero', 'number': '0'},
+            {'name': 'Double Zero', 'number': '00'},
+            {'name': 'Big Number', 'number': '100'},
+            {'name': 'No Number', 'number': 'N/A'},
+            {'name': 'Second Zero', 'number': '0'},
+        ],
+        ('nba', 'miami-heat'): [{'name': 'Heat Seven', 'number': '7'}],
+    })
+
+    assert index.lookup('nba', 'houston-rockets', '0')['name'] == 'Zero'
+    assert index.lookup('nba', 'houston-rockets', '00')['name'] == 'Double Zero'
+    assert index.lookup('nba', 'houston-rockets', '#100')['name'] == 'Big Number'
+    assert index.lookup('nba', 'houston-rockets', 7) is None
+    assert index.lookup('nba', 'miami-heat', 7) == {'name': 'Heat Seven', 'number': '7',
+                                                      'sport': 'nba', 'team': 'miami-heat'}
+    assert index.lookup('nfl', 'miami-heat', 7) is None
+    assert index.stats == {'teams': 2, 'players': 4, 'duplicates': 1, 'overflow': 1}
+
+    # Direct array indexing for a detection loop
+    assert index.team_row('nba', 'miami-heat')[7] == 3
+    found = index.lookup_many('nba', 'houston-rockets', [0, '00', '0', 100, 5, 250, -1, 'N/A', '', '#00'])
+    assert [p and p['name'] for p in found] == ['Zero', 'Double Zero', 'Zero', 'Big Number', None, None, None,
+                                                None, None, 'Double Zero']
+    assert index.lookup_many('nba', 'houston-rockets', []) == []
+
+
+def test_save_and_load_round_trip(tmp_path):
+    rosters = fixtures.league_rosters(teams=5)
+    index = JerseyIndex.build(rosters)
+    path = str(tmp_path / JERSEY_INDEX_FILE)
+    index.save(path)
+
+    loaded = JerseyIndex.load(path)
+    assert loaded.stats == index.stats
+    for (sport, team), roster in rosters.items():
+        for player in roster:
+            assert loaded.lookup(sport, team, player['number']) == index.lookup(sport, team, player['number'])
+
+
+def test_interrupted_save_leaves_the_old_file(tmp_path, monkeypatch):
+    path = str(tmp_path / JERSEY_INDEX_FILE)
+    JerseyIndex.build(fixtures.league_rosters(teams=2)).save(path)
+
+    def partial_write(f, **arrays):
+        f.write(b'PK\x03\x04 truncated')
+        raise OSError("disk full")
+
+    monkeypatch.setattr('jersey_index.np.savez', partial_write)
+    with pytest.raises(OSError):
+        JerseyIndex.build(fixtures.league_rosters(teams=3)).save(path)
+    # A reader polling the file mid-write still loads the previous index
+    assert len(JerseyIndex.load(path).teams) == 2
+
+
+def test_league_crawl_saves_the_index(tmp_path):
+    roster_url = f"{BASE}/nba/team/_/name/hou/houston-rockets/roster"
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    rows = ''.join(
+        f'<tr><td></td><td><a href="/nba/player/_/id/{i}/p">Player Number{i}</a><span class="pl2 n10">{i}</span></td>'
+        f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>' for i in range(12))
+    session = FakeSession({roster_url: f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"})
+
+    crawl_all_teams('nba', max_pages_per_team=5, teams=['houston-rockets'], confirm=False, session=session,
+                    delay=0, output_dir=str(tmp_path))
+
+    index = JerseyIndex.load(os.path.join(str(tmp_path), 'nba', JERSEY_INDEX_FILE))
+    assert index.lookup('nba', 'houston-rockets', '11')['name'] == 'Player Number11'
+
+
+def test_subset_sweep_keeps_other_teams(tmp_path):
+    def roster(*names):
+        header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+        rows = ''.join(
+            f'<tr><td></td><td><a href="/nba/player/_/id/{i}/p">{name}</a><span class="pl2 n10">{i}</span></td>'
+            f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>' for i, name in enumerate(names))
+        return f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"
+
+    hou = f"{BASE}/nba/team/_/name/hou/houston-rockets/roster"
+    mia = f"{BASE}/nba/team/_/name/mia/miami-heat/roster"
+    session = FakeSession({hou: roster('Rocket Zero', 'Rocket One'), mia: roster('Heat Zero', 'Heat One')})
+    crawl_all_teams('nba', max_pages_per_team=5, teams=['houston-rockets', 'miami-heat'], confirm=False,
+                    session=session, delay=0, output_dir=str(tmp_path))
+
+    # A later run over one team only: its roster changes, the other team stays indexed
+    session.pages[hou] = roster('New Rocket Zero')
+    crawl_all_teams('nba', max_pages_per_team=5, teams=['houston-rockets'], confirm=False,
+                    session=session, delay=0, output_dir=str(tmp_path))
+
+    index = JerseyIndex.load(os.path.join(str(tmp_path), 'nba', JERSEY_INDEX_FILE))
+    assert index.lookup('nba', 'houston-rockets', '0')['name'] == 'New Rocket Zero'
+    assert index.lookup('nba', 'houston-rockets', '1') is None
+    assert index.lookup('nba', 'miami-heat', '1')['name'] == 'Heat One'
+    assert index.stats['teams'] == 2
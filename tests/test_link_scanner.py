@@ -0,0 +1,66 @@
+"""
+Tests for DOM-free link extraction on link-only pages
+"""
+
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from benchmarks import fixtures
+from link_scanner import iter_hrefs, scan_links
+from sports_crawler import SportsCrawler
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+HUB = f"{BASE}/nba/team/_/name/hou/houston-rockets"
+
+
+def soup_links(html, url=HUB):
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou')
+    return crawler._page_links(BeautifulSoup(html, 'html.parser'), url)
+
+
+def test_same_links_as_soup_on_hub_fixture():
+    html = fixtures.many_anchors_page(500)
+    assert scan_links(html.encode('utf-8'), HUB) == soup_links(html)
+
+
+def test_markup_edge_cases_match_soup():
+    html = (
+        '<!-- <a href="/commented-out">x</a> -->'
+        '<script>document.write(\'<a href="/from-script">x</a>\')</script>'
+        '<style>a[href="/styled"] { color: red }</style>'
+        "<a href='/nba/single'>single</a>"
+        '<A HREF="/nba/upper">upper</A>'
+        '<a title="a > b" href="/nba/gt-in-quotes">gt</a>'
+        '<a href="/nba/story?id=1&amp;page=2#top">amp</a>'
+        '<a href=/nba/bare>bare</a>'
+        '<a name="anchor-only">none</a>'
+        '<abbr href="/not-an-anchor">abbr</abbr>'
+        '<a href="/nba/first" href="/nba/last">duplicate</a>'
+        '<a title=" href=\'/nba/in-title\'" href="/nba/real">quoted</a>'
+        '<a href="/nba/glued"title="t">glued</a>'
+        '<a id=x href = /nba/spaced >spaced</a>'
+    )
+    links = scan_links(html.encode('utf-8'), HUB)
+    assert links == soup_links(html)
+    assert f"{BASE}/nba/story?id=1&page=2" in links
+    assert not any('commented' in url or 'script' in url or 'styled' in url for url in links)
+
+
+def test_iter_hrefs_accepts_text():
+    assert list(iter_hrefs('<a href="/a">a</a><a class="x" href="/b">b</a>')) == ['/a', '/b']
+
+
+def test_link_only_pages_skip_the_dom():
+    roster_url = f"{BASE}/nba/team/roster/_/name/hou/houston-rockets"
+    session = FakeSession({HUB: f'<a href="{roster_url}">Roster</a>', roster_url: '<p>empty</p>'})
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=session)
+    crawler.seed_urls = [HUB]
+
+    with mock.patch('sports_crawler.BeautifulSoup', wraps=BeautifulSoup) as soup:
+        crawler.crawl(max_pages=2, delay=0)
+
+    # The hub was scanned without a parse; only the routed roster page built a DOM
+    assert session.fetched == [HUB, roster_url]
+    assert soup.call_count == 1
@@ -0,0 +1,166 @@
+"""
+Tests for live game-day polling
+"""
+
+import json
+
+import pytest
+
+from live_games import LiveGames, RequestBudget, game_phase, parse_follow, parse_scoreboard
+from fake_http import FakeResponse, FakeSession
+
+SCOREBOARD = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def event(game_id, home, away, state='pre', name='STATUS_SCHEDULED', home_score='0', away_score='0',
+          period=0, clock='0:00', date='1970-01-01T00:10Z'):
+    return {
+        'id': game_id,
+        'date': date,
+        'competitions': [{
+            'status': {'period': period, 'displayClock': clock,
+                       'type': {'state': state, 'name': name, 'shortDetail': name}},
+            'competitors': [
+                {'homeAway': 'home', 'score': home_score, 'team': {'displayName': home}},
+                {'homeAway': 'away', 'score': away_score, 'team': {'displayName': away}},
+            ],
+        }],
+    }
+
+
+def board(*events):
+    return json.dumps({'events': list(events)})
+
+
+def make_live(session, clock, **kwargs):
+    return LiveGames({'nba': ['houston-rockets']}, session=session, min_interval=0, clock=clock,
+                     sleep=clock.sleep, **kwargs)
+
+
+def test_adaptive_intervals_and_deltas_through_a_game():
+    clock = FakeClock()
+    other = event('2', 'Miami Heat', 'Boston Celtics')
+    session = FakeSession({SCOREBOARD: board(event('1', 'Houston Rockets', 'Los Angeles Lakers'), other)})
+    live = make_live(session, clock)
+    updates = []
+    live.subscribe(lambda sport, game_id, changes, game: updates.append((game_id, changes)))
+
+    # Pre-game: tip-off at 600s, so poll at the 300s pre-game cap
+    live.run_pending()
+    assert [game_id for game_id, _ in updates] == ['1']  # the unfollowed game is ignored
+    assert updates[0][1]['home_team'] == 'houston-rockets' and updates[0][1]['start'] == 600
+    assert live.queue[0][0] == 300
+
+    # Unchanged board: no update pushed
+    clock.now = 300
+    live.run_pending()
+    assert len(updates) == 1 and live.queue[0][0] == 600
+
+    # Live: only the changed fields are pushed, and polling speeds up
+    session.pages[SCOREBOARD] = board(event('1', 'Houston Rockets', 'Los Angeles Lakers', 'in', 'STATUS_IN_PROGRESS',
+                                            home_score='2', period=1, clock='11:40'), other)
+    clock.now = 600
+    live.run_pending()
+    assert set(updates[-1][1]) == {'state', 'status', 'detail', 'home_score', 'period', 'clock'}
+    assert live.queue[0][0] == 615
+
+    # Halftime slows down
+    session.pages[SCOREBOARD] = board(event('1', 'Houston Rockets', 'Los Angeles Lakers', 'in', 'STATUS_HALFTIME',
+                                            home_score='55', away_score='50', period=2), other)
+    clock.now = 615
+    live.run_pending()
+    assert updates[-1][1]['away_score'] == '50'
+    assert live.queue[0][0] == 675
+
+    # Final: polling stops and run() returns
+    session.pages[SCOREBOARD] = board(event('1', 'Houston Rockets', 'Los Angeles Lakers', 'post', 'STATUS_FINAL',
+                                            home_score='110', away_score='102', period=4), other)
+    assert live.run() == 1
+    assert live.queue == []
+    assert game_phase(live.games[('nba', '1')]) == 'final'
+    assert len(session.fetched) == 5
+
+
+def test_budget_defers_polls_over_the_limit():
+    clock = FakeClock()
+    budget = RequestBudget(max_requests=2, window=60, clock=clock)
+    assert budget.acquire() and budget.acquire()
+    assert not budget.acquire()
+    assert budget.next_free() == 60
+    clock.now = 60
+    assert budget.acquire()
+
+    # A full slate: every live game's gamecast plus the board stays within the budget
+    games = [event(str(i), f"Home {i}", f"Away {i}", 'in', 'STATUS_IN_PROGRESS', period=1) for i in range(8)]
+    pages = {SCOREBOARD: board(*games)}
+    for i in range(8):
+        pages[f"{SCOREBOARD[:-len('scoreboard')]}summary?event={i}"] = json.dumps({
+            'header': {'competitions': [games[i]['competitions'][0]]}, 'plays': [{'text': 'Jump ball'}]})
+    session = FakeSession(pages)
+    clock = FakeClock()
+    live = LiveGames({'nba': None}, budget=4, window=60, gamecast=True, session=session, min_interval=0,
+                     clock=clock, sleep=clock.sleep)
+    live.run(duration=600)
+
+    assert len(session.fetched) <= 4 * (600 // 60 + 1)
+    assert live.stats['deferred'] > 0
+    assert all(game.get('last_play') == 'Jump ball' for game in live.games.values())
+
+
+def test_not_modified_responses_and_follow_parsing():
+    class ETagSession(FakeSession):
+        def get(self, url, headers=None, timeout=None, stream=False):
+            self.fetched.append((url, headers))
+            if headers and headers.get('If-None-Match') == '"v1"':
+                return FakeResponse('', 304)
+            response = FakeResponse(self.pages[url])
+            response.headers = {'ETag': '"v1"'}
+            return response
+
+    clock = FakeClock()
+    session = ETagSession({SCOREBOARD: board(event('1', 'Houston Rockets', 'Los Angeles Lakers'))})
+    live = make_live(session, clock)
+    live.run_pending()
+    clock.now = 300
+    live.run_pending()
+    assert session.fetched[1][1] == {'If-None-Match': '"v1"'}
+    assert live.stats['not_modified'] == 1 and live.stats['updates'] == 1
+
+    assert parse_follow('nba:houston-rockets,nba:miami-heat,nfl') == {
+        'nba': ['houston-rockets', 'miami-heat'], 'nfl': None}
+    assert parse_scoreboard({'events': []}) == {}
+    with pytest.raises(ValueError):
+        LiveGames({'cricket': None})
+
+
+def test_failing_polls_stop_using_the_budget():
+    # A live game whose gamecast 404s: retried from the scoreboard, then the scoreboard takes over
+    clock = FakeClock()
+    live_game = event('1', 'Houston Rockets', 'Los Angeles Lakers', 'in', 'STATUS_IN_PROGRESS', period=1)
+    session = FakeSession({SCOREBOARD: board(live_game)})
+    live = make_live(session, clock, gamecast=True, budget=100)
+    live.run(duration=600)
+
+    gamecasts = [url for url in session.fetched if 'summary' in url]
+    assert len(gamecasts) == live.max_failures
+    # Once given up on, the game is followed at the live interval from the scoreboard
+    assert live.queue[0][2] == ('scoreboard', 'nba') and len(live.queue) == 1
+    assert live.queue[0][0] - clock.now <= live.intervals['live']
+
+    # A scoreboard that keeps failing is dropped after max_failures polls
+    clock = FakeClock()
+    session = FakeSession({})
+    live = make_live(session, clock)
+    live.run()
+    assert len(session.fetched) == live.max_failures and live.queue == []
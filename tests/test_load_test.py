@@ -0,0 +1,45 @@
+"""
+Tests for the simulated ESPN server, crawler retries and the load-test driver
+"""
+
+from benchmarks.load_test import CONFIGS, run_config
+from benchmarks.simulated_espn import SimulatedESPN, SimulationProfile
+from crawl_metrics import CrawlMetrics
+from sports_crawler import SportsCrawler
+
+TEAMS = [('hou', 'houston-rockets'), ('bos', 'boston-celtics')]
+
+
+def test_crawler_retries_through_429_bursts_and_redirects():
+    profile = SimulationProfile(latency_ms=1, burst_every=3, burst_length=1, redirect_rate=0.3, redirect_hops=2)
+    with SimulatedESPN(profile, teams=TEAMS[:1], extra_pages=1) as server:
+        crawler = SportsCrawler('nba', 'houston-rockets', 'hou', metrics=CrawlMetrics(), base_url=server.base_url)
+        crawler.retry_backoff = 0.01
+        crawler.crawl(max_pages=6, delay=0)
+
+    assert server.stats['429'] > 0
+    assert crawler.retry_count >= server.stats['429'] - 1
+    assert len(crawler.scraped_data['roster']) == 18
+
+
+def test_truncated_bodies_are_retried():
+    profile = SimulationProfile(latency_ms=1, truncate_rate=0.5, seed=3)
+    with SimulatedESPN(profile, teams=TEAMS[:1], extra_pages=1) as server:
+        crawler = SportsCrawler('nba', 'houston-rockets', 'hou', metrics=CrawlMetrics(), base_url=server.base_url)
+        crawler.retry_backoff = 0.01
+        crawler.max_retries = 5
+        crawler.crawl(max_pages=6, delay=0)
+
+    assert server.stats['truncated'] > 0
+    assert crawler.retry_count > 0
+
+
+def test_load_test_report():
+    with SimulatedESPN(SimulationProfile(latency_ms=2), teams=TEAMS, extra_pages=1) as server:
+        report = run_config('teams_x4', CONFIGS['teams_x4'], server, max_pages=8)
+
+    assert report['pages'] == 16
+    assert report['requests'] >= 16
+    assert report['latency_ms']['p50'] <= report['latency_ms']['p95'] <= report['latency_ms']['p99']
+    assert report['memory']['samples']
+    assert report['players_found'] == 36
@@ -0,0 +1,119 @@
+"""
+Tests for the fuzzy player name index
+"""
+
+from unittest import mock
+
+import pytest
+
+from benchmarks import fixtures
+from name_index import NameIndex, normalize_name
+from sports_crawler import crawl_all_teams
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def test_typos_and_accents_find_the_player():
+    index = NameIndex()
+    index.add_roster('nba', 'houston-rockets', [
+        {'name': 'Fred VanVleet', 'number': '5', 'player_id': '3000'},
+        {'name': 'Alperen Şengün', 'number': '28', 'player_id': '3001'},
+        {'name': 'Jalen Green', 'number': '4', 'player_id': '3002'},
+    ])
+    index.add_roster('nfl', 'green-bay-packers', [{'name': 'Jalen Greene', 'number': '12', 'player_id': '9'}])
+
+    assert normalize_name('Alperen Şengün') == 'alperen sengun'
+    assert index.search('fred van vleet')[0][1]['name'] == 'Fred VanVleet'
+    assert index.search('alperen sengun', k=1)[0][1]['number'] == '28'
+
+    top = index.search('jalen gren', k=2)
+    assert [record['name'] for _, record in top] == ['Jalen Green', 'Jalen Greene']
+    assert top[0][0] > top[1][0]
+
+    assert [r['sport'] for _, r in index.search('jalen gren', sport='nfl')] == ['nfl']
+    assert index.search('jalen gren', sport='mlb') == []
+    assert index.search('zzzz qqqq') == []
+
+
+def test_incremental_updates_replace_players():
+    index = NameIndex()
+    index.add('nba', 'houston-rockets', {'name': 'Jalen Green', 'number': '4', 'player_id': '1'})
+    # Same player re-scraped with a new number, then with a corrected name
+    index.add('nba', 'houston-rockets', {'name': 'Jalen Green', 'number': '0', 'player_id': '1'})
+    assert len(index) == 1
+    assert index.search('jalen green')[0][1]['number'] == '0'
+
+    index.add('nba', 'houston-rockets', {'name': 'Jalen Greene', 'number': '0', 'player_id': '1'})
+    assert len(index) == 1
+    assert [r['name'] for _, r in index.search('jalen green', k=5)] == ['Jalen Greene']
+    assert index.add('nba', 'houston-rockets', {'name': 'N/A'}) is None
+
+
+def test_save_load_and_top_k_over_a_league(tmp_path):
+    index = NameIndex()
+    for (sport, team), roster in fixtures.league_rosters(teams=40, players=30).items():
+        index.add_roster(sport, team, roster)
+    target = index.records[123]
+
+    path = str(tmp_path / 'names.npz')
+    index.save(path)
+    loaded = NameIndex.load(path)
+    assert len(loaded) == len(index)
+
+    results = loaded.search(fixtures.misspell(target['name'], seed=3), k=5)
+    assert len(results) == 5
+    assert target['name'] in [record['name'] for _, record in results]
+    assert [score for score, _ in results] == sorted((score for score, _ in results), reverse=True)
+
+    # An interrupted save leaves the previous file loadable
+    def partial_write(f, **arrays):
+        f.write(b'PK\x03\x04 truncated')
+        raise OSError("disk full")
+
+    with mock.patch('name_index.np.savez', partial_write), pytest.raises(OSError):
+        NameIndex().save(path)
+    assert len(NameIndex.load(path)) == len(index)
+
+    # Loaded indexes keep taking updates
+    loaded.add('nba', 'team-0', {'name': 'Brand New Rookie', 'player_id': 'x1'})
+    assert loaded.search('brand new rooky', k=1)[0][1]['name'] == 'Brand New Rookie'
+
+
+def roster_page(*names):
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    rows = ''.join(f'<tr><td></td><td>{name}<span class="pl2 n10">{i}</span></td>'
+                   f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>'
+                   for i, name in enumerate(names))
+    return f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"
+
+
+def test_replacing_a_team_retires_players_who_left():
+    index = NameIndex()
+    index.add_roster('nba', 'houston-rockets', [{'name': 'Jalen Green'}, {'name': 'Dillon Brooks'}])
+    index.add_roster('nba', 'phoenix-suns', [{'name': 'Kevin Durant'}])
+
+    assert index.replace_team('nba', 'houston-rockets', [{'name': 'Jalen Green', 'number': '4'},
+                                                         {'name': 'Kevin Durant', 'number': '7'}]) == 2
+    assert index.search('dillon brooks') == []
+    assert sorted(r['team'] for _, r in index.search('kevin durant')) == ['houston-rockets', 'phoenix-suns']
+    assert len(index) == 3
+
+
+def test_league_sweeps_replace_crawled_teams(tmp_path):
+    roster_url = f"{BASE}/nba/team/_/name/hou/houston-rockets/roster"
+    session = FakeSession({roster_url: roster_page('Jalen Green', 'Dillon Brooks')})
+    index = NameIndex()
+    sweep = dict(max_pages_per_team=3, teams=['houston-rockets'], confirm=False, session=session, delay=0,
+                 output_dir=str(tmp_path), name_index=index)
+
+    crawl_all_teams('nba', **sweep)
+    assert index.search('amen thomson') == []
+    assert index.search('dillon brooks', k=1)[0][1]['team'] == 'houston-rockets'
+
+    # Next run: Brooks has been traded, Thompson signed
+    session.pages[roster_url] = roster_page('Jalen Green', 'Amen Thompson')
+    crawl_all_teams('nba', **sweep)
+    assert index.search('dillon brooks') == []
+    assert index.search('amen thomson', k=1)[0][1]['team'] == 'houston-rockets'
+    assert len(index) == 2
@@ -0,0 +1,87 @@
+"""
+Tests for the bounded fan-out player-detail crawl stage
+"""
+
+from fetch_coordinator import FetchCoordinator
+from sports_crawler import SportsCrawler
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def roster_page(player_count):
+    rows = []
+    for i in range(player_count):
+        rows.append(
+            f'<tr><td></td><td><a href="/nba/player/_/id/{i}/player-{i}">Player Number{i}</a>'
+            f'<span class="pl2 n10">{i}</span></td><td>G</td><td>25</td>'
+            f'<td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>'
+        )
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    return f"<table><thead>{header}</thead><tbody>{''.join(rows)}</tbody></table>"
+
+
+def player_page(i):
+    links = ''.join(f'<a href="/nba/player/_/id/{i + 100 + j}/other">x</a>' for j in range(5))
+    links += ''.join(f'<a href="/nba/team/schedule/_/name/hou/houston-rockets/p{i}-{j}">s</a>' for j in range(5))
+    return (
+        f'<h1 class="PlayerHeader__Name"><span>Player</span><span>Number{i}</span></h1>'
+        '<ul class="PlayerHeader__Bio_List"><li><div>HT/WT</div><div>6\' 5", 200 lbs</div></li></ul>'
+        '<div class="StatBlockInner"><div class="StatBlockInner__Label">PTS</div>'
+        '<div class="StatBlockInner__Value">21.4</div></div>'
+        f'{links}'
+    )
+
+
+def make_crawler(player_count):
+    roster_url = f"{BASE}/nba/team/roster/_/name/hou/houston-rockets"
+    pages = {roster_url: roster_page(player_count)}
+    for i in range(player_count):
+        pages[f"{BASE}/nba/player/_/id/{i}/player-{i}"] = player_page(i)
+
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=FakeSession(pages))
+    crawler.seed_urls = [roster_url]
+    return crawler
+
+
+def test_player_pages_stay_out_of_frontier_and_respect_budget():
+    crawler = make_crawler(20)
+    crawler.crawl(max_pages=1, delay=0, player_pages=5, player_workers=3)
+
+    players = crawler.scraped_data['players']
+    assert len(crawler.scraped_data['roster']) == 20
+    assert len(players) == 5
+    assert all(p['stats']['PTS'] == '21.4' for p in players)
+    assert players[0]['bio']['HT/WT'] == '6\' 5", 200 lbs'
+    assert players[0]['name'] == 'Player Number0'
+
+    # No player page ever entered the BFS queue; fan-out capped at 2 per player page
+    assert not any('/player/' in url for url in crawler.url_queue)
+    assert len(crawler.url_queue) <= 5 * 2
+
+
+def test_player_stage_disabled_by_default():
+    crawler = make_crawler(3)
+    crawler.crawl(max_pages=3, delay=0)
+
+    assert crawler.scraped_data['players'] == []
+    assert set(crawler.player_urls) == {'0', '1', '2'}
+    assert not any('/player/' in url for url in crawler.session.fetched)
+
+
+def test_frontier_and_player_stage_share_a_coordinator_without_mixing_results():
+    crawler = make_crawler(2)
+    crawler.coordinator = FetchCoordinator()
+    first, second = (f"{BASE}/nba/player/_/id/{i}/player-{i}" for i in range(2))
+    crawler.player_urls = {'0': first, '1': second}
+
+    # A player URL reached the frontier (e.g. a sitemap seed) before the player stage ran
+    assert 'records' in crawler._load_page(first)
+    players = crawler.crawl_players(max_players=2, delay=0)
+    assert [p['name'] for p in players] == ['Player Number0', 'Player Number1']
+
+    # ... and the other way round
+    assert set(crawler._load_page(second)) == {'url', 'records', 'links'}
+    assert crawler.coordinator.stats['misses'] == 4
+    assert first in crawler.coordinator and crawler.coordinator.contains(first, 'player')
+    assert not crawler.coordinator.contains(f"{BASE}/nba/player/_/id/9/player-9", 'player')
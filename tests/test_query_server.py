@@ -0,0 +1,103 @@
+"""
+Tests for serve mode: in-memory indexes, hot reload and the HTTP API
+"""
+
+import http.client
+import json
+import os
+
+from query_server import DataStore, latency_benchmark, serve
+from sports_crawler import crawl_all_teams
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def player(name, number):
+    return {'name': name, 'number': number, 'position': 'G', 'player_id': 'N/A'}
+
+
+def write_team(data_dir, sport, team, roster, schedule=(), mtime=None):
+    directory = os.path.join(data_dir, sport)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{team}.json")
+    with open(path, 'w') as f:
+        json.dump({'roster': roster, 'schedule': list(schedule), 'news': [], 'stats': []}, f)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_queries_and_hot_reload(tmp_path):
+    data_dir = str(tmp_path)
+    write_team(data_dir, 'nba', 'houston-rockets', [player('Fred VanVleet', '5'), player('Jalen Green', '4'),
+                                                    player('Unknown Guy', 'N/A')],
+               schedule=[{'game': 'vs LAL'}], mtime=1000)
+    store = DataStore(data_dir)
+    assert store.reload() == 1
+
+    status, body = store.query('/nba/houston-rockets/player/5')
+    assert status == 200 and json.loads(body)['name'] == 'Fred VanVleet'
+    assert json.loads(store.query('/nba/houston-rockets/player/%234')[1])['name'] == 'Jalen Green'
+    assert len(json.loads(store.query('/nba/houston-rockets/roster')[1])['players']) == 3
+    assert json.loads(store.query('/nba/houston-rockets/schedule')[1])['games'] == [{'game': 'vs LAL'}]
+    assert store.query('/nba/houston-rockets/player/99')[0] == 404
+    assert store.query('/nba/miami-heat/roster')[0] == 404
+    assert store.query('/nba/houston-rockets/player/N/A')[0] == 404
+
+    matches = json.loads(store.query('/search?q=fred+van+fleet&k=1')[1])['matches']
+    assert [(m['name'], m['team']) for m in matches] == [('Fred VanVleet', 'houston-rockets')]
+    assert store.query('/search')[0] == 400
+
+    # Unchanged files aren't reloaded; a rewritten one is, and new teams appear
+    assert store.reload() == 0
+    write_team(data_dir, 'nba', 'houston-rockets', [player('Amen Thompson', '1')], mtime=2000)
+    write_team(data_dir, 'nba', 'miami-heat', [player('Bam Adebayo', '13')], mtime=2000)
+    assert store.reload() == 2
+    assert store.query('/nba/houston-rockets/player/5')[0] == 404
+    assert json.loads(store.query('/nba/miami-heat/player/13')[1])['team'] == 'miami-heat'
+    assert json.loads(store.query('/teams')[1]) == ['nba/houston-rockets', 'nba/miami-heat']
+
+    os.remove(os.path.join(data_dir, 'nba', 'miami-heat.json'))
+    store.reload()
+    assert store.query('/nba/miami-heat/roster')[0] == 404
+
+
+def test_http_api_and_latency_benchmark(tmp_path):
+    write_team(str(tmp_path), 'nba', 'houston-rockets', [player(f"Player {i}", str(i)) for i in range(15)])
+    store = DataStore(str(tmp_path))
+    store.reload()
+    server = serve(store, port=0)
+    try:
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        connection.request('GET', '/nba/houston-rockets/player/7')
+        response = connection.getresponse()
+        assert response.status == 200
+        assert json.loads(response.read())['name'] == 'Player 7'
+        # Same keep-alive connection
+        connection.request('GET', '/nba/houston-rockets/player/70')
+        assert connection.getresponse().status == 404
+        connection.close()
+
+        results = latency_benchmark(store, queries=500, server=server)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert results['in_process']['p50_us'] < 1000
+    assert results['http']['count'] == 500
+
+
+def test_league_crawl_writes_team_files_for_serve_mode(tmp_path):
+    roster_url = f"{BASE}/nba/team/_/name/hou/houston-rockets/roster"
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    rows = ''.join(
+        f'<tr><td></td><td><a href="/nba/player/_/id/{i}/p">Player Number{i}</a><span class="pl2 n10">{i}</span></td>'
+        f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>' for i in range(12))
+    session = FakeSession({roster_url: f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"})
+
+    crawl_all_teams('nba', max_pages_per_team=5, teams=['houston-rockets'], confirm=False, session=session,
+                    delay=0, output_dir=str(tmp_path))
+
+    store = DataStore(str(tmp_path))
+    store.reload()
+    assert json.loads(store.query('/nba/houston-rockets/player/3')[1])['name'] == 'Player Number3'
@@ -0,0 +1,159 @@
+"""
+Tests for sitemap-driven discovery
+"""
+
+import os
+import tracemalloc
+from datetime import datetime, timezone
+
+from crawl_metrics import CrawlMetrics
+from crawl_refresh import RefreshDaemon
+from sitemap_discovery import SitemapDiscovery, iter_sitemap, parse_lastmod
+from sports_crawler import SportsCrawler, crawl_all_teams
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+INDEX = os.path.join(FIXTURES, 'sitemap_index.xml')
+
+
+def test_streaming_parse_matches_in_small_chunks():
+    with open(os.path.join(FIXTURES, 'sitemap_nba_teams.xml'), 'rb') as f:
+        data = f.read()
+    whole = list(iter_sitemap([data]))
+    chunked = list(iter_sitemap(data[i:i + 7] for i in range(0, len(data), 7)))
+    assert chunked == whole
+    assert whole[0] == ('url', f"{BASE}/nba/team/roster/_/name/bos/boston-celtics", parse_lastmod('2024-03-01'))
+    assert parse_lastmod('2024-03-02T18:00:00Z') == parse_lastmod('2024-03-02T18:00:00+00:00')
+    assert parse_lastmod('yesterday') is None
+
+
+def test_streaming_memory_stays_flat():
+    entry = '<url><loc>https://www.espn.com/nba/team/roster/_/name/t{0}/team-{0}</loc><lastmod>2024-03-01</lastmod></url>'
+
+    def chunks(count):
+        yield b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        for start in range(0, count, 500):
+            yield ''.join(entry.format(i) for i in range(start, start + 500)).encode()
+        yield b'</urlset>'
+
+    def peak(count):
+        tracemalloc.start()
+        try:
+            assert sum(1 for _ in iter_sitemap(chunks(count))) == count
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # Ten times the entries, about the same peak (a retained tree grows linearly)
+    assert peak(20_000) < 2 * peak(2_000)
+
+
+def test_index_with_local_and_gzipped_children():
+    discovery = SitemapDiscovery(INDEX, sport='nba')
+    urls = [url for url, _ in discovery.entries()]
+
+    assert discovery.stats['sitemaps'] == 3
+    assert f"{BASE}/nba/team/roster/_/name/mia/miami-heat" in urls
+    assert f"{BASE}/nfl/team/roster/_/name/buf/buffalo-bills" not in urls
+    # Player pages carry no team: left to the roster-driven player stage
+    assert not any('/player/' in url for url in urls)
+    assert discovery.lastmod[f"{BASE}/nba/team/news/_/name/bos/boston-celtics"] == \
+        parse_lastmod('2024-03-02T18:00:00Z')
+
+
+def test_sitemap_over_http():
+    with open(os.path.join(FIXTURES, 'sitemap_nba_teams.xml')) as f:
+        teams_xml = f.read()
+    index = (f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+             f'<sitemap><loc>{BASE}/sitemap/nba-teams.xml</loc></sitemap>'
+             f'<sitemap><loc>{BASE}/sitemap/missing.xml</loc></sitemap></sitemapindex>')
+    session = FakeSession({f"{BASE}/sitemap.xml": index, f"{BASE}/sitemap/nba-teams.xml": teams_xml})
+    discovery = SitemapDiscovery(f"{BASE}/sitemap.xml", session=session, sport='nba')
+    assert len(discovery.entries()) == 6
+    assert discovery.stats['sitemaps'] == 3
+
+
+def test_seed_skips_hub_pages():
+    crawler = SportsCrawler('nba', 'boston-celtics', 'bos', session=FakeSession({}))
+    added = SitemapDiscovery(INDEX, sport='nba').seed(crawler)
+
+    assert added == [
+        f"{BASE}/nba/team/roster/_/name/bos/boston-celtics",
+        f"{BASE}/nba/team/schedule/_/name/bos/boston-celtics",
+    ]
+    assert crawler.seed_urls[:2] == added
+    # Link-only hubs (the team home page, the depth chart) aren't fetched for links
+    assert f"{BASE}/nba/team/_/name/bos/boston-celtics" not in crawler.seed_urls
+    assert f"{BASE}/nba/team/depth/_/name/bos/boston-celtics" not in crawler.seed_urls
+    assert all(crawler._page_type(url) != 'link' for url in crawler.seed_urls)
+
+
+def test_league_crawl_with_sitemap_never_fetches_hubs(tmp_path):
+    session = FakeSession({})
+    crawl_all_teams('nba', max_pages_per_team=10, teams=['boston-celtics', 'miami-heat'], confirm=False,
+                    session=session, delay=0, output_dir=str(tmp_path),
+                    sitemap=SitemapDiscovery(INDEX, sport='nba'))
+    assert f"{BASE}/nba/team/roster/_/name/mia/miami-heat" in session.fetched
+    assert not any(url.endswith(('/boston-celtics', '/miami-heat')) and '/team/_/' in url
+                   for url in session.fetched)
+
+
+def test_refresh_skips_pages_unchanged_since_last_fetch():
+    clock = [parse_lastmod('2024-03-05')]
+    news_url = f"{BASE}/nba/team/news/_/name/bos/boston-celtics"
+    session = FakeSession({news_url: '<article><h2>Celtics win a close one</h2></article>'})
+    daemon = RefreshDaemon(ttls={'news': 600}, session=session, metrics=CrawlMetrics(), min_interval=0,
+                           clock=lambda: clock[0], sleep=lambda seconds: None)
+    daemon.add_team('nba', 'boston-celtics', 'bos')
+    daemon.add_sitemap(SitemapDiscovery(INDEX, sport='nba'))
+
+    assert daemon.run_pending() == 1
+    assert len(session.fetched) == 1
+
+    # Lastmod (March 2nd) is older than our fetch, but it was read before that fetch
+    clock[0] = daemon.next_due()
+    assert daemon.run_pending() == 1
+    assert daemon.stats['skipped'] == 0 and len(session.fetched) == 2
+
+    # Reread after the fetch, it still says nothing changed: no request at all
+    clock[0] = daemon.next_due()
+    assert daemon.run_pending() == 1
+    assert daemon.stats['skipped'] == 1 and len(session.fetched) == 2
+
+
+def test_refresh_rereads_the_sitemap_every_cycle():
+    news_url = f"{BASE}/nba/team/news/_/name/bos/boston-celtics"
+    sitemap_url = f"{BASE}/sitemap-news.xml"
+
+    def urlset(lastmod):
+        stamp = datetime.fromtimestamp(lastmod, timezone.utc).isoformat()
+        return (f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                f'<url><loc>{news_url}</loc><lastmod>{stamp}</lastmod></url></urlset>')
+
+    clock = [parse_lastmod('2024-03-05')]
+    session = FakeSession({news_url: '<article><h2>Celtics story 0</h2></article>',
+                           sitemap_url: urlset(clock[0] - 60)})
+    daemon = RefreshDaemon(ttls={'news': 600}, session=session, metrics=CrawlMetrics(), min_interval=0,
+                           clock=lambda: clock[0], sleep=lambda seconds: None)
+    daemon.add_team('nba', 'boston-celtics', 'bos')
+    daemon.add_sitemap(SitemapDiscovery(sitemap_url, session=session, sport='nba'))
+
+    # The page changes before every cycle and the sitemap says so
+    for cycle in range(6):
+        if cycle:
+            clock[0] = daemon.next_due()
+            session.pages[news_url] = f'<article><h2>Celtics story {cycle}</h2></article>'
+            session.pages[sitemap_url] = urlset(clock[0] - 1)
+        assert daemon.run_pending() == 1
+    news_fetches = [url for url in session.fetched if url == news_url]
+    assert len(news_fetches) == 6
+    assert daemon.stats['changed'] == 6 and daemon.stats['skipped'] == 0
+
+    # Then it stops changing: the reread sitemap lets refreshes skip the page
+    for _ in range(3):
+        clock[0] = daemon.next_due()
+        assert daemon.run_pending() == 1
+    assert [url for url in session.fetched if url == news_url] == news_fetches
+    assert daemon.stats['skipped'] == 3
+    assert daemon.data('nba', 'boston-celtics')['news'][0]['title'] == 'Celtics story 5'
@@ -0,0 +1,71 @@
+"""
+Tests for stats page extraction into NumPy stat matrices
+"""
+
+import numpy as np
+from bs4 import BeautifulSoup
+from sports_stats import StatMatrix, parse_stat_value, extract_stat_matrices, combine_stat_matrices
+
+# ESPN-style split layout: fixed name table + scrolling stats table
+SPLIT_STATS_PAGE = """
+<div class="ResponsiveTable">
+  <div class="Table__Title">Player Stats</div>
+  <table class="Table Table--fixed-left">
+    <thead><tr><th>Name</th></tr></thead>
+    <tbody>
+      <tr><td><a href="/nba/player/_/id/1/alperen-sengun">Alperen Sengun</a><span>C</span></td></tr>
+      <tr><td><a href="/nba/player/_/id/2/fred-vanvleet">Fred VanVleet</a><span>PG</span></td></tr>
+      <tr><td>Total</td></tr>
+    </tbody>
+  </table>
+  <div class="Table__Scroller">
+    <table class="Table">
+      <thead><tr><th>GP</th><th>MIN</th><th>PTS</th><th>FG%</th></tr></thead>
+      <tbody>
+        <tr><td>78</td><td>33:30</td><td>19.1</td><td>49.6%</td></tr>
+        <tr><td>60</td><td>36.0</td><td>14.1</td><td>--</td></tr>
+        <tr><td>82</td><td>240</td><td>114.3</td><td>46.0</td></tr>
+      </tbody>
+    </table>
+  </div>
+</div>
+"""
+
+
+def test_parse_stat_value():
+    assert parse_stat_value('1,234') == 1234.0
+    assert parse_stat_value('49.6%') == 49.6
+    assert parse_stat_value('18:30') == 18.5
+    assert np.isnan(parse_stat_value('--'))
+
+
+def test_extract_split_layout():
+    soup = BeautifulSoup(SPLIT_STATS_PAGE, 'html.parser')
+    matrices = extract_stat_matrices(soup)
+
+    assert len(matrices) == 1
+    matrix = matrices[0]
+    assert matrix.title == 'Player Stats'
+    assert matrix.players == ['Alperen Sengun', 'Fred VanVleet']  # Total row dropped
+    assert matrix.columns == ['GP', 'MIN', 'PTS', 'FG%']
+    assert matrix.values.shape == (2, 4)
+    assert matrix.column('MIN')[0] == 33.5
+    assert np.isnan(matrix.column('FG%')[1])
+
+
+def test_league_combine_and_leaderboard():
+    rockets = StatMatrix(['A', 'B'], ['GP', 'PTS'], [[80, 20.0], [70, 10.0]], title='Player Stats')
+    celtics = StatMatrix(['C'], ['PTS', 'AST'], [[25.0, 5.0]], title='Player Stats')
+
+    league = combine_stat_matrices({'houston-rockets': [rockets], 'boston-celtics': [celtics]})
+    matrix = league['Player Stats']
+
+    assert matrix.columns == ['GP', 'PTS', 'AST']
+    assert matrix.values.shape == (3, 3)
+    assert np.isnan(matrix.column('GP')[2])
+    assert matrix.leaderboard('PTS', n=2) == [('C', 'boston-celtics', 25.0), ('A', 'houston-rockets', 20.0)]
+
+    # Round trip through the JSON-friendly form
+    restored = StatMatrix.from_dict(matrix.to_dict())
+    assert restored.players == matrix.players
+    assert np.array_equal(np.isnan(restored.values), np.isnan(matrix.values))
@@ -0,0 +1,91 @@
+"""
+Tests for vectorized roster table scoring and weight calibration
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+from bs4 import BeautifulSoup
+
+from benchmarks import fixtures
+from sports_crawler import SportsCrawler
+from table_scoring import (DEFAULT_WEIGHTS_FILE, FEATURES, TableScorer, accuracy, calibrate, corpus_features,
+                           count_matrix, feature_matrix, load_corpus, main)
+
+
+def tables_of(html):
+    return BeautifulSoup(html, 'html.parser').find_all('table')
+
+
+def test_features_reproduce_hand_tuned_scores():
+    roster, noise = tables_of(fixtures.roster_table(18) + fixtures.noise_table(4))
+    counts = count_matrix([roster, noise])
+    assert counts[0].tolist() == [4, 18, 18, 10, 10, 19]
+    assert counts[1].tolist() == [0, 0, 0, 0, 0, 5]
+
+    scores = TableScorer().score(feature_matrix(counts))
+    # header 30 + jerseys 25 + links 20 + heights 10 + weights 5 + size 10; the noise table is only "decent size"
+    assert scores.tolist() == [100.0, 5.0]
+
+
+def test_batch_scoring_matches_per_page_picks():
+    scorer = TableScorer()
+    pages = [tables_of(html) for html, _ in fixtures.labelled_table_pages(30)]
+    picks = []
+    for tables in pages:
+        best = scorer.best(tables)
+        picks.append(best[0] if best else None)
+    assert scorer.best_per_page(pages) == picks
+
+
+def test_crawler_uses_its_table_weights():
+    soup = BeautifulSoup(fixtures.many_tables_page(tables=6), 'html.parser')
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou')
+    assert crawler._find_roster_table_improved(soup).find(class_='pl2 n10') is not None
+
+    # Weights that nothing can satisfy: no table is picked
+    picky = SportsCrawler('nba', 'houston-rockets', 'hou', table_scorer=TableScorer({'bias': -1000}))
+    assert picky._find_roster_table_improved(soup) is None
+
+
+def test_calibration_fixes_pages_without_a_roster(tmp_path):
+    pages, labels = corpus_features(fixtures.labelled_table_pages(150))
+    before = accuracy(pages, labels, TableScorer().vector)
+    weights = calibrate(pages, labels)
+    after = accuracy(pages, labels, TableScorer(weights).vector)
+    assert after > before
+    assert set(weights) == set(FEATURES)
+
+    # Holds up on pages it wasn't fitted on
+    held_out, held_labels = corpus_features(fixtures.labelled_table_pages(60, seed=99))
+    assert accuracy(held_out, held_labels, TableScorer(weights).vector) >= \
+        accuracy(held_out, held_labels, TableScorer().vector)
+
+    path = tmp_path / 'weights.json'
+    TableScorer(weights).save(path, accuracy=after)
+    assert np.array_equal(TableScorer.load(path).vector, TableScorer(weights).vector)
+
+
+def test_corpus_file_with_html_paths(tmp_path):
+    (tmp_path / 'roster.html').write_text(fixtures.noise_table(3) + fixtures.roster_table(12))
+    corpus_path = tmp_path / 'corpus.jsonl'
+    corpus_path.write_text(
+        json.dumps({'path': 'roster.html', 'roster_table': 1}) + '\n'
+        + json.dumps({'html': fixtures.noise_table(8), 'roster_table': None}) + '\n')
+
+    corpus = load_corpus(str(corpus_path))
+    assert [label for _, label in corpus] == [1, None]
+    pages, labels = corpus_features(corpus)
+    assert accuracy(pages, labels, TableScorer().vector) == 0.5
+
+
+def test_cli_needs_an_explicit_output(tmp_path):
+    with pytest.raises(SystemExit):
+        main(['--synthetic', '20'])
+    assert not os.path.exists(DEFAULT_WEIGHTS_FILE)
+
+    path = str(tmp_path / 'synthetic_weights.json')
+    main(['--synthetic', '20', '--epochs', '2', '--output', path])
+    assert set(TableScorer.load(path).weights) == set(FEATURES)
@@ -0,0 +1,114 @@
+"""
+Tests for speculative template seeds
+"""
+
+import datetime
+import json
+
+from sports_data import current_season
+from sports_crawler import SportsCrawler, crawl_all_teams
+from url_templates import TemplateProber
+from fake_http import FakeSession
+
+BASE = "https://www.espn.com"
+
+
+def roster_page(player_count):
+    rows = ''.join(
+        f'<tr><td></td><td><a href="/nba/player/_/id/{i}/p">Player Number{i}</a><span class="pl2 n10">{i}</span></td>'
+        f'<td>G</td><td>25</td><td>6\' 5"</td><td>200 lbs</td><td>Duke</td></tr>'
+        for i in range(player_count))
+    header = '<tr><th></th><th>Name</th><th>POS</th><th>Age</th><th>HT</th><th>WT</th><th>College</th></tr>'
+    return f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"
+
+
+def team_pages(abbrev, team):
+    # Only the section-first roster URL is live; the suffix seeds are all 404
+    return {
+        f"{BASE}/nba/team/_/name/{abbrev}/{team}": '<p>home</p>',
+        f"{BASE}/nba/team/roster/_/name/{abbrev}/{team}": roster_page(12),
+    }
+
+
+def test_expand_fills_templates():
+    crawler = SportsCrawler('nfl', 'buffalo-bills', 'buf', session=FakeSession({}))
+    urls = [url for _, url in TemplateProber(season=2024).expand(crawler)]
+    assert f"{BASE}/nfl/team/roster/_/name/buf/buffalo-bills" in urls
+    assert f"{BASE}/nfl/team/schedule/_/name/buf/season/2024" in urls
+    assert urls[-1] == f"{BASE}/nfl/team/depth/_/name/buf/buffalo-bills/depth-chart"
+
+
+def test_live_templates_are_promoted_and_dead_seeds_dropped():
+    session = FakeSession(team_pages('bos', 'boston-celtics'))
+    crawler = SportsCrawler('nba', 'boston-celtics', 'bos', session=session)
+    promoted = TemplateProber().promote(crawler)
+
+    roster_url = f"{BASE}/nba/team/roster/_/name/bos/boston-celtics"
+    assert promoted == [roster_url]
+    assert crawler.seed_urls == [roster_url, f"{BASE}/nba/team/_/name/bos/boston-celtics"]
+    assert session.fetched == []
+
+    crawler.crawl(max_pages=1, delay=0)
+    assert len(crawler.scraped_data['roster']) == 12
+
+
+def test_known_templates_skip_probing(tmp_path):
+    cache_path = str(tmp_path / 'templates.json')
+    prober = TemplateProber(min_probes=2, cache_path=cache_path)
+    pages = {}
+    for abbrev, team in (('bos', 'boston-celtics'), ('mia', 'miami-heat')):
+        pages.update(team_pages(abbrev, team))
+    session = FakeSession(pages)
+
+    for abbrev, team in (('bos', 'boston-celtics'), ('mia', 'miami-heat')):
+        prober.promote(SportsCrawler('nba', team, abbrev, session=session))
+    # The depth chart template has no extractor, so it is never probed
+    routed = len(prober.templates) - 1
+    assert prober.stats['probed'] == 2 * routed
+    prober.save()
+
+    # A third team reuses the per-sport record without a single probe
+    session.probed.clear()
+    session.pages.update(team_pages('hou', 'houston-rockets'))
+    crawler = SportsCrawler('nba', 'houston-rockets', 'hou', session=session)
+    reloaded = TemplateProber(min_probes=2, cache_path=cache_path)
+    assert reloaded.promote(crawler) == [f"{BASE}/nba/team/roster/_/name/hou/houston-rockets"]
+    assert session.probed == []
+    assert reloaded.stats['skipped'] == routed
+
+
+def test_league_crawl_credits_paying_templates(tmp_path):
+    cache_path = str(tmp_path / 'templates.json')
+    prober = TemplateProber(cache_path=cache_path)
+    session = FakeSession(team_pages('bos', 'boston-celtics'))
+    league_data = crawl_all_teams('nba', max_pages_per_team=2, teams=['boston-celtics'], confirm=False,
+                                  session=session, delay=0, output_dir=str(tmp_path), prober=prober)
+
+    assert league_data['total_players'] == 12
+    with open(cache_path) as f:
+        record = json.load(f)['nba']["{base}/{sport}/team/roster/_/name/{abbrev}/{team}"]
+    assert record == {'probes': 1, 'alive': 1, 'crawled': 1, 'paid': 1}
+
+
+def test_one_variant_per_page_type_and_season_calendars():
+    # Both roster variants are live: only one is promoted and the other seed is dropped
+    pages = team_pages('bos', 'boston-celtics')
+    pages[f"{BASE}/nba/team/_/name/bos/boston-celtics/roster"] = roster_page(12)
+    pages[f"{BASE}/nba/team/depth/_/name/bos/boston-celtics"] = '<p>depth</p>'
+    session = FakeSession(pages)
+    crawler = SportsCrawler('nba', 'boston-celtics', 'bos', session=session)
+    promoted = TemplateProber().promote(crawler)
+
+    assert promoted == [f"{BASE}/nba/team/roster/_/name/bos/boston-celtics"]
+    assert crawler.seed_urls == promoted + [f"{BASE}/nba/team/_/name/bos/boston-celtics"]
+    assert not any('/depth/' in url for url in session.probed)
+
+    crawler.crawl(max_pages=5, delay=0)
+    assert len(crawler.scraped_data['roster']) == 12
+
+    # Seasons spanning two years follow ESPN's labels, not the calendar year
+    october = datetime.date(2024, 10, 30)
+    assert current_season('nba', october) == 2025
+    assert current_season('nfl', datetime.date(2025, 1, 15)) == 2024
+    assert current_season('mlb', datetime.date(2025, 1, 15)) == 2024
+    assert current_season('mlb', october) == 2024
@@ -0,0 +1,176 @@
+"""
+Speculative seed URLs from ESPN URL templates
+Rather than finding the real roster/schedule/stats pages by BFS over several
+hops, expand the known ESPN URL variants for a team straight from templates,
+probe them in parallel with HEAD requests and promote the live ones to the
+front of the seed list. Template outcomes are cached per sport, so once a
+template is known to work (or not) later teams skip the probe
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from crawl_logging import get_logger
+from sports_data import current_season
+
+log = get_logger('templates')
+
+# Team page variants ESPN serves for every sport
+DEFAULT_TEMPLATES = [
+    "{base}/{sport}/team/roster/_/name/{abbrev}/{team}",
+    "{base}/{sport}/team/_/name/{abbrev}/{team}/roster",
+    "{base}/{sport}/team/schedule/_/name/{abbrev}/{team}",
+    "{base}/{sport}/team/_/name/{abbrev}/{team}/schedule",
+    "{base}/{sport}/team/schedule/_/name/{abbrev}/season/{season}",
+    "{base}/{sport}/team/stats/_/name/{abbrev}/{team}",
+    "{base}/{sport}/team/_/name/{abbrev}/{team}/stats",
+    "{base}/{sport}/team/news/_/name/{abbrev}/{team}",
+    "{base}/{sport}/team/depth/_/name/{abbrev}/{team}",
+]
+
+# Extra variants for particular sports
+SPORT_TEMPLATES = {
+    'nfl': ["{base}/{sport}/team/depth/_/name/{abbrev}/{team}/depth-chart"],
+    'mlb': ["{base}/{sport}/team/stats/_/name/{abbrev}/{team}/view/batting"],
+    'nhl': ["{base}/{sport}/team/stats/_/name/{abbrev}/{team}/view/skating"],
+}
+
+# Servers that don't do HEAD: can't tell from a probe, so keep the URL
+HEAD_UNSUPPORTED = {405, 501}
+
+
+class TemplateProber:
+    """
+    Expands per-sport URL templates for a team, probes them and promotes the live ones
+    min_probes: probes of a template (per sport) before its record is trusted
+    and the probe skipped; a template that was always live is promoted without
+    probing, one that was always dead is dropped
+    cache_path: optional JSON file for the per-sport template records
+    """
+
+    def __init__(self, templates=None, sport_templates=None, workers=8, timeout=5, min_probes=2,
+                 season=None, cache_path=None):
+        self.templates = list(templates or DEFAULT_TEMPLATES)
+        self.sport_templates = SPORT_TEMPLATES if sport_templates is None else sport_templates
+        self.workers = workers
+        self.timeout = timeout
+        self.min_probes = min_probes
+        self.season = season  # None: each sport's current season (sports_data.current_season)
+        self.cache_path = cache_path
+        self.cache = {}  # sport -> template -> {'probes', 'alive', 'crawled', 'paid'}
+        self.stats = {'probed': 0, 'skipped': 0, 'alive': 0, 'dead': 0}
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                self.cache = json.load(f)
+
+    def save(self):
+        """Write the per-sport template records (atomic)"""
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.cache, f, indent=2)
+        os.replace(tmp_path, self.cache_path)
+
+    def expand(self, crawler):
+        """[(template, url)] for a team, sport-specific variants last"""
+        values = {
+            'base': crawler.base_url,
+            'sport': crawler.sport,
+            'abbrev': crawler.team_abbrev,
+            'team': crawler.team_name,
+            'season': self.season or current_season(crawler.sport)
+        }
+        templates = self.templates + self.sport_templates.get(crawler.sport, [])
+        return [(template, template.format(**values)) for template in templates]
+
+    def _record(self, sport, template):
+        return self.cache.setdefault(sport, {}).setdefault(
+            template, {'probes': 0, 'alive': 0, 'crawled': 0, 'paid': 0})
+
+    def _known(self, record):
+        """True/False once a template's probes agree, None while it still needs probing"""
+        if record['probes'] < self.min_probes:
+            return None
+        if record['alive'] == record['probes']:
+            return True
+        if record['alive'] == 0:
+            return False
+        return None
+
+    def probe(self, crawler, url):
+        """Lightweight liveness check: HEAD, following redirects"""
+        if crawler.rate_limiter is not None:
+            crawler.rate_limiter.wait()
+        try:
+            response = crawler.session.head(url, headers=crawler.headers, timeout=self.timeout,
+                                            allow_redirects=True)
+        except requests.RequestException:
+            return False
+        return response.status_code < 400 or response.status_code in HEAD_UNSUPPORTED
+
+    def promote(self, crawler):
+        """
+        Probe the team's template URLs and rebuild its seed list: live template
+        URLs first (best-paying templates first), then the remaining seeds;
+        template URLs known to be dead are dropped. Only templates routed to an
+        extractor are probed, and only the best live URL per page type is
+        promoted, replacing the seeds of that type (variants of one page
+        would be scraped twice). Returns the promoted URLs
+        """
+        candidates = [(template, url) for template, url in self.expand(crawler)
+                      if crawler.extractors.route(url) is not None]
+        results = {}
+        to_probe = []
+        for template, url in candidates:
+            known = self._known(self._record(crawler.sport, template))
+            if known is None:
+                to_probe.append((template, url))
+            else:
+                results[template] = known
+                self.stats['skipped'] += 1
+
+        if to_probe:
+            with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+                outcomes = list(pool.map(lambda item: self.probe(crawler, item[1]), to_probe))
+            for (template, _), alive in zip(to_probe, outcomes):
+                record = self._record(crawler.sport, template)
+                record['probes'] += 1
+                record['alive'] += int(alive)
+                results[template] = alive
+                self.stats['probed'] += 1
+                self.stats['alive' if alive else 'dead'] += 1
+
+        def payoff(item):
+            record = self._record(crawler.sport, item[0])
+            return (record['paid'] + 1) / (record['crawled'] + 2)
+
+        live = sorted((item for item in candidates if results[item[0]]), key=payoff, reverse=True)
+        promoted = []
+        covered = set()
+        for _, url in live:
+            page_type = crawler._page_type(url)
+            if page_type not in covered:
+                covered.add(page_type)
+                promoted.append(url)
+        dead = {url for template, url in candidates if not results[template]}
+
+        seeds = list(promoted)
+        for url in crawler.seed_urls:
+            if url not in dead and url not in seeds and crawler._page_type(url) not in covered:
+                seeds.append(url)
+        crawler.seed_urls = seeds
+
+        log.info("🧪 %s: %d template URLs live, %d dead, %d probed", crawler.team_name, len(promoted),
+                 len(dead), len(to_probe), extra={'sport': crawler.sport, 'team': crawler.team_name})
+        return promoted
+
+    def record_yields(self, crawler):
+        """After a crawl, credit the templates whose URLs were crawled and yielded records"""
+        crawled = {page['url']: any(page['records'].values()) for page in crawler.page_log}
+        for template, url in self.expand(crawler):
+            if url in crawled:
+                record = self._record(crawler.sport, template)
+                record['crawled'] += 1
+                record['paid'] += int(crawled[url])